@@ -1,118 +1,16 @@
 import pandas as pd
 import numpy as np
-from scipy.interpolate import PchipInterpolator
+from track_profile import speed_integral
+from season_catalog import LAPS, load_season
+from race_frames import (RACE_CSV, RACE_FRAMES_DIR, frames_are_current, frames_from_table, load_race_frames,
+                         load_round_snapshots, mark_changed_from, save_race_frames, splice_race_csv)
 # =============================
 # CONFIG
 # =============================
 FPS = 30
 LAP_LENGTH_KM = 5.1837
-ROUND_TIME = 86.288 / 3   # seconds per round
-
-# =============================
-# SPEED PROFILES (Derived from Telemetry, Fastf1 & Tracinginsights)
-# Distance vs speed data
-
-# Zandvoort — 1st lap
-# 0m to 198m (0 to 222 km/h)
-# 198m to 342m (222 to 99 km/h)
-# 342m to 573m (99 to 237 km/h)
-# 573m to 679m (237 to 162 km/h)
-# 679m to 732m (162 to 177 km/h)
-# 732m to 819m (177 to 127 km/h)
-# 819m to 1145m (127 to 263 km/h)
-# 1145m to 1503m (263 to 280 km/h)
-
-# Zandvoort — Fastest lap
-# 0m to 122m (295 to 299 km/h)
-# 122m to 217m (299 to 295 km/h)
-# 217m to 373m (295 to 115 km/h)
-# 373m to 605m (115 to 240 km/h)
-# 605m to 704m (240 to 195 km/h)
-# 704m to 738m (195 to 203 km/h)
-# 738m to 834m (203 to 138 km/h)
-# 834m to 1195m (138 to 274 km/h)
-# 1195m to 1503m (274 to 280 km/h)
-
-# Yas Marina
-# 3090m to 3370m (280 to 301 km/h)
-# 3370m to 3520m (301 to 297 km/h)
-# 3520m to 3669m (297 to 167 km/h)
-# 3669m to 4053m (167 to 271 km/h)
-# 4053m to 4194m (271 to 270 km/h)
-# 4194m to 4324m (270 to 104 km/h)
-# 4324m to 4510m (104 to 164 km/h)
-# 4510m to 4558m (164 to 155 km/h)
-# 4558m to 4783m (155 to 270 km/h)
-# 4783m to 4896m (270 to 140 km/h)
-# 4896m to 5000m (140 to 167 km/h)
-
-# Miami
-# 3770m to 4688m (167 to 303 km/h)
-# 4688m to 4831m (303 to 70 km/h)
-# 4831m to 5412m (70 to 295 km/h)
-
-# Final F1 2025 circuit physics
-
-# Sector 1 (Zandvoort-style)
-# 0m to 122m (295 to 299 km/h)
-# 122m to 217m (299 to 295 km/h)
-# 217m to 373m (295 to 115 km/h)
-# 373m to 605m (115 to 240 km/h)
-# 605m to 704m (240 to 195 km/h)
-# 704m to 738m (195 to 203 km/h)
-# 738m to 834m (203 to 138 km/h)
-# 834m to 1195m (138 to 274 km/h)
-# 1195m to 1503m (274 to 280 km/h)
-
-# Transition
-# 1503m to 1580m (280 to 250 km/h)
-# 1580m to 1658m (250 to 280 km/h)
-
-# Sector 2 (Yas Marina-style)
-# 1658m to 1938m (280 to 301 km/h)
-# 1938m to 2088m (301 to 297 km/h)
-# 2088m to 2237m (297 to 167 km/h)
-# 2237m to 2621m (167 to 271 km/h)
-# 2621m to 2762m (271 to 270 km/h)
-# 2762m to 2892m (270 to 104 km/h)
-# 2892m to 3078m (104 to 164 km/h)
-# 3078m to 3126m (164 to 155 km/h)
-# 3126m to 3351m (155 to 270 km/h)
-# 3351m to 3438m (270 to 140 km/h)
-# 3438m to 3542m (140 to 167 km/h)
-
-# Sector 3 (Miami-style)
-# 3542m to 4460m (167 to 303 km/h)
-# 4460m to 4603m (303 to 70 km/h)
-# 4603m to 5183.7m (70 to 295 km/h)
-# =============================
-lap1_profile = np.array([
-    (0,0),(256,222),(403,99),(708,237),(808,162),(861,177),
-    (952,127),(1295,263),(1700,280),(2088,297),(2235,167),
-    (2568,268),(2740,267),(2848,104),(3000,164),(3100,154),
-    (3235,245),(3360,170),(4350,315),(4500,70),(5183.7,190)
-])
-
-lapN_profile = np.array([
-    (0,295),(297,288),(431,115),(740,240),(833,195),(877,303),
-    (964,138),(1322,270),(1700,280),(2088,297),(2235,167),
-    (2568,268),(2740,267),(2848,104),(3000,164),(3100,154),
-    (3235,245),(3360,170),(4350,315),(4500,70),(5183.7,190)
-])
-lap1_interp = PchipInterpolator(
-    lap1_profile[:, 0],
-    lap1_profile[:, 1]
-)
-
-lapN_interp = PchipInterpolator(
-    lapN_profile[:, 0],
-    lapN_profile[:, 1]
-)
-def speed_at(dist_m, lap):
-    if lap == 1:
-        return float(lap1_interp(dist_m))
-    else:
-        return float(lapN_interp(dist_m))
+ROUND_TIME = 86.288 / (load_season()["rounds"] / LAPS)   # seconds per round
+INCREMENTAL = True        # only re-interpolate from the first changed round
 
 # =============================
 # LOAD SNAPSHOT DATA
@@ -133,48 +31,76 @@ times_by_round = {
     for r in rounds
 }
 
-records = []
+# =============================
+# INCREMENTAL RESUME
+# =============================
+# A segment only depends on the snapshots at its two ends, so frames before
+# the segment leading into the first changed round are kept from the last run.
+frame_drivers = np.sort(drivers)               # column order of the binary frames
+round_km = np.array([snapshots[r][frame_drivers].to_numpy() for r in rounds])
+
+first_seg, keep_frames = 0, 0
+prev_round_km = load_round_snapshots() if INCREMENTAL and frames_are_current() else None
+if prev_round_km is not None:
+    prev_time, prev_drivers, _ = load_race_frames()
+    if prev_round_km.shape[1] == len(frame_drivers) and np.array_equal(prev_drivers, frame_drivers):
+        n = min(len(round_km), len(prev_round_km))
+        changed = np.nonzero((round_km[:n] != prev_round_km[:n]).any(axis=1))[0]
+        first_seg = min(max((changed[0] if len(changed) else n) - 1, 0), len(rounds) - 2)
+        keep_frames = int(np.searchsorted(prev_time, times_by_round[rounds[first_seg]]))
 
 # =============================
 # NORMAL INTERPOLATION (PRE-FINISH)
 # =============================
-for r in range(len(rounds) - 1):
-    r0, r1 = rounds[r], rounds[r+1]
-    d0 = snapshots[r0]
-    d1 = snapshots[r1]
-
-    t0 = times_by_round[r0]
-    t1 = times_by_round[r1]
-
-    times = np.arange(t0, t1, 1/FPS)
-
-    for d in drivers:
-        start_km = d0[d]
-        end_km   = d1[d]
-        delta_km = end_km - start_km
-
-        if abs(delta_km) < 1e-6:
-            for ti in times:
-                records.append([ti, d, start_km])
-            continue
-
-        lap = int(start_km // LAP_LENGTH_KM) + 1
-
-        SAMPLES = 300
-        meters = np.linspace(0, abs(delta_km) * 1000, SAMPLES)
-        speeds = np.array([
-            speed_at((start_km*1000 + m) % (LAP_LENGTH_KM*1000), lap)
-            for m in meters
-        ])
-
-        weights = speeds / speeds.sum()
-        cum = np.cumsum(weights)
-
-        for i, ti in enumerate(times):
-            frac = i / (len(times) - 1)
-            idx = np.searchsorted(cum, frac)
-            progressed = delta_km * cum[min(idx, len(cum)-1)]
-            records.append([ti, d, start_km + progressed])
+# Every (round, driver) segment is one row; rows are round-major so a
+# round's drivers sit next to each other.
+SAMPLES = 300
+
+seg_rounds = list(zip(rounds[:-1], rounds[1:]))[first_seg:]
+n_drivers = len(drivers)
+
+start_km = np.concatenate([snapshots[r0][drivers].to_numpy() for r0, _ in seg_rounds])
+end_km = np.concatenate([snapshots[r1][drivers].to_numpy() for _, r1 in seg_rounds])
+delta_km = end_km - start_km
+stationary = np.abs(delta_km) < 1e-6
+
+# Progress weights for all segments at once: [segments, SAMPLES].
+# Each sample weighs its speed over the cell around it, which the speed
+# integral table gives as two reads and a subtraction.
+lap = (start_km // LAP_LENGTH_KM).astype(int) + 1
+meters = np.linspace(0, np.abs(delta_km) * 1000, SAMPLES, axis=1)
+half_cell = np.abs(delta_km)[:, None] * 1000 / (SAMPLES - 1) / 2
+start_m = start_km[:, None] * 1000
+covered = (
+    speed_integral(start_m + meters + half_cell, lap[:, None])
+    - speed_integral(start_m - half_cell, lap[:, None])
+)
+covered[stationary] = 1.0   # never read, keeps the division finite
+cum = covered / covered[:, -1:]
+
+# Frame clock per round, tiled across that round's drivers
+round_times = [
+    np.arange(times_by_round[r0], times_by_round[r1], 1/FPS)
+    for r0, r1 in seg_rounds
+]
+seg_frames = np.repeat([len(t) for t in round_times], n_drivers)
+seg = np.repeat(np.arange(len(seg_frames)), seg_frames)
+frame_idx = np.arange(len(seg)) - np.repeat(np.cumsum(seg_frames) - seg_frames, seg_frames)
+frac = frame_idx / (seg_frames[seg] - 1)
+
+# One searchsorted for every frame of every segment. Complex numbers sort
+# by real part first, so the segment number keeps the rows apart while
+# fractions are still compared exactly in the imaginary part.
+keys = (np.arange(len(seg_frames))[:, None] + 1j*cum).ravel()
+idx = np.searchsorted(keys, seg + 1j*frac) - seg*SAMPLES
+idx = np.minimum(idx, SAMPLES - 1)
+
+progressed = delta_km[seg] * cum[seg, idx]
+pre_finish = pd.DataFrame({
+    "time_sec": np.concatenate([np.tile(t, n_drivers) for t in round_times]),
+    "driver": np.repeat(np.tile(drivers, len(seg_rounds)), seg_frames),
+    "distance_km": np.where(stationary[seg], start_km[seg], start_km[seg] + progressed),
+})
 
 # =============================
 # POST-FINISH (CORRECT LOGIC)
@@ -201,28 +127,36 @@ extra_time = max_gap / leader_speed
 end_time = finish_time + extra_time
 
 times = np.arange(finish_time, end_time, 1/FPS)
+leader_dist = leader_finish_dist + leader_speed * (times - finish_time)
+gap_km = np.array([gaps[d] for d in drivers])
 
-for i, ti in enumerate(times):
-    leader_dist = leader_finish_dist + leader_speed * (ti - finish_time)
-
-    for d in drivers:
-        records.append([
-            ti,
-            d,
-            leader_dist - gaps[d]
-        ])
+post_finish = pd.DataFrame({
+    "time_sec": np.repeat(times, n_drivers),
+    "driver": np.tile(drivers, len(times)),
+    "distance_km": (leader_dist[:, None] - gap_km).ravel(),
+})
 
 # =============================
 # SAVE
 # =============================
-interp = pd.DataFrame(
-    records,
-    columns=["time_sec","driver","distance_km"]
-)
+interp = pd.concat([pre_finish, post_finish], ignore_index=True)
 
 interp = interp.sort_values(["time_sec","driver"])
-interp.to_csv("race_time_interpolated.csv", index=False)
+time_sec, frame_drivers, distance_km = frames_from_table(interp)
+
+if keep_frames > 0:
+    # Splice behind the unchanged frames of the last run
+    prev_time, _, prev_km = load_race_frames(mmap_mode=None)
+    time_sec = np.concatenate([prev_time[:keep_frames], time_sec])
+    distance_km = np.vstack([prev_km[:keep_frames], distance_km])
+    splice_race_csv(interp, keep_frames * n_drivers)
+    print(f"✔ Frames before {time_sec[keep_frames]:.2f}s unchanged, interpolated from round {rounds[first_seg]}")
+else:
+    interp.to_csv(RACE_CSV, index=False)
+save_race_frames(time_sec, frame_drivers, distance_km, round_km)
+mark_changed_from(keep_frames)
 
 print("✔ Correct finish-line physics applied")
 print(f"✔ Race ends at {end_time:.2f}s")
-print(f"✔ Total frames: {len(interp)}")
\ No newline at end of file
+print(f"✔ Total frames: {distance_km.size}")
+print(f"✔ Binary frames saved to: {RACE_FRAMES_DIR}/")
\ No newline at end of file
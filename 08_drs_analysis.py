@@ -1,83 +1,102 @@
+import os
 import pandas as pd
 import numpy as np
+from race_frames import changed_from, clear_changed_from, load_race_frames, running_order
+from season_catalog import LAPS
 
 # =============================
 # CONFIG
 # =============================
 LAP_LEN_M = 5183.7
-TOTAL_RACE_M = LAP_LEN_M * 8  # 41469.6m
+TOTAL_RACE_M = LAP_LEN_M * LAPS  # 41469.6m
 GAP_FACTOR = 16.646  # Calibration factor
 DP1 = 3510
 DP2 = 4550
+LOG_PATH = "drs_eligibility_log.csv"
+INCREMENTAL = True  # only rescan frames that 07 changed since the last run
 
 # =============================
 # PROCESS DATA
 # =============================
-# Load the smooth interpolation file
-df = pd.read_csv("race_time_interpolated.csv")
-df = df.sort_values(["time_sec", "distance_km"], ascending=[True, False])
+# Load the smooth interpolation frames: [frames, drivers]
+time_sec, drivers, distance_km = load_race_frames()
 
-drivers = df['driver'].unique()
-driver_state = {d: {'prev_m': 0} for d in drivers}
-drs_results = []
+# Events come from pairs of consecutive frames, so the scan resumes one frame
+# before the first changed frame and earlier events are kept from the last log
+first = (changed_from() or 0) if INCREMENTAL and os.path.exists(LOG_PATH) else 0
+lo = max(first - 1, 0)
+time_sec = np.asarray(time_sec[lo:])
+dist_km = np.asarray(distance_km[lo:], dtype=float)
+dist_m = dist_km * 1000
+lap_m = dist_m % LAP_LEN_M
+lap_num = (dist_m // LAP_LEN_M).astype(int) + 1
 
 print("Analyzing DRS Detection Points...")
 
-# Group by time to handle gaps between cars correctly
-for ti, frame in df.groupby('time_sec'):
-    sorted_drivers = frame['driver'].tolist()
-    
-    for rank, d in enumerate(sorted_drivers):
-        dist_km = frame.loc[frame['driver'] == d, 'distance_km'].values[0]
-        dist_m = dist_km * 1000
-        lap_m = dist_m % LAP_LEN_M
-        lap_num = int(dist_m // LAP_LEN_M) + 1
-        
-        if dist_m >= TOTAL_RACE_M:
-            driver_state[d]['prev_m'] = lap_m
-            continue
-        # Check if they crossed a DP this frame
-        crossed_dp1 = (driver_state[d]['prev_m'] < DP1 <= lap_m)
-        crossed_dp2 = (driver_state[d]['prev_m'] < DP2 <= lap_m)
-        
-        # Logic starts after Lap 1
-        if lap_num > 1 and (crossed_dp1 or crossed_dp2):
-            point_name = "DP1 (3510m)" if crossed_dp1 else "DP2 (4550m)"
-            
-            status = "DENIED"
-            gap_s = 0.0
-            
-            if rank > 0: # If there is a car ahead
-                driver_ahead = sorted_drivers[rank-1]
-                dist_ahead = frame.loc[frame['driver'] == driver_ahead, 'distance_km'].values[0]
-                gap_s = (dist_ahead - dist_km) * GAP_FACTOR
-                
-                if gap_s <= 1.0:
-                    status = "ELIGIBLE"
-            
-            # Log the result
-            drs_results.append({
-                "time_sec": ti,
-                "lap": lap_num,
-                "driver": d,
-                "detection_point": point_name,
-                "gap_to_ahead": round(gap_s, 3),
-                "status": status
-            })
-            
-            # Optional: Print to console for immediate check
-            if status == "ELIGIBLE":
-                print(f"Time {ti:.2f}s | Lap {lap_num} | {d} -> {status} at {point_name} (Gap: {gap_s:.3f}s)")
+# Lap position one frame earlier (every car starts from 0; a resumed
+# scan's first frame is only the "before" side of the first pair)
+prev_m = np.vstack([np.zeros((1, len(drivers))) if lo == 0 else lap_m[:1], lap_m[:-1]])
+prev_km = np.vstack([dist_km[:1], dist_km[:-1]])
+prev_t = np.concatenate([time_sec[:1], time_sec[:-1]])
 
-        # Update persistent state
-        driver_state[d]['prev_m'] = lap_m
+# One event per car and detection point crossed between two frames.
+# The crossing instant is solved inside the bracketing frames, so the
+# result does not depend on the frame rate of the interpolation.
+events = []
+for dp, point_name in [(DP1, "DP1 (3510m)"), (DP2, "DP2 (4550m)")]:
+    crossed = (prev_m < dp) & (dp <= lap_m)
+    frame_idx, driver_idx = np.nonzero(crossed)
+    s = (dp - prev_m[frame_idx, driver_idx]) / (lap_m[frame_idx, driver_idx] - prev_m[frame_idx, driver_idx])
+    events.append(pd.DataFrame({
+        "frame": frame_idx,
+        "driver_idx": driver_idx,
+        "s": s,
+        "time_sec": prev_t[frame_idx] + s * (time_sec[frame_idx] - prev_t[frame_idx]),
+        "detection_point": point_name
+    }))
+events = pd.concat(events, ignore_index=True)
+
+# Whole field at the crossing instant (linear between the two frames)
+f, i, s = events["frame"].to_numpy(), events["driver_idx"].to_numpy(), events["s"].to_numpy()
+field_km = prev_km[f] + s[:, None] * (dist_km[f] - prev_km[f])
+car_m = field_km[np.arange(len(events)), i] * 1000
+events["lap"] = (car_m // LAP_LEN_M).astype(int) + 1
+
+# Logic starts after Lap 1, finished cars are ignored
+events = events[(events["lap"].to_numpy() > 1) & (car_m < TOTAL_RACE_M)]
+keep = events.index.to_numpy()
+field_km, i = field_km[keep], i[keep]
+
+# Gap to the car ahead in the running order at that instant
+order = running_order(field_km)
+rank = np.argsort(order, axis=1)[np.arange(len(i)), i]
+ahead_km = field_km[np.arange(len(i)), order[np.arange(len(i)), np.maximum(rank - 1, 0)]]
+gap_s = np.where(rank > 0, (ahead_km - field_km[np.arange(len(i)), i]) * GAP_FACTOR, 0.0)
+eligible = (rank > 0) & (gap_s <= 1.0)
+
+output = pd.DataFrame({
+    "time_sec": events["time_sec"].to_numpy(),
+    "lap": events["lap"].to_numpy(),
+    "driver": drivers[i],
+    "detection_point": events["detection_point"].to_numpy(),
+    "gap_to_ahead": np.round(gap_s, 3),
+    "status": np.where(eligible, "ELIGIBLE", "DENIED")
+})
+if lo > 0:
+    kept = pd.read_csv(LOG_PATH, float_precision="round_trip")
+    output = pd.concat([kept[kept["time_sec"] <= time_sec[0]], output], ignore_index=True)
+    print(f"✔ Events before {time_sec[0]:.2f}s kept from {LOG_PATH}")
+output = output.sort_values("time_sec", kind="stable", ignore_index=True)
+
+for row in output[output["status"] == "ELIGIBLE"].itertuples():
+    print(f"Time {row.time_sec:.3f}s | Lap {row.lap} | {row.driver} -> {row.status} at {row.detection_point} (Gap: {row.gap_to_ahead:.3f}s)")
 
 # =============================
 # SAVE RESULTS
 # =============================
-output = pd.DataFrame(drs_results)
-output.to_csv("drs_eligibility_log.csv", index=False)
+output.to_csv(LOG_PATH, index=False)
+clear_changed_from()
 
 print("\n✔ Analysis Complete.")
 print(f"✔ Found {len(output[output['status'] == 'ELIGIBLE'])} DRS activations.")
-print("✔ Log saved to: drs_eligibility_log.csv")
\ No newline at end of file
+print(f"✔ Log saved to: {LOG_PATH}")
\ No newline at end of file
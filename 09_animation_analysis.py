@@ -1,3 +1,4 @@
+import os
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -6,17 +7,19 @@ import matplotlib.colors as mcolors
 from matplotlib.collections import LineCollection
 from matplotlib.patches import Circle, FancyBboxPatch, Rectangle
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
-from PIL import Image, ImageDraw
+from asset_cache import create_circular_logo, load_car_image, load_driver_photo
+from race_frames import load_race_frames, running_order
+from season_catalog import LAPS, load_season, points_table
 
 # =============================
 # GLOBAL DATA LOADING
 # =============================
-race = pd.read_csv("race_time_interpolated.csv")
+race_time_sec, drivers, race_distance_km = load_race_frames()
 track = pd.read_csv("track_waypoints.csv")
 
 # Timing setup
 TARGET_UI_FPS = 30
-unique_times = np.sort(race["time_sec"].unique())
+unique_times = np.asarray(race_time_sec)
 total_race_sec = unique_times.max() - unique_times.min()
 actual_data_fps = len(unique_times) / total_race_sec
 SKIP_VAL = max(1, int(actual_data_fps / TARGET_UI_FPS))
@@ -25,14 +28,17 @@ PRE_RACE_STAY_SEC = 7
 pre_race_frames = PRE_RACE_STAY_SEC * TARGET_UI_FPS
 race_times = unique_times[::SKIP_VAL]
 times = np.concatenate([np.full(pre_race_frames, race_times[0]), race_times])
-race_dict = {t: df for t, df in race.groupby("time_sec")}
+race_row = {t: i for i, t in enumerate(unique_times)}
+race_order = running_order(race_distance_km)
 
-drivers = race["driver"].unique()
 TRUE_LEN = 5183.7
 TIME = 86.288
-ROUND_TIME = TIME / 3
-TOTAL_RACE_DIST = (TRUE_LEN * 8) / 1000
-ROUND_DIST = TRUE_LEN / 3
+SEASON = load_season()
+ROUNDS = SEASON["rounds"]
+ROUNDS_PER_LAP = ROUNDS / LAPS
+ROUND_TIME = TIME / ROUNDS_PER_LAP
+TOTAL_RACE_DIST = (TRUE_LEN * LAPS) / 1000
+ROUND_DIST = TRUE_LEN / ROUNDS_PER_LAP
 SURNAME_MAP = {d.split()[-1].upper(): d for d in drivers}
 
 # Track setup
@@ -43,8 +49,7 @@ dists = np.sqrt(np.sum(np.diff(points, axis=0)**2, axis=1))
 cum_dist_raw = np.insert(np.cumsum(dists), 0, 0)
 cum_dist = (cum_dist_raw / cum_dist_raw[-1]) * TRUE_LEN
 
-TOTAL_LAPS = 8
-RACE_COMPLETION_KM = (TRUE_LEN * TOTAL_LAPS) / 1000
+RACE_COMPLETION_KM = (TRUE_LEN * LAPS) / 1000
 INSTANT_VANISH_KM = RACE_COMPLETION_KM + (400 / 1000)
 
 dx = np.gradient(x_coords)
@@ -60,46 +65,16 @@ sec3_m = cum_dist[:-1] >= 2 * TRUE_LEN / 3
 # =============================
 # SHARED DATA
 # =============================
-# Name codes (3-letter codes)
-NAME_CODES = {
-    "Verstappen": "VER", "Lando Norris": "NOR", "Charles Leclerc": "LEC",
-    "Oscar Piastri": "PIA", "Sainz": "SAI", "George Russell": "RUS",
-    "Lewis Hamilton": "HAM", "Alonso": "ALO", "Gasly": "GAS",
-    "Hulkenberg": "HUL", "Yuki": "TSU", "Stroll": "STR",
-    "Ocon": "OCO", "Albon": "ALB", "Bearman": "BEA",
-    "Colapinto": "COL", "Lawson": "LAW", "Bortoleto": "BOR",
-    "Hadjar": "HAD", "Antonelli": "ANT"
-}
+# Teams, colours, name codes, GP titles and featured drivers come from the season catalog,
+# which fills in whatever a season leaves out
+NAME_CODES = SEASON["name_codes"]
 
-# Add PRE-RACE TEAM DATA (2024 season final standings)
-PRE_RACE_TEAM_DATA = {
-    "McLaren": {"points": 666, "wins": 6, "podiums": 21},
-    "Ferrari": {"points": 652, "wins": 5, "podiums": 22},
-    "Red Bull": {"points": 589, "wins": 9, "podiums": 18},
-    "Mercedes": {"points": 468, "wins": 4, "podiums": 9},
-    "Aston Martin": {"points": 94, "wins": 0, "podiums": 0},
-    "Alpine": {"points": 65, "wins": 0, "podiums": 2},
-    "Haas": {"points": 58, "wins": 0, "podiums": 0},
-    "Racing Bulls": {"points": 46, "wins": 0, "podiums": 0},
-    "Williams": {"points": 17, "wins": 0, "podiums": 0},
-    "Sauber": {"points": 4, "wins": 0, "podiums": 0}
-}
+# Constructors board before the start: previous season's (points, wins, podiums), in standings order
+PRE_RACE_TEAM_DATA = SEASON["team_grid"]
+PRE_RACE_TEAM_ORDER = list(PRE_RACE_TEAM_DATA)
 
-# Pre-race team order (by 2024 final standings)
-PRE_RACE_TEAM_ORDER = [
-    "McLaren", "Ferrari", "Red Bull", "Mercedes", "Aston Martin",
-    "Alpine", "Haas", "Racing Bulls", "Williams", "Sauber"
-]
-
-GRID_DATA = {
-    "Verstappen": (437, "F1-24"), "Lando Norris": (374, "F1-24"), "Charles Leclerc": (356, "F1-24"),
-    "Oscar Piastri": (292, "F1-24"), "Sainz": (290, "F1-24"), "George Russell": (245, "F1-24"),
-    "Lewis Hamilton": (223, "F1-24"), "Alonso": (70, "F1-24"), "Gasly": (42, "F1-24"),
-    "Hulkenberg": (41, "F1-24"), "Yuki": (30, "F1-24"), "Stroll": (24, "F1-24"),
-    "Ocon": (23, "F1-24"), "Albon": (12, "F1-24"), "Bearman": (7, "F1-24"),
-    "Colapinto": (5, "F1-24"), "Lawson": (4, "F1-24"), "Bortoleto": (214.5, "F2-24"),
-    "Hadjar": (192, "F2-24"), "Antonelli": (113, "F2-24")
-}
+GRID_DATA = SEASON["grid"]
+GRID_ORDER = np.array([list(drivers).index(d) for d in GRID_DATA])
 
 # DRS CONFIG
 DP1 = 3510
@@ -107,116 +82,46 @@ DP2 = 4550
 DRS_ZONE_1 = (3660, 4450)
 DRS_ZONE_2_START = (4880, 5183.7)
 DRS_ZONE_2_END = (0, 355)
+# The season's hand-checked DRS log (catalog "drs_log") when it has one, else 08_drs_analysis.py's log
+DRS_LOG_PATH = SEASON.get("drs_log", "drs_eligibility_log.csv")
+if not os.path.exists(DRS_LOG_PATH):
+    DRS_LOG_PATH = "drs_eligibility_log.csv"
+
+# Compiled DRS index: DRS_ACTIVE[driver, lap, zone] is True when the log made the driver
+# ELIGIBLE for zone 1 (DP1) or zone 2 (DP2) on that lap. Drivers follow the race file order and
+# the last lap row stays False, so laps outside the log read False.
+def compile_drs_index(log):
+    eligible = log[log['status'] == 'ELIGIBLE']
+    driver_idx = pd.Index(drivers).get_indexer(eligible['driver'])
+    known = driver_idx >= 0
+    lap = eligible['lap'].to_numpy()
+    zone = np.where(eligible['detection_point'].str.contains("DP1"), 1, 2)
+    index = np.zeros((len(drivers), lap.max(initial=0) + 2, 3), dtype=bool)
+    index[driver_idx[known], lap[known], zone[known]] = True
+    return index
 
-# Load DRS eligibility log and create a simple lookup
 try:
-    drs_log = pd.read_csv("drs_eligibility_logfixed.csv")
-    drs_enabled = {}
-    
-    for _, row in drs_log.iterrows():
-        if row['status'] != 'ELIGIBLE':
-            continue
-            
-        driver = row['driver']
-        lap = row['lap']
-        zone = 1 if "DP1" in row['detection_point'] else 2
-        
-        if driver not in drs_enabled:
-            drs_enabled[driver] = {}
-        if lap not in drs_enabled[driver]:
-            drs_enabled[driver][lap] = {}
-        
-        drs_enabled[driver][lap][zone] = True
-    
+    drs_log = pd.read_csv(DRS_LOG_PATH)
+    DRS_ACTIVE = compile_drs_index(drs_log)
     print(f"✔ DRS log loaded: {len(drs_log[drs_log['status']=='ELIGIBLE'])} eligible activations")
 except Exception as e:
-    drs_enabled = {}
+    DRS_ACTIVE = np.zeros((len(drivers), 1, 3), dtype=bool)
     print(f"⚠ Warning: Could not load DRS data: {e}")
 
-POINTS_DATA = {
-    "Lando Norris": (25,44,62,77,89,115,133,158,176,176,201,226,250,275,275,293,299,314,332,357,390,390,408,423),
-    "Verstappen": (18,36,61,69,87,99,124,136,137,155,155,165,185,187,205,230,255,273,306,321,341,366,396,421),
-    "Oscar Piastri": (2,34,49,74,99,131,146,161,186,198,216,234,266,284,309,324,324,336,346,356,366,366,392,410),
-    "George Russell": (15,35,45,63,73,93,99,99,111,136,146,147,157,172,184,194,212,237,252,258,276,294,309,319),
-    "Charles Leclerc": (4,8,20,32,47,53,61,79,94,104,119,119,139,151,151,163,165,173,192,210,214,226,230,242),
-    "Lewis Hamilton": (1,9,15,25,31,41,53,63,71,79,91,103,109,109,109,117,121,125,142,146,148,152,152,156),
-    "Antonelli": (12,22,30,30,38,48,48,48,48,63,63,63,63,64,64,66,78,88,89,97,122,137,150,150),
-    "Albon": (10,16,18,18,20,30,40,42,42,42,42,46,54,54,64,70,70,70,73,73,73,73,73,73),
-    "Sainz": (0,1,1,1,5,7,11,12,12,13,13,13,16,16,16,16,31,32,38,38,38,48,64,64),
-    "Alonso": (0,0,0,0,0,0,0,0,2,8,14,16,16,26,30,30,30,36,37,37,40,40,48,56),
-    "Hulkenberg": (6,6,6,6,6,6,6,6,16,20,22,37,37,37,37,37,37,37,41,41,43,49,49,51),
-    "Hadjar": (0,0,4,4,5,5,7,15,21,21,21,21,22,22,35,36,37,37,37,37,41,49,49,51),
-    "Bearman": (0,4,5,6,6,6,6,6,6,6,6,6,8,8,16,16,16,18,20,32,40,41,41,41),
-    "Lawson": (0,0,0,0,0,0,0,4,4,4,12,12,16,20,20,20,30,30,30,30,36,36,38,38),
-    "Ocon": (0,10,10,14,14,14,14,20,20,22,23,23,27,27,28,28,28,28,28,30,30,32,32,38),
-    "Stroll": (8,10,10,10,10,14,14,14,14,14,14,20,20,26,32,32,32,32,32,32,32,32,32,33),
-    "Yuki": (0,3,3,5,5,9,10,10,10,10,10,10,10,10,12,12,20,20,28,28,28,28,33,33),
-    "Gasly": (0,0,0,6,6,7,7,7,11,11,11,19,20,20,20,20,20,20,20,20,22,22,22,22),
-    "Bortoleto": (0,0,0,0,0,0,0,0,0,0,4,4,6,14,14,18,18,18,18,19,19,19,19,19),
-    "Colapinto": (0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0),
-}
-
-HISTORICAL_PODIUMS = {
-    1: ["NORRIS", "VERSTAPPEN", "RUSSELL"], 2: ["PIASTRI", "NORRIS", "RUSSELL"],
-    3: ["VERSTAPPEN", "NORRIS", "PIASTRI"], 4: ["PIASTRI", "NORRIS", "RUSSELL"],
-    5: ["PIASTRI", "VERSTAPPEN", "LECLERC"], 6: ["PIASTRI", "NORRIS", "RUSSELL"],
-    7: ["VERSTAPPEN", "NORRIS", "PIASTRI"], 8: ["NORRIS", "LECLERC", "PIASTRI"],
-    9: ["PIASTRI", "NORRIS", "LECLERC"], 10: ["RUSSELL", "VERSTAPPEN", "ANTONELLI"],
-    11: ["NORRIS", "PIASTRI", "LECLERC"], 12: ["NORRIS", "PIASTRI", "HULKENBERG"],
-    13: ["PIASTRI", "NORRIS", "LECLERC"], 14: ["NORRIS", "PIASTRI", "RUSSELL"],
-    15: ["PIASTRI", "VERSTAPPEN", "HADJAR"], 16: ["VERSTAPPEN", "NORRIS", "PIASTRI"],
-    17: ["VERSTAPPEN", "RUSSELL", "SAINZ"], 18: ["RUSSELL", "VERSTAPPEN", "NORRIS"],
-    19: ["VERSTAPPEN", "NORRIS", "LECLERC"], 20: ["NORRIS", "LECLERC", "VERSTAPPEN"],
-    21: ["NORRIS", "ANTONELLI", "VERSTAPPEN"], 22: ["VERSTAPPEN", "RUSSELL", "ANTONELLI"],
-    23: ["VERSTAPPEN", "PIASTRI", "SAINZ"], 24: ["VERSTAPPEN", "PIASTRI", "NORRIS"]
-}
+# Same points as a [drivers, rounds] matrix in race file driver order (no data: 0 points).
+# Column 0 is the pre-season zero, so column r holds the total after round r; a season whose
+# points stop early keeps each driver's last total up to the last round.
+POINTS_MATRIX = points_table(SEASON, drivers)
 
-COLORS = {
-    "Verstappen": "#3671C6", "Lando Norris": "#FF8700", "Charles Leclerc": "#E8002D",
-    "Oscar Piastri": "#FF8700", "Sainz": "#005AFF", "George Russell": "#27F4D2",
-    "Lewis Hamilton": "#E8002D", "Antonelli": "#27F4D2", "Albon": "#005AFF",
-    "Alonso": "#229971", "Gasly": "#0090FF", "Hulkenberg": "#2DFF00",
-    "Yuki": "#3671C6", "Stroll": "#229971", "Ocon": "#BDC3C7", "Bearman": "#BDC3C7",
-    "Colapinto": "#0090FF", "Lawson": "#6692FF", "Bortoleto": "#2DFF00", "Hadjar": "#6692FF"
-}
-
-TEAM_MAP = {
-    "Verstappen": "Red Bull", "Yuki": "Red Bull",
-    "Lando Norris": "McLaren", "Oscar Piastri": "McLaren",
-    "Charles Leclerc": "Ferrari", "Lewis Hamilton": "Ferrari",
-    "George Russell": "Mercedes", "Antonelli": "Mercedes",
-    "Sainz": "Williams", "Albon": "Williams",
-    "Alonso": "Aston Martin", "Stroll": "Aston Martin",
-    "Gasly": "Alpine", "Colapinto": "Alpine",
-    "Ocon": "Haas", "Bearman": "Haas",
-    "Lawson": "Racing Bulls", "Hadjar": "Racing Bulls",
-    "Bortoleto": "Sauber", "Hulkenberg": "Sauber"
-}
-
-DRIVER_TO_TEAM = {
-    "VERSTAPPEN": "Red Bull", "YUKI": "Red Bull",
-    "NORRIS": "McLaren", "PIASTRI": "McLaren",
-    "LECLERC": "Ferrari", "HAMILTON": "Ferrari",
-    "RUSSELL": "Mercedes", "ANTONELLI": "Mercedes",
-    "SAINZ": "Williams", "ALBON": "Williams",
-    "ALONSO": "Aston Martin", "STROLL": "Aston Martin",
-    "GASLY": "Alpine", "COLAPINTO": "Alpine",
-    "OCON": "Haas", "BEARMAN": "Haas",
-    "LAWSON": "Racing Bulls", "HADJAR": "Racing Bulls",
-    "BORTOLETO": "Sauber", "HULKENBERG": "Sauber"
-}
-
-TEAM_COLORS = {
-    "Red Bull": "#3671C6", "McLaren": "#FF8700", "Ferrari": "#E8002D",
-    "Mercedes": "#27F4D2", "Williams": "#64C4FF", "Aston Martin": "#229971",
-    "Alpine": "#0093CC", "Haas": "#B6BABD", "Racing Bulls": "#6692FF", "Sauber": "#52E252"
-}
+HISTORICAL_PODIUMS = SEASON["podiums"]
 
-INITIAL_TEAM_ORDER = [
-    "McLaren", "Ferrari", "Red Bull", "Mercedes", "Aston Martin", 
-    "Alpine", "Haas", "Racing Bulls", "Williams", "Sauber"
-]
+COLORS = SEASON["driver_colors"]
+TEAM_MAP = SEASON["teams"]
+DRIVER_TO_TEAM = {d.split()[-1].upper(): team for d, team in TEAM_MAP.items()}
+TEAM_COLORS = SEASON["team_colors"]
+INITIAL_TEAM_ORDER = PRE_RACE_TEAM_ORDER
 
+# Artwork in the repo; teams and drivers without a file get a placeholder
 LOGO_PATHS = {
     "Red Bull": "logos/redbull.jpg", "McLaren": "logos/mclaren.jpg", "Ferrari": "logos/ferrari.jpg",
     "Mercedes": "logos/mercedes.jpg", "Williams": "logos/williams.jpg", "Aston Martin": "logos/astonmartin.jpg",
@@ -233,25 +138,13 @@ CAR_PATHS = {
     "George Russell": "cars/mercedes_car.png"
 }
 
-DRIVER_NAME_MAP = {
-    "Lando Norris": "NORRIS", "Verstappen": "VERSTAPPEN", "Oscar Piastri": "PIASTRI",
-    "Charles Leclerc": "LECLERC", "George Russell": "RUSSELL"
-}
-
-TOP_DRIVERS = ["Lando Norris", "Verstappen", "Oscar Piastri", "Charles Leclerc", "George Russell"]
+TOP_DRIVERS = SEASON["featured"]
+DRIVER_NAME_MAP = {d: d.split()[-1].upper() for d in TOP_DRIVERS}
 DRIVER_TEAMS = {d: TEAM_MAP[d] for d in TOP_DRIVERS}
 
-POINTS_ADJUSTMENT = {"Red Bull": -3, "Racing Bulls": +3}
-MAX_SEASON_POINTS = 423
+TEAM_ADJUSTMENTS = SEASON["team_adjustments"]   # {round: {team: points}} while that round runs
 
-GP_NAMES = {
-    1: "AUSTRALIAN GRAND PRIX", 2: "CHINESE GRAND PRIX & SPRINT", 3: "JAPANESE GRAND PRIX", 4: "BAHRAIN GRAND PRIX",
-    5: "SAUDI ARABIAN GRAND PRIX", 6: "MIAMI GRAND PRIX & SPRINT", 7: "EMILIA ROMAGNA GRAND PRIX", 8: "MONACO GRAND PRIX",
-    9: "SPANISH GRAND PRIX", 10: "CANADIAN GRAND PRIX", 11: "AUSTRIAN GRAND PRIX", 12: "BRITISH GRAND PRIX",
-    13: "BELGIAN GRAND PRIX & SPRINT", 14: "HUNGARIAN GRAND PRIX", 15: "DUTCH GRAND PRIX", 16: "ITALIAN GRAND PRIX",
-    17: "AZERBAIJAN GRAND PRIX", 18: "SINGAPORE GRAND PRIX", 19: "UNITED STATES GRAND PRIX & SPRINT", 20: "MEXICAN GRAND PRIX",
-    21: "BRAZILIAN GRAND PRIX & SPRINT", 22: "LAS VEGAS GRAND PRIX", 23: "QATAR GRAND PRIX & SPRINT", 24: "ABU DHABI GRAND PRIX"
-}
+GP_NAMES = SEASON["gp_names"]
 
 CORNERS = [(412, 1), (780, -1), (935, 1), (1205, -1), (1400, -1), (1590, 1), (2266, -1), (2600, -1), 
            (2720, -1), (2835, 1), (2940, -1), (3045, -1), (3300, -1), (3420, 1), (4477, 1), (4650, 1), (4880, 1)]
@@ -261,15 +154,17 @@ DRS_POINTS = [3510, 4550]
 # =============================
 # HELPER FUNCTIONS
 # =============================
-def get_pts(driver_name, time):
-    pts_tuple = POINTS_DATA.get(driver_name)
-    if not pts_tuple: return 0
-    raw_rnd = time / ROUND_TIME
-    idx = int(raw_rnd)
+def get_all_pts(time):
+    """Interpolated points of every driver at a time (scalar -> [drivers], array -> [times, drivers])."""
+    raw_rnd = np.asarray(time, dtype=float) / ROUND_TIME
+    idx = np.trunc(raw_rnd).astype(int)
     frac = raw_rnd - idx
-    if idx >= 23: return pts_tuple[23]
-    p_start = pts_tuple[idx-1] if idx > 0 else 0
-    return p_start + (pts_tuple[idx] - p_start) * frac
+    season_over = idx >= ROUNDS - 1
+    idx = np.where(season_over, ROUNDS, np.maximum(idx, 0))
+    frac = np.where(season_over, 0.0, frac)
+    p_start = POINTS_MATRIX[:, idx]
+    p_end = POINTS_MATRIX[:, np.minimum(idx + 1, ROUNDS)]
+    return (p_start + (p_end - p_start) * frac).T
 
 def get_historical_stats(completed_rounds):
     stats = {d.upper(): {'wins': 0, 'pods': 0} for d in SURNAME_MAP}
@@ -322,33 +217,6 @@ def get_text_color(hex_color):
     brightness = (rgb[0] * 299 + rgb[1] * 587 + rgb[2] * 114) / 1000
     return "black" if brightness > 0.5 else "white"
 
-def create_circular_logo(path, size=200):
-    try:
-        img = Image.open(path).convert("RGBA")
-        img = img.resize((size, size), Image.Resampling.LANCZOS)
-        mask = Image.new('L', (size, size), 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse((0, 0, size, size), fill=255)
-        output = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        output.paste(img, (0, 0))
-        output.putalpha(mask)
-        return output
-    except:
-        blank = Image.new('RGBA', (size, size), (255, 255, 255, 50))
-        mask = Image.new('L', (size, size), 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse((0, 0, size, size), fill=255)
-        blank.putalpha(mask)
-        return blank
-
-def load_car_image(path, size=200):
-    try:
-        img = Image.open(path).convert("RGBA")
-        img.thumbnail((size, size), Image.Resampling.LANCZOS)
-        return img
-    except:
-        return Image.new('RGBA', (size, int(size/2)), (255, 255, 255, 200))
-
 def create_checkered_pattern(height, square_size=0.15):
     pattern = []
     num_squares = int(height / square_size) + 1
@@ -358,75 +226,37 @@ def create_checkered_pattern(height, square_size=0.15):
         pattern.append((y_pos, square_size, color))
     return pattern
 
-def check_drs_active(driver, lap_m, current_lap):
-    """Check if driver has DRS active at current position."""
-    if not drs_enabled or driver not in drs_enabled:
-        return False
-    
-    if current_lap not in drs_enabled[driver]:
-        return False
-    
-    # DRS Zone 1: 3660-4450m (activated by DP1 at 3510m)
-    if DRS_ZONE_1[0] <= lap_m <= DRS_ZONE_1[1]:
-        return drs_enabled[driver][current_lap].get(1, False)
-    
-    # DRS Zone 2: 4880-5183.7m, then wraps to 0-355m (activated by DP2 at 4550m)
-    if DRS_ZONE_2_START[0] <= lap_m <= DRS_ZONE_2_START[1]:
-        return drs_enabled[driver][current_lap].get(2, False)
-    
-    if DRS_ZONE_2_END[0] <= lap_m <= DRS_ZONE_2_END[1]:
-        prev_lap = current_lap - 1
-        if prev_lap in drs_enabled[driver]:
-            return drs_enabled[driver][prev_lap].get(2, False)
-    
-    return False
-def check_any_drs_active_zone(zone_num, snap, t):
-    """Check if ANY driver has DRS active in the specified zone."""
-    for driver in drivers:
-        if driver not in snap.index:
-            continue
-        
-        dist_km = snap.loc[driver, 'distance_km']
-        lap_m = (dist_km * 1000) % TRUE_LEN
-        current_lap = int((dist_km * 1000) // TRUE_LEN) + 1
-        
-        if current_lap <= 1:
-            continue
-        
-        if not drs_enabled or driver not in drs_enabled:
-            continue
-        
-        if current_lap not in drs_enabled[driver]:
-            continue
-        
-        # Check if driver has DRS enabled for this zone
-        if not drs_enabled[driver][current_lap].get(zone_num, False):
-            continue
-        
-        # Check if driver is in the DRS zone
-        if zone_num == 1:
-            if DRS_ZONE_1[0] <= lap_m <= DRS_ZONE_1[1]:
-                return True
-        elif zone_num == 2:
-            if DRS_ZONE_2_START[0] <= lap_m <= DRS_ZONE_2_START[1]:
-                return True
-            if DRS_ZONE_2_END[0] <= lap_m <= DRS_ZONE_2_END[1]:
-                prev_lap = current_lap - 1
-                if prev_lap in drs_enabled[driver] and drs_enabled[driver][prev_lap].get(2, False):
-                    return True
-    
-    return False
-# Helper function to load driver photo
-def load_driver_photo(path, size=200):
-    """Load driver photo or create team color placeholder"""
-    try:
-        img = Image.open(path).convert("RGBA")
-        img.thumbnail((size, size), Image.Resampling.LANCZOS)
-        return img
-    except:
-        # Create simple placeholder
-        img = Image.new('RGBA', (size, size), (100, 100, 100, 255))
-        return img
+def drs_index(lap, zone):
+    """DRS_ACTIVE of every driver (last axis) at per-driver laps."""
+    lap = np.where((lap >= 0) & (lap < DRS_ACTIVE.shape[1]), lap, -1)
+    return DRS_ACTIVE[np.arange(len(drivers)), lap, zone]
+
+def drs_track_state(dist_km):
+    """Lap and zone masks (zone 1, zone 2 before the line, zone 2 after it) for distances in km."""
+    dist_m = np.asarray(dist_km, dtype=float) * 1000
+    lap_m = dist_m % TRUE_LEN
+    lap = (dist_m // TRUE_LEN).astype(int) + 1
+    in_zone_1 = (DRS_ZONE_1[0] <= lap_m) & (lap_m <= DRS_ZONE_1[1])
+    in_zone_2 = (DRS_ZONE_2_START[0] <= lap_m) & (lap_m <= DRS_ZONE_2_START[1])
+    in_zone_2_wrap = (DRS_ZONE_2_END[0] <= lap_m) & (lap_m <= DRS_ZONE_2_END[1])
+    return lap, in_zone_1, in_zone_2, in_zone_2_wrap
+
+def check_drs_active(dist_km):
+    """DRS open flag of every driver; dist_km is [..., drivers] aligned with drivers."""
+    lap, in_zone_1, in_zone_2, in_zone_2_wrap = drs_track_state(dist_km)
+    zone_1_on, zone_2_on = drs_index(lap, 1), drs_index(lap, 2)
+    # Zone 2 wraps over the line on the DP2 entry of the previous lap (which, as in the
+    # original dict walk, only counts when the current lap has an entry too)
+    wrap_on = drs_index(lap - 1, 2) & (zone_1_on | zone_2_on)
+    return (lap > 1) & ((in_zone_1 & zone_1_on) | (in_zone_2 & zone_2_on) | (in_zone_2_wrap & wrap_on))
+
+def check_any_drs_active_zone(dist_km):
+    """Whether ANY driver has DRS active in zone 1 / zone 2: [..., 2] for [..., drivers] distances."""
+    lap, in_zone_1, in_zone_2, in_zone_2_wrap = drs_track_state(dist_km)
+    zone_2_on = drs_index(lap, 2)
+    zone_1 = (lap > 1) & in_zone_1 & drs_index(lap, 1)
+    zone_2 = (lap > 1) & zone_2_on & (in_zone_2 | (in_zone_2_wrap & drs_index(lap - 1, 2)))
+    return np.stack([zone_1.any(axis=-1), zone_2.any(axis=-1)], axis=-1)
 
 # =============================
 # MAIN FIGURE (16:9 RATIO)
@@ -461,7 +291,7 @@ ax1.add_patch(plt.Rectangle((1, 92), 98, 7, color='#1a1a1a', zorder=1))
 ax1.axhline(y=92, color='#FF1E00', linewidth=4, alpha=0.9, zorder=2)
 
 # Header text - SIMPLIFIED (no round info)
-lap_label = ax1.text(4, 94, "F1 2025", color="#ffffff", fontsize=32, weight='heavy', zorder=3)
+lap_label = ax1.text(4, 94, f"F1 {SEASON['season']}", color="#ffffff", fontsize=32, weight='heavy', zorder=3)
 time_label = ax1.text(96, 95, "00:00.000", color="#999", fontsize=20, family='monospace', ha='right', zorder=3)
 
 h_x = [5, 16, 31.5, 50.5, 71, 80, 90]
@@ -470,7 +300,7 @@ header_objs = [ax1.text(x, 89.2, txt, color="#555", fontsize=10.5, weight='bold'
 
 rows = []
 BASE_Y = 86.0
-ROW_SPACING = 4.25
+ROW_SPACING = 85.0 / max(20, len(drivers))   # 4.25; more than 20 drivers squeeze together
 finish_times = {}
 
 # Position animation tracking
@@ -484,7 +314,7 @@ gap_update_counter = 0
 GAP_UPDATE_INTERVAL = 12
 cached_gaps = {}
 
-for i in range(20):
+for i in range(len(drivers)):
     y = BASE_Y - (i * ROW_SPACING)
     bg = ax1.add_patch(plt.Rectangle((2, y-1.5), 96, 4.0, color='#0d0d0d', alpha=0.6, zorder=1))
     bg_h = ax1.add_patch(plt.Rectangle((2, y-1.5), 96, 4.0, color='#ffffff', alpha=0, zorder=2))
@@ -584,7 +414,7 @@ margin = 50
 ax2.set_xlim(x_coords.min() - margin, x_coords.max() + margin)
 ax2.set_ylim(y_coords.min() - margin, y_coords.max() + margin)
 
-title_main = ax2.text(0.98, 0.82, "FORMULA1 - SEASON 2025", color="white", transform=ax2.transAxes, fontstyle='italic',
+title_main = ax2.text(0.98, 0.82, f"FORMULA1 - SEASON {SEASON['season']}", color="white", transform=ax2.transAxes, fontstyle='italic',
                       fontsize=33, weight='bold', ha='right')
 title_round = ax2.text(0.97, 0.765, "", color="white", transform=ax2.transAxes, fontsize=21, weight='bold', ha='right')
 title_gp = ax2.text(0.97, 0.71, "", color="#6fd2be", transform=ax2.transAxes, fontsize=20, weight='bold', ha='right')
@@ -652,17 +482,17 @@ fig_width_inches = 16
 axes_width_inches = fig_width_inches * (32/160)
 dpi = fig.dpi
 axes_width_pixels = axes_width_inches * dpi
-pixels_per_data_unit = axes_width_pixels / 10
+pixels_per_data_unit = axes_width_pixels / len(INITIAL_TEAM_ORDER)
 desired_logo_pixels = bar_width_team * pixels_per_data_unit
 LOGO_ZOOM_TEAM = desired_logo_pixels / LOGO_SIZE_TEAM
 
 for team in INITIAL_TEAM_ORDER:
-    circular_logo = create_circular_logo(LOGO_PATHS[team], size=LOGO_SIZE_TEAM)
+    circular_logo = create_circular_logo(LOGO_PATHS.get(team), size=LOGO_SIZE_TEAM)
     logo_img = OffsetImage(circular_logo, zoom=LOGO_ZOOM_TEAM)
     ab = AnnotationBbox(logo_img, (0, 0), frameon=False, zorder=5, xycoords='data', box_alignment=(0.5, 0.5))
     logo_boxes_team[team] = ax3.add_artist(ab)
 
-ax3.set_xlim(-0.5, 9.5)
+ax3.set_xlim(-0.5, len(INITIAL_TEAM_ORDER) - 0.5)
 
 stats_boxes_team = {}
 stats_texts_team = {}
@@ -679,7 +509,7 @@ ax4.axis('off')
 
 # Track constants (in km)
 TRACK_LENGTH_KM = 1.75
-TOTAL_RACE_KM = 41.4696
+TOTAL_RACE_KM = (TRUE_LEN * LAPS) / 1000
 LEADER_POSITION_KM = 1.6  # Leader stays at this position on track during race
 
 # Layout constants (normalized 0-1 within Region 4)
@@ -872,24 +702,28 @@ def update(frame):
             is_pre_race = False
             is_countdown = False
     
-    snap = race_dict[t].set_index("driver")
+    # Snapshot: distances and running order by integer index
+    dist_row = np.asarray(race_distance_km[race_row[t]], dtype=float)
+    order = GRID_ORDER if is_pre_race else race_order[race_row[t]]
+    standings_drivers = drivers[order]
+    standings_dist = dist_row[order]
+    driver_pts = dict(zip(drivers, get_all_pts(t)))
+    driver_drs = dict(zip(drivers, check_drs_active(dist_row)))
     
     # ==================
     # REGION 1: LEADERBOARD
     # ==================
     
     if is_pre_race:
-        standings = snap.reindex(GRID_DATA.keys())
         lap_label.set_text("GRID PREVIEW")
         time_label.set_text("T=")
         header_objs[5].set_text("Q")
         header_objs[6].set_text("EVT")
     else:
-        standings = snap.sort_values("distance_km", ascending=False)
         header_objs[5].set_text("W")
         header_objs[6].set_text("POD")
     
-    leader_dist = standings.iloc[0]["distance_km"]
+    leader_dist = standings_dist[0]
     leader_finished = leader_dist >= TOTAL_RACE_DIST
     
     raw_progress = (leader_dist * 1000) / ROUND_DIST
@@ -898,8 +732,8 @@ def update(frame):
     round_progress = raw_progress - completed_rounds
     
     if not is_pre_race:
-        lap = min(8, int((leader_dist * 1000) // TRUE_LEN) + 1)
-        lap_label.set_text(f"LAP {lap}/8")
+        lap = min(LAPS, int((leader_dist * 1000) // TRUE_LEN) + 1)
+        lap_label.set_text(f"LAP {lap}/{LAPS}")
         mins, secs = divmod(t, 60)
         time_label.set_text(f"T={int(mins):02d}:{int(secs):02d}.{int((secs % 1) * 1000):03d}")
     
@@ -919,28 +753,23 @@ def update(frame):
     current_podium = HISTORICAL_PODIUMS.get(current_round, [])
     
     # Position tracking for smooth animation
-    for idx, d in enumerate(standings.index):
+    for idx, d in enumerate(standings_drivers):
         new_pos = idx + 1
         if d not in prev_positions:
             prev_positions[d] = new_pos
             current_y_positions[d] = BASE_Y - (idx * ROW_SPACING)
         target_positions[d] = BASE_Y - (idx * ROW_SPACING)
     
-    for idx, (d, row) in enumerate(standings.iterrows()):
+    for idx, (d, dist_km) in enumerate(zip(standings_drivers, standings_dist)):
         r = rows[idx]
         surname = d.split()[-1].upper()
         name_code = NAME_CODES.get(d, d[:3].upper())
-        dist_km = row["distance_km"]
-        time_s = row["time_sec"]
         is_finished = dist_km >= TOTAL_RACE_DIST
         driver_color = COLORS.get(d, "#fff")
         
         # DRS check
-        lap_m = (dist_km * 1000) % TRUE_LEN
         d_lap = int((dist_km * 1000) // TRUE_LEN) + 1
-        has_drs = False
-        if not is_pre_race and not is_finished and d_lap > 1:
-            has_drs = check_drs_active(d, lap_m, d_lap)
+        has_drs = not is_pre_race and not is_finished and driver_drs[d]
         
         # SMOOTH POSITION ANIMATION (synchronized with gap updates)
         if d in current_y_positions and d in target_positions:
@@ -994,7 +823,7 @@ def update(frame):
             r['wins'].set_text(f"{GRID_DATA[d][0]}")
             r['pod'].set_text(f"{GRID_DATA[d][1]}")
         else:
-            r['pts'].set_text(f"{int(get_pts(d, time_s))}")
+            r['pts'].set_text(f"{int(driver_pts[d])}")
             r['wins'].set_text(f"{stats_data[surname]['wins']}")
             r['pod'].set_text(f"{stats_data[surname]['pods']}")
             
@@ -1005,7 +834,7 @@ def update(frame):
                     m, s = divmod(finish_times[d], 60)
                     gap_text = f"{int(m):02d}:{s:06.3f}"
                 else:
-                    time_delta = finish_times[d] - finish_times[standings.index[0]]
+                    time_delta = finish_times[d] - finish_times[standings_drivers[0]]
                     gap_text = f"+{time_delta:.3f}"
                 int_text = "FINISHED"
                 r['gap'].set_text(gap_text)
@@ -1031,7 +860,7 @@ def update(frame):
                         else:
                             gap_text = f"+{time_gap:.3f}"
                         
-                        prev_dist = standings.iloc[idx-1]["distance_km"]
+                        prev_dist = standings_dist[idx-1]
                         int_gap = prev_dist - dist_km
                         int_time = int_gap * 16.646
                         int_text = f"+{int_time:.3f}"
@@ -1094,7 +923,7 @@ def update(frame):
                     r['name'].set_weight('heavy' if popup_intensity > 0.5 else 'bold')
     
     # Update previous positions
-    for idx, d in enumerate(standings.index):
+    for idx, d in enumerate(standings_drivers):
         prev_positions[d] = idx + 1
     
     # ==================
@@ -1167,9 +996,9 @@ def update(frame):
         title_gp.set_alpha(1)
     
     # ===== SECTOR GLOW AND COLOR LOGIC =====
-    curr_round_num = int((leader_dist * 1000) // (TRUE_LEN / 3)) + 1
-    rnd_clamped = min(24, curr_round_num)
-    active_sec = (rnd_clamped - 1) % 3
+    curr_round_num = int((leader_dist * 1000) // ROUND_DIST) + 1
+    rnd_clamped = min(ROUNDS, curr_round_num)
+    active_sec = min(2, int(((leader_dist * 1000) % TRUE_LEN) // (TRUE_LEN / 3)))   # the leader's sector
     
     if leader_finished:
         # POST-RACE: Unified white/silver track, no sector glow
@@ -1182,17 +1011,17 @@ def update(frame):
         full_track_glow.set_alpha(0.15)
         
         title_round.set_color('white')
-        title_round.set_text(f"ROUND {rnd_clamped}/24")
+        title_round.set_text(f"ROUND {rnd_clamped}/{ROUNDS}")
         title_gp.set_text(GP_NAMES.get(rnd_clamped, ""))
         
     elif not is_countdown and not is_pre_race:
         # DURING RACE: Normal sector colors
-        if curr_round_num > 24:
+        if curr_round_num > ROUNDS:
             full_track_glow.set_alpha(0.1)
         else:
             title_round.set_color(glow_colors[active_sec])
         
-        title_round.set_text(f"ROUND {rnd_clamped}/24")
+        title_round.set_text(f"ROUND {rnd_clamped}/{ROUNDS}")
         title_gp.set_text(GP_NAMES.get(rnd_clamped, ""))
         
         for idx, glow in enumerate(sector_glows):
@@ -1205,9 +1034,9 @@ def update(frame):
             glow.set_alpha(0.0)
     
     # Update DRS boxes based on active zones
-    # Update DRS boxes based on active zones
+    zone_active = check_any_drs_active_zone(dist_row)
     for dp_num in [1, 2]:
-        is_zone_active = check_any_drs_active_zone(dp_num, snap, t)
+        is_zone_active = zone_active[dp_num - 1]
         
         if is_zone_active:
             # Zone is active - show "DRS ON" with green background
@@ -1225,8 +1054,7 @@ def update(frame):
             drs_box_texts_top[dp_num].set_color('#00fb0c')
             drs_box_texts_bottom[dp_num].set_text(f"DP{dp_num}")
             drs_box_texts_bottom[dp_num].set_color('#00fb0c')
-    for idx, (d, row) in enumerate(standings.iterrows()):
-        total_dist_km = row["distance_km"]
+    for idx, (d, total_dist_km) in enumerate(zip(standings_drivers, standings_dist)):
         curr_px_idx = np.searchsorted(cum_dist, (total_dist_km % (TRUE_LEN/1000)) * 1000)
         curr_px_idx = min(curr_px_idx, len(points)-1)
         x, y = points[curr_px_idx]
@@ -1272,35 +1100,33 @@ def update(frame):
         stats_texts_team.clear()
         connection_lines_team.clear()
         
-        # Set y-axis to accommodate 2024 points + space for vertical text
-        max_pre_race_pts = 700
+        # Set y-axis to accommodate last season's points + space for vertical text (700 for 2024)
+        max_pre_race_pts = max(100, np.ceil(max(p[0] for p in PRE_RACE_TEAM_DATA.values()) * 1.05 / 100) * 100)
         ax3.set_ylim(0, max_pre_race_pts)
         
         # Display each team
         for rank, team in enumerate(PRE_RACE_TEAM_ORDER):
-            pts_2024 = PRE_RACE_TEAM_DATA[team]["points"]
-            wins = PRE_RACE_TEAM_DATA[team]["wins"]
-            podiums = PRE_RACE_TEAM_DATA[team]["podiums"]
+            prev_pts, wins, podiums = PRE_RACE_TEAM_DATA[team]
             
             bars_team[team].set_x(rank - bar_width_team/2)
-            bars_team[team].set_height(pts_2024)
+            bars_team[team].set_height(prev_pts)
             
             if team in logo_boxes_team:
-                logo_boxes_team[team].xybox = (rank, pts_2024)
+                logo_boxes_team[team].xybox = (rank, prev_pts)
                 logo_boxes_team[team].set_visible(True)
             
             point_labels_team[team].set_x(rank)
-            point_labels_team[team].set_y(pts_2024 + (max_pre_race_pts * 0.04))
+            point_labels_team[team].set_y(prev_pts + (max_pre_race_pts * 0.04))
             point_labels_team[team].set_text("0")
             
-            text_parts = [f"{team}: {pts_2024}"]
+            text_parts = [f"{team}: {prev_pts}"]
             if wins > 0:
                 text_parts.append(f"WIN:{wins}")
             if podiums > 0:
                 text_parts.append(f"POD:{podiums}")
             text_string = " ".join(text_parts)
             
-            text_y_start = pts_2024 + (max_pre_race_pts * 0.1)
+            text_y_start = prev_pts + (max_pre_race_pts * 0.1)
             
             vertical_text = ax3.text(rank, text_y_start, text_string,
                                     color=TEAM_COLORS[team], ha='left', va='bottom',
@@ -1317,18 +1143,14 @@ def update(frame):
                 text_obj.remove()
         pre_race_team_texts.clear()
         
-        snap_copy = snap.copy()
-        snap_copy['p_calc'] = snap_copy.apply(lambda r: get_pts(r.name, t), axis=1)
-        snap_copy['team'] = snap_copy.index.map(TEAM_MAP)
-        team_data = snap_copy.groupby('team')['p_calc'].sum().to_dict()
+        team_data = {team: 0 for team in sorted(set(TEAM_MAP[d] for d in drivers))}
+        for d in drivers:
+            team_data[TEAM_MAP[d]] += driver_pts[d]
         
-        adjustment_applied = False
         current_round_team = completed_rounds + 1
-        if current_round_team == 2 and not adjustment_applied:
-            for team, adjustment in POINTS_ADJUSTMENT.items():
-                if team in team_data:
-                    team_data[team] += adjustment
-            adjustment_applied = True
+        for team, adjustment in TEAM_ADJUSTMENTS.get(current_round_team, {}).items():
+            if team in team_data:
+                team_data[team] += adjustment
         
         team_wins, team_podiums = calculate_team_stats(current_round_team)
         sorted_teams = sorted(team_data.keys(), key=lambda x: team_data[x], reverse=True)
@@ -1469,12 +1291,13 @@ def update(frame):
     
     # Get top 3 drivers based on distance
     driver_data = {}
+    standings_rank = {d: idx for idx, d in enumerate(standings_drivers)}
     for driver in TOP_DRIVERS:
-        if driver in standings.index:
+        if driver in standings_rank:
             driver_data[driver] = {
-                'dist_km': standings.loc[driver, 'distance_km'],
-                'rank': list(standings.index).index(driver) + 1,
-                'points': int(get_pts(driver, t))
+                'dist_km': standings_dist[standings_rank[driver]],
+                'rank': standings_rank[driver] + 1,
+                'points': int(driver_pts[driver])
             }
     
     # Sort by distance to get actual top 3
@@ -1671,11 +1494,7 @@ def update(frame):
                 lane_y = lane_center_lines[lane_idx]
                 
                 # Check DRS status for this driver
-                lap_m = (dist_km * 1000) % TRUE_LEN
-                d_lap = int((dist_km * 1000) // TRUE_LEN) + 1
-                has_drs = False
-                if d_lap > 1:
-                    has_drs = check_drs_active(driver, lap_m, d_lap)
+                has_drs = driver_drs[driver]
                 
                 # DRS bar (green strip behind car)
                 if has_drs:
@@ -2,6 +2,9 @@ import numpy as np
 import pandas as pd
 import subprocess
 import os
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import matplotlib
 matplotlib.use('Agg') # Force non-interactive high-speed backend
 import matplotlib.pyplot as plt
@@ -11,19 +14,23 @@ import matplotlib.colors as mcolors
 from matplotlib.collections import LineCollection
 from matplotlib.patches import Circle, FancyBboxPatch, Rectangle
 from matplotlib.offsetbox import OffsetImage, AnnotationBbox
-from PIL import Image, ImageDraw
+from PIL import Image
+from asset_cache import create_circular_logo, load_car_image, load_driver_photo
+from race_frames import RACE_CSV, frames_path, load_race_frames, running_order
+from season_catalog import LAPS, load_season, points_table, season_path
 from matplotlib.patches import Rectangle
 from matplotlib.colors import LinearSegmentedColormap
+from matplotlib.transforms import Bbox
 plt.rcParams['font.family'] = 'DejaVu Sans'
 # =============================
 # GLOBAL DATA LOADING
 # =============================
-race = pd.read_csv("race_time_interpolated.csv")
+race_time_sec, drivers, race_distance_km = load_race_frames()
 track = pd.read_csv("track_waypoints.csv")
 
 # Timing setup
 TARGET_UI_FPS = 30
-unique_times = np.sort(race["time_sec"].unique())
+unique_times = np.asarray(race_time_sec)
 total_race_sec = unique_times.max() - unique_times.min()
 actual_data_fps = len(unique_times) / total_race_sec
 SKIP_VAL = max(1, int(actual_data_fps / TARGET_UI_FPS))
@@ -32,14 +39,15 @@ PRE_RACE_STAY_SEC = 7
 pre_race_frames = PRE_RACE_STAY_SEC * TARGET_UI_FPS
 race_times = unique_times[::SKIP_VAL]
 times = np.concatenate([np.full(pre_race_frames, race_times[0]), race_times])
-race_dict = {t: df for t, df in race.groupby("time_sec")}
 
-drivers = race["driver"].unique()
 TRUE_LEN = 5183.7
 TIME = 86.288
-ROUND_TIME = TIME / 3
-TOTAL_RACE_DIST = (TRUE_LEN * 8) / 1000
-ROUND_DIST = TRUE_LEN / 3
+SEASON = load_season()
+ROUNDS = SEASON["rounds"]
+ROUNDS_PER_LAP = ROUNDS / LAPS
+ROUND_TIME = TIME / ROUNDS_PER_LAP
+TOTAL_RACE_DIST = (TRUE_LEN * LAPS) / 1000
+ROUND_DIST = TRUE_LEN / ROUNDS_PER_LAP
 SURNAME_MAP = {d.split()[-1].upper(): d for d in drivers}
 
 # Track setup
@@ -50,8 +58,7 @@ dists = np.sqrt(np.sum(np.diff(points, axis=0)**2, axis=1))
 cum_dist_raw = np.insert(np.cumsum(dists), 0, 0)
 cum_dist = (cum_dist_raw / cum_dist_raw[-1]) * TRUE_LEN
 
-TOTAL_LAPS = 8
-RACE_COMPLETION_KM = (TRUE_LEN * TOTAL_LAPS) / 1000
+RACE_COMPLETION_KM = (TRUE_LEN * LAPS) / 1000
 INSTANT_VANISH_KM = RACE_COMPLETION_KM + (400 / 1000)
 
 dx = np.gradient(x_coords)
@@ -67,46 +74,15 @@ sec3_m = cum_dist[:-1] >= 2 * TRUE_LEN / 3
 # =============================
 # SHARED DATA
 # =============================
-# Name codes (3-letter codes)
-NAME_CODES = {
-    "Verstappen": "VER", "Lando Norris": "NOR", "Charles Leclerc": "LEC",
-    "Oscar Piastri": "PIA", "Sainz": "SAI", "George Russell": "RUS",
-    "Lewis Hamilton": "HAM", "Alonso": "ALO", "Gasly": "GAS",
-    "Hulkenberg": "HUL", "Yuki": "TSU", "Stroll": "STR",
-    "Ocon": "OCO", "Albon": "ALB", "Bearman": "BEA",
-    "Colapinto": "COL", "Lawson": "LAW", "Bortoleto": "BOR",
-    "Hadjar": "HAD", "Antonelli": "ANT"
-}
-
-# Add PRE-RACE TEAM DATA (2024 season final standings)
-PRE_RACE_TEAM_DATA = {
-    "McLaren": {"points": 666, "wins": 6, "podiums": 21},
-    "Ferrari": {"points": 652, "wins": 5, "podiums": 22},
-    "Red Bull": {"points": 589, "wins": 9, "podiums": 18},
-    "Mercedes": {"points": 468, "wins": 4, "podiums": 9},
-    "Aston Martin": {"points": 94, "wins": 0, "podiums": 0},
-    "Alpine": {"points": 65, "wins": 0, "podiums": 2},
-    "Haas": {"points": 58, "wins": 0, "podiums": 0},
-    "Racing Bulls": {"points": 46, "wins": 0, "podiums": 0},
-    "Williams": {"points": 17, "wins": 0, "podiums": 0},
-    "Sauber": {"points": 4, "wins": 0, "podiums": 0}
-}
+# Teams, colours, name codes, GP titles and featured drivers come from the season catalog,
+# which fills in whatever a season leaves out
+NAME_CODES = SEASON["name_codes"]
 
-# Pre-race team order (by 2024 final standings)
-PRE_RACE_TEAM_ORDER = [
-    "McLaren", "Ferrari", "Red Bull", "Mercedes", "Aston Martin",
-    "Alpine", "Haas", "Racing Bulls", "Williams", "Sauber"
-]
+# Constructors board before the start: previous season's (points, wins, podiums), in standings order
+PRE_RACE_TEAM_DATA = SEASON["team_grid"]
+PRE_RACE_TEAM_ORDER = list(PRE_RACE_TEAM_DATA)
 
-GRID_DATA = {
-    "Verstappen": (437, "F1-24"), "Lando Norris": (374, "F1-24"), "Charles Leclerc": (356, "F1-24"),
-    "Oscar Piastri": (292, "F1-24"), "Sainz": (290, "F1-24"), "George Russell": (245, "F1-24"),
-    "Lewis Hamilton": (223, "F1-24"), "Alonso": (70, "F1-24"), "Gasly": (42, "F1-24"),
-    "Hulkenberg": (41, "F1-24"), "Yuki": (30, "F1-24"), "Stroll": (24, "F1-24"),
-    "Ocon": (23, "F1-24"), "Albon": (12, "F1-24"), "Bearman": (7, "F1-24"),
-    "Colapinto": (5, "F1-24"), "Lawson": (4, "F1-24"), "Bortoleto": (214.5, "F2-24"),
-    "Hadjar": (192, "F2-24"), "Antonelli": (113, "F2-24")
-}
+GRID_DATA = SEASON["grid"]
 
 # DRS CONFIG
 DP1 = 3510
@@ -114,116 +90,46 @@ DP2 = 4550
 DRS_ZONE_1 = (3660, 4450)
 DRS_ZONE_2_START = (4880, 5183.7)
 DRS_ZONE_2_END = (0, 355)
+# The season's hand-checked DRS log (catalog "drs_log") when it has one, else 08_drs_analysis.py's log
+DRS_LOG_PATH = SEASON.get("drs_log", "drs_eligibility_log.csv")
+if not os.path.exists(DRS_LOG_PATH):
+    DRS_LOG_PATH = "drs_eligibility_log.csv"
+
+# Compiled DRS index: DRS_ACTIVE[driver, lap, zone] is True when the log made the driver
+# ELIGIBLE for zone 1 (DP1) or zone 2 (DP2) on that lap. Drivers follow the race file order and
+# the last lap row stays False, so laps outside the log read False.
+def compile_drs_index(log):
+    eligible = log[log['status'] == 'ELIGIBLE']
+    driver_idx = pd.Index(drivers).get_indexer(eligible['driver'])
+    known = driver_idx >= 0
+    lap = eligible['lap'].to_numpy()
+    zone = np.where(eligible['detection_point'].str.contains("DP1"), 1, 2)
+    index = np.zeros((len(drivers), lap.max(initial=0) + 2, 3), dtype=bool)
+    index[driver_idx[known], lap[known], zone[known]] = True
+    return index
 
-# Load DRS eligibility log and create a simple lookup
 try:
-    drs_log = pd.read_csv("drs_eligibility_logfixed.csv")
-    drs_enabled = {}
-    
-    for _, row in drs_log.iterrows():
-        if row['status'] != 'ELIGIBLE':
-            continue
-            
-        driver = row['driver']
-        lap = row['lap']
-        zone = 1 if "DP1" in row['detection_point'] else 2
-        
-        if driver not in drs_enabled:
-            drs_enabled[driver] = {}
-        if lap not in drs_enabled[driver]:
-            drs_enabled[driver][lap] = {}
-        
-        drs_enabled[driver][lap][zone] = True
-    
+    drs_log = pd.read_csv(DRS_LOG_PATH)
+    DRS_ACTIVE = compile_drs_index(drs_log)
     print(f"✔ DRS log loaded: {len(drs_log[drs_log['status']=='ELIGIBLE'])} eligible activations")
 except Exception as e:
-    drs_enabled = {}
+    DRS_ACTIVE = np.zeros((len(drivers), 1, 3), dtype=bool)
     print(f"⚠ Warning: Could not load DRS data: {e}")
 
-POINTS_DATA = {
-    "Lando Norris": (25,44,62,77,89,115,133,158,176,176,201,226,250,275,275,293,299,314,332,357,390,390,408,423),
-    "Verstappen": (18,36,61,69,87,99,124,136,137,155,155,165,185,187,205,230,255,273,306,321,341,366,396,421),
-    "Oscar Piastri": (2,34,49,74,99,131,146,161,186,198,216,234,266,284,309,324,324,336,346,356,366,366,392,410),
-    "George Russell": (15,35,45,63,73,93,99,99,111,136,146,147,157,172,184,194,212,237,252,258,276,294,309,319),
-    "Charles Leclerc": (4,8,20,32,47,53,61,79,94,104,119,119,139,151,151,163,165,173,192,210,214,226,230,242),
-    "Lewis Hamilton": (1,9,15,25,31,41,53,63,71,79,91,103,109,109,109,117,121,125,142,146,148,152,152,156),
-    "Antonelli": (12,22,30,30,38,48,48,48,48,63,63,63,63,64,64,66,78,88,89,97,122,137,150,150),
-    "Albon": (10,16,18,18,20,30,40,42,42,42,42,46,54,54,64,70,70,70,73,73,73,73,73,73),
-    "Sainz": (0,1,1,1,5,7,11,12,12,13,13,13,16,16,16,16,31,32,38,38,38,48,64,64),
-    "Alonso": (0,0,0,0,0,0,0,0,2,8,14,16,16,26,30,30,30,36,37,37,40,40,48,56),
-    "Hulkenberg": (6,6,6,6,6,6,6,6,16,20,22,37,37,37,37,37,37,37,41,41,43,49,49,51),
-    "Hadjar": (0,0,4,4,5,5,7,15,21,21,21,21,22,22,35,36,37,37,37,37,41,49,49,51),
-    "Bearman": (0,4,5,6,6,6,6,6,6,6,6,6,8,8,16,16,16,18,20,32,40,41,41,41),
-    "Lawson": (0,0,0,0,0,0,0,4,4,4,12,12,16,20,20,20,30,30,30,30,36,36,38,38),
-    "Ocon": (0,10,10,14,14,14,14,20,20,22,23,23,27,27,28,28,28,28,28,30,30,32,32,38),
-    "Stroll": (8,10,10,10,10,14,14,14,14,14,14,20,20,26,32,32,32,32,32,32,32,32,32,33),
-    "Yuki": (0,3,3,5,5,9,10,10,10,10,10,10,10,10,12,12,20,20,28,28,28,28,33,33),
-    "Gasly": (0,0,0,6,6,7,7,7,11,11,11,19,20,20,20,20,20,20,20,20,22,22,22,22),
-    "Bortoleto": (0,0,0,0,0,0,0,0,0,0,4,4,6,14,14,18,18,18,18,19,19,19,19,19),
-    "Colapinto": (0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0,0),
-}
-
-HISTORICAL_PODIUMS = {
-    1: ["NORRIS", "VERSTAPPEN", "RUSSELL"], 2: ["PIASTRI", "NORRIS", "RUSSELL"],
-    3: ["VERSTAPPEN", "NORRIS", "PIASTRI"], 4: ["PIASTRI", "NORRIS", "RUSSELL"],
-    5: ["PIASTRI", "VERSTAPPEN", "LECLERC"], 6: ["PIASTRI", "NORRIS", "RUSSELL"],
-    7: ["VERSTAPPEN", "NORRIS", "PIASTRI"], 8: ["NORRIS", "LECLERC", "PIASTRI"],
-    9: ["PIASTRI", "NORRIS", "LECLERC"], 10: ["RUSSELL", "VERSTAPPEN", "ANTONELLI"],
-    11: ["NORRIS", "PIASTRI", "LECLERC"], 12: ["NORRIS", "PIASTRI", "HULKENBERG"],
-    13: ["PIASTRI", "NORRIS", "LECLERC"], 14: ["NORRIS", "PIASTRI", "RUSSELL"],
-    15: ["PIASTRI", "VERSTAPPEN", "HADJAR"], 16: ["VERSTAPPEN", "NORRIS", "PIASTRI"],
-    17: ["VERSTAPPEN", "RUSSELL", "SAINZ"], 18: ["RUSSELL", "VERSTAPPEN", "NORRIS"],
-    19: ["VERSTAPPEN", "NORRIS", "LECLERC"], 20: ["NORRIS", "LECLERC", "VERSTAPPEN"],
-    21: ["NORRIS", "ANTONELLI", "VERSTAPPEN"], 22: ["VERSTAPPEN", "RUSSELL", "ANTONELLI"],
-    23: ["VERSTAPPEN", "PIASTRI", "SAINZ"], 24: ["VERSTAPPEN", "PIASTRI", "NORRIS"]
-}
+# Same points as a [drivers, rounds] matrix in race file driver order (no data: 0 points).
+# Column 0 is the pre-season zero, so column r holds the total after round r; a season whose
+# points stop early keeps each driver's last total up to the last round.
+POINTS_MATRIX = points_table(SEASON, drivers)
 
-COLORS = {
-    "Verstappen": "#3671C6", "Lando Norris": "#FF8700", "Charles Leclerc": "#E8002D",
-    "Oscar Piastri": "#FF8700", "Sainz": "#005AFF", "George Russell": "#27F4D2",
-    "Lewis Hamilton": "#E8002D", "Antonelli": "#27F4D2", "Albon": "#005AFF",
-    "Alonso": "#229971", "Gasly": "#0090FF", "Hulkenberg": "#2DFF00",
-    "Yuki": "#3671C6", "Stroll": "#229971", "Ocon": "#BDC3C7", "Bearman": "#BDC3C7",
-    "Colapinto": "#0090FF", "Lawson": "#6692FF", "Bortoleto": "#2DFF00", "Hadjar": "#6692FF"
-}
-
-TEAM_MAP = {
-    "Verstappen": "Red Bull", "Yuki": "Red Bull",
-    "Lando Norris": "McLaren", "Oscar Piastri": "McLaren",
-    "Charles Leclerc": "Ferrari", "Lewis Hamilton": "Ferrari",
-    "George Russell": "Mercedes", "Antonelli": "Mercedes",
-    "Sainz": "Williams", "Albon": "Williams",
-    "Alonso": "Aston Martin", "Stroll": "Aston Martin",
-    "Gasly": "Alpine", "Colapinto": "Alpine",
-    "Ocon": "Haas", "Bearman": "Haas",
-    "Lawson": "Racing Bulls", "Hadjar": "Racing Bulls",
-    "Bortoleto": "Sauber", "Hulkenberg": "Sauber"
-}
+HISTORICAL_PODIUMS = SEASON["podiums"]
 
-DRIVER_TO_TEAM = {
-    "VERSTAPPEN": "Red Bull", "YUKI": "Red Bull",
-    "NORRIS": "McLaren", "PIASTRI": "McLaren",
-    "LECLERC": "Ferrari", "HAMILTON": "Ferrari",
-    "RUSSELL": "Mercedes", "ANTONELLI": "Mercedes",
-    "SAINZ": "Williams", "ALBON": "Williams",
-    "ALONSO": "Aston Martin", "STROLL": "Aston Martin",
-    "GASLY": "Alpine", "COLAPINTO": "Alpine",
-    "OCON": "Haas", "BEARMAN": "Haas",
-    "LAWSON": "Racing Bulls", "HADJAR": "Racing Bulls",
-    "BORTOLETO": "Sauber", "HULKENBERG": "Sauber"
-}
-
-TEAM_COLORS = {
-    "Red Bull": "#3671C6", "McLaren": "#FF8700", "Ferrari": "#E8002D",
-    "Mercedes": "#27F4D2", "Williams": "#64C4FF", "Aston Martin": "#229971",
-    "Alpine": "#0093CC", "Haas": "#B6BABD", "Racing Bulls": "#6692FF", "Sauber": "#52E252"
-}
-
-INITIAL_TEAM_ORDER = [
-    "McLaren", "Ferrari", "Red Bull", "Mercedes", "Aston Martin", 
-    "Alpine", "Haas", "Racing Bulls", "Williams", "Sauber"
-]
+COLORS = SEASON["driver_colors"]
+TEAM_MAP = SEASON["teams"]
+DRIVER_TO_TEAM = {d.split()[-1].upper(): team for d, team in TEAM_MAP.items()}
+TEAM_COLORS = SEASON["team_colors"]
+INITIAL_TEAM_ORDER = PRE_RACE_TEAM_ORDER
 
+# Artwork in the repo; teams and drivers without a file get a placeholder
 LOGO_PATHS = {
     "Red Bull": "logos/redbull.jpg", "McLaren": "logos/mclaren.jpg", "Ferrari": "logos/ferrari.jpg",
     "Mercedes": "logos/mercedes.jpg", "Williams": "logos/williams.jpg", "Aston Martin": "logos/astonmartin.jpg",
@@ -240,78 +146,74 @@ CAR_PATHS = {
     "George Russell": "cars/mercedes_car.png"
 }
 
-DRIVER_NAME_MAP = {
-    "Lando Norris": "NORRIS", "Verstappen": "VERSTAPPEN", "Oscar Piastri": "PIASTRI",
-    "Charles Leclerc": "LECLERC", "George Russell": "RUSSELL"
-}
-
-TOP_DRIVERS = ["Lando Norris", "Verstappen", "Oscar Piastri", "Charles Leclerc", "George Russell"]
+TOP_DRIVERS = SEASON["featured"]
+DRIVER_NAME_MAP = {d: d.split()[-1].upper() for d in TOP_DRIVERS}
 DRIVER_TEAMS = {d: TEAM_MAP[d] for d in TOP_DRIVERS}
 
-POINTS_ADJUSTMENT = {"Red Bull": -3, "Racing Bulls": +3}
-MAX_SEASON_POINTS = 423
+TEAM_ADJUSTMENTS = SEASON["team_adjustments"]   # {round: {team: points}} while that round runs
 
-GP_NAMES = {
-    1: "AUSTRALIAN GRAND PRIX", 2: "CHINESE GRAND PRIX & SPRINT", 3: "JAPANESE GRAND PRIX", 4: "BAHRAIN GRAND PRIX",
-    5: "SAUDI ARABIAN GRAND PRIX", 6: "MIAMI GRAND PRIX & SPRINT", 7: "EMILIA ROMAGNA GRAND PRIX", 8: "MONACO GRAND PRIX",
-    9: "SPANISH GRAND PRIX", 10: "CANADIAN GRAND PRIX", 11: "AUSTRIAN GRAND PRIX", 12: "BRITISH GRAND PRIX",
-    13: "BELGIAN GRAND PRIX & SPRINT", 14: "HUNGARIAN GRAND PRIX", 15: "DUTCH GRAND PRIX", 16: "ITALIAN GRAND PRIX",
-    17: "AZERBAIJAN GRAND PRIX", 18: "SINGAPORE GRAND PRIX", 19: "UNITED STATES GRAND PRIX & SPRINT", 20: "MEXICAN GRAND PRIX",
-    21: "BRAZILIAN GRAND PRIX & SPRINT", 22: "LAS VEGAS GRAND PRIX", 23: "QATAR GRAND PRIX & SPRINT", 24: "ABU DHABI GRAND PRIX"
-}
+GP_NAMES = SEASON["gp_names"]
 
 CORNERS = [(412, 1), (780, -1), (935, 1), (1205, -1), (1400, -1), (1590, 1), (2266, -1), (2600, -1), 
            (2720, -1), (2835, 1), (2940, -1), (3045, -1), (3300, -1), (3420, 1), (4477, 1), (4650, 1), (4880, 1)]
 DRS_ZONES = [(3660, 4450), (4880, 5183.7), (0, 355)]
 DRS_POINTS = [3510, 4550]
 
+# =============================
+# CUMULATIVE PODIUM TABLES
+# =============================
+# [round, driver or team, P1/P2/P3]: row r counts rounds 1..r (row 0 is all zeros), so any
+# "stats up to round r" query is one row read instead of a rescan of HISTORICAL_PODIUMS.
+STAT_DRIVERS = list(SURNAME_MAP)
+STAT_TEAMS = sorted(set(DRIVER_TO_TEAM.values()))
+LAST_ROUND = max(HISTORICAL_PODIUMS, default=0)
+
+def build_cumulative_podiums():
+    driver_counts = np.zeros((LAST_ROUND + 1, len(STAT_DRIVERS), 3), dtype=int)
+    team_counts = np.zeros((LAST_ROUND + 1, len(STAT_TEAMS), 3), dtype=int)
+    for rnd, podium in HISTORICAL_PODIUMS.items():
+        for pos, driver in enumerate(podium):
+            driver_counts[rnd, STAT_DRIVERS.index(driver), pos] += 1
+            team = DRIVER_TO_TEAM.get(driver)
+            if team:
+                team_counts[rnd, STAT_TEAMS.index(team), pos] += 1
+    return np.cumsum(driver_counts, axis=0), np.cumsum(team_counts, axis=0)
+
+DRIVER_CUM_PODIUMS, TEAM_CUM_PODIUMS = build_cumulative_podiums()
+
+def stats_row(rounds):
+    """Table row holding the totals of rounds 1..rounds (scalar or array)."""
+    return np.clip(rounds, 0, LAST_ROUND)
+
 # =============================
 # HELPER FUNCTIONS
 # =============================
-def get_pts(driver_name, time):
-    pts_tuple = POINTS_DATA.get(driver_name)
-    if not pts_tuple: return 0
-    raw_rnd = time / ROUND_TIME
-    idx = int(raw_rnd)
+def get_all_pts(time):
+    """Interpolated points of every driver at a time (scalar -> [drivers], array -> [times, drivers])."""
+    raw_rnd = np.asarray(time, dtype=float) / ROUND_TIME
+    idx = np.trunc(raw_rnd).astype(int)
     frac = raw_rnd - idx
-    if idx >= 23: return pts_tuple[23]
-    p_start = pts_tuple[idx-1] if idx > 0 else 0
-    return p_start + (pts_tuple[idx] - p_start) * frac
+    season_over = idx >= ROUNDS - 1
+    idx = np.where(season_over, ROUNDS, np.maximum(idx, 0))
+    frac = np.where(season_over, 0.0, frac)
+    p_start = POINTS_MATRIX[:, idx]
+    p_end = POINTS_MATRIX[:, np.minimum(idx + 1, ROUNDS)]
+    return (p_start + (p_end - p_start) * frac).T
 
 def get_historical_stats(completed_rounds):
-    stats = {d.upper(): {'wins': 0, 'pods': 0} for d in SURNAME_MAP}
-    for r in range(1, completed_rounds + 1):
-        if r in HISTORICAL_PODIUMS:
-            podium = HISTORICAL_PODIUMS[r]
-            stats[podium[0]]['wins'] += 1
-            for driver in podium:
-                stats[driver]['pods'] += 1
-    return stats
+    counts = DRIVER_CUM_PODIUMS[stats_row(completed_rounds)]
+    return {d: {'wins': int(c[0]), 'pods': int(c.sum())} for d, c in zip(STAT_DRIVERS, counts)}
 
 def calculate_team_stats(current_round):
-    team_wins, team_podiums = {}, {}
-    for round_num in range(1, current_round):
-        if round_num in HISTORICAL_PODIUMS:
-            podium = HISTORICAL_PODIUMS[round_num]
-            if len(podium) > 0:
-                winner_team = DRIVER_TO_TEAM.get(podium[0])
-                if winner_team:
-                    team_wins[winner_team] = team_wins.get(winner_team, 0) + 1
-            for driver in podium:
-                team = DRIVER_TO_TEAM.get(driver)
-                if team:
-                    team_podiums[team] = team_podiums.get(team, 0) + 1
+    counts = TEAM_CUM_PODIUMS[stats_row(current_round - 1)]
+    team_wins = {team: int(c[0]) for team, c in zip(STAT_TEAMS, counts) if c[0]}
+    team_podiums = {team: int(c.sum()) for team, c in zip(STAT_TEAMS, counts) if c.sum()}
     return team_wins, team_podiums
 
 def calculate_driver_stats(current_round):
-    driver_wins, driver_podiums = {}, {}
-    for round_num in range(1, min(current_round + 1, 25)):
-        if round_num in HISTORICAL_PODIUMS:
-            podium = HISTORICAL_PODIUMS[round_num]
-            if len(podium) > 0:
-                driver_wins[podium[0]] = driver_wins.get(podium[0], 0) + 1
-            for driver in podium:
-                driver_podiums[driver] = driver_podiums.get(driver, 0) + 1
+    counts = DRIVER_CUM_PODIUMS[stats_row(current_round)]
+    driver_wins = {d: int(c[0]) for d, c in zip(STAT_DRIVERS, counts) if c[0]}
+    driver_podiums = {d: int(c.sum()) for d, c in zip(STAT_DRIVERS, counts) if c.sum()}
     return driver_wins, driver_podiums
 
 def smooth_transition(progress, start, peak, end):
@@ -329,33 +231,6 @@ def get_text_color(hex_color):
     brightness = (rgb[0] * 299 + rgb[1] * 587 + rgb[2] * 114) / 1000
     return "black" if brightness > 0.5 else "white"
 
-def create_circular_logo(path, size=200):
-    try:
-        img = Image.open(path).convert("RGBA")
-        img = img.resize((size, size), Image.Resampling.LANCZOS)
-        mask = Image.new('L', (size, size), 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse((0, 0, size, size), fill=255)
-        output = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-        output.paste(img, (0, 0))
-        output.putalpha(mask)
-        return output
-    except:
-        blank = Image.new('RGBA', (size, size), (255, 255, 255, 50))
-        mask = Image.new('L', (size, size), 0)
-        draw = ImageDraw.Draw(mask)
-        draw.ellipse((0, 0, size, size), fill=255)
-        blank.putalpha(mask)
-        return blank
-
-def load_car_image(path, size=200):
-    try:
-        img = Image.open(path).convert("RGBA")
-        img.thumbnail((size, size), Image.Resampling.LANCZOS)
-        return img
-    except:
-        return Image.new('RGBA', (size, int(size/2)), (255, 255, 255, 200))
-
 def create_checkered_pattern(height, square_size=0.15):
     pattern = []
     num_squares = int(height / square_size) + 1
@@ -365,75 +240,37 @@ def create_checkered_pattern(height, square_size=0.15):
         pattern.append((y_pos, square_size, color))
     return pattern
 
-def check_drs_active(driver, lap_m, current_lap):
-    """Check if driver has DRS active at current position."""
-    if not drs_enabled or driver not in drs_enabled:
-        return False
-    
-    if current_lap not in drs_enabled[driver]:
-        return False
-    
-    # DRS Zone 1: 3660-4450m (activated by DP1 at 3510m)
-    if DRS_ZONE_1[0] <= lap_m <= DRS_ZONE_1[1]:
-        return drs_enabled[driver][current_lap].get(1, False)
-    
-    # DRS Zone 2: 4880-5183.7m, then wraps to 0-355m (activated by DP2 at 4550m)
-    if DRS_ZONE_2_START[0] <= lap_m <= DRS_ZONE_2_START[1]:
-        return drs_enabled[driver][current_lap].get(2, False)
-    
-    if DRS_ZONE_2_END[0] <= lap_m <= DRS_ZONE_2_END[1]:
-        prev_lap = current_lap - 1
-        if prev_lap in drs_enabled[driver]:
-            return drs_enabled[driver][prev_lap].get(2, False)
-    
-    return False
-def check_any_drs_active_zone(zone_num, snap, t):
-    """Check if ANY driver has DRS active in the specified zone."""
-    for driver in drivers:
-        if driver not in snap.index:
-            continue
-        
-        dist_km = snap.loc[driver, 'distance_km']
-        lap_m = (dist_km * 1000) % TRUE_LEN
-        current_lap = int((dist_km * 1000) // TRUE_LEN) + 1
-        
-        if current_lap <= 1:
-            continue
-        
-        if not drs_enabled or driver not in drs_enabled:
-            continue
-        
-        if current_lap not in drs_enabled[driver]:
-            continue
-        
-        # Check if driver has DRS enabled for this zone
-        if not drs_enabled[driver][current_lap].get(zone_num, False):
-            continue
-        
-        # Check if driver is in the DRS zone
-        if zone_num == 1:
-            if DRS_ZONE_1[0] <= lap_m <= DRS_ZONE_1[1]:
-                return True
-        elif zone_num == 2:
-            if DRS_ZONE_2_START[0] <= lap_m <= DRS_ZONE_2_START[1]:
-                return True
-            if DRS_ZONE_2_END[0] <= lap_m <= DRS_ZONE_2_END[1]:
-                prev_lap = current_lap - 1
-                if prev_lap in drs_enabled[driver] and drs_enabled[driver][prev_lap].get(2, False):
-                    return True
-    
-    return False
-# Helper function to load driver photo
-def load_driver_photo(path, size=200):
-    """Load driver photo or create team color placeholder"""
-    try:
-        img = Image.open(path).convert("RGBA")
-        img.thumbnail((size, size), Image.Resampling.LANCZOS)
-        return img
-    except:
-        # Create simple placeholder
-        img = Image.new('RGBA', (size, size), (100, 100, 100, 255))
-        return img
+def drs_index(lap, zone):
+    """DRS_ACTIVE of every driver (last axis) at per-driver laps."""
+    lap = np.where((lap >= 0) & (lap < DRS_ACTIVE.shape[1]), lap, -1)
+    return DRS_ACTIVE[np.arange(len(drivers)), lap, zone]
+
+def drs_track_state(dist_km):
+    """Lap and zone masks (zone 1, zone 2 before the line, zone 2 after it) for distances in km."""
+    dist_m = np.asarray(dist_km, dtype=float) * 1000
+    lap_m = dist_m % TRUE_LEN
+    lap = (dist_m // TRUE_LEN).astype(int) + 1
+    in_zone_1 = (DRS_ZONE_1[0] <= lap_m) & (lap_m <= DRS_ZONE_1[1])
+    in_zone_2 = (DRS_ZONE_2_START[0] <= lap_m) & (lap_m <= DRS_ZONE_2_START[1])
+    in_zone_2_wrap = (DRS_ZONE_2_END[0] <= lap_m) & (lap_m <= DRS_ZONE_2_END[1])
+    return lap, in_zone_1, in_zone_2, in_zone_2_wrap
+
+def check_drs_active(dist_km):
+    """DRS open flag of every driver; dist_km is [..., drivers] aligned with drivers."""
+    lap, in_zone_1, in_zone_2, in_zone_2_wrap = drs_track_state(dist_km)
+    zone_1_on, zone_2_on = drs_index(lap, 1), drs_index(lap, 2)
+    # Zone 2 wraps over the line on the DP2 entry of the previous lap (which, as in the
+    # original dict walk, only counts when the current lap has an entry too)
+    wrap_on = drs_index(lap - 1, 2) & (zone_1_on | zone_2_on)
+    return (lap > 1) & ((in_zone_1 & zone_1_on) | (in_zone_2 & zone_2_on) | (in_zone_2_wrap & wrap_on))
+
+def check_any_drs_active_zone(dist_km):
+    """Whether ANY driver has DRS active in zone 1 / zone 2: [..., 2] for [..., drivers] distances."""
+    lap, in_zone_1, in_zone_2, in_zone_2_wrap = drs_track_state(dist_km)
+    zone_2_on = drs_index(lap, 2)
+    zone_1 = (lap > 1) & in_zone_1 & drs_index(lap, 1)
+    zone_2 = (lap > 1) & zone_2_on & (in_zone_2 | (in_zone_2_wrap & drs_index(lap - 1, 2)))
+    return np.stack([zone_1.any(axis=-1), zone_2.any(axis=-1)], axis=-1)
 
 # =============================
 # MAIN FIGURE (16:9 RATIO)
@@ -480,10 +317,10 @@ ax4.set_facecolor('black')
 ax1.add_patch(plt.Rectangle((1, 1), 98, 98, color='#0a0a0a', alpha=0.95, zorder=0))
 ax1.add_patch(plt.Rectangle((1, 1), 98, 98, color='none', ec='#333', lw=2.5, zorder=1))
 ax1.add_patch(plt.Rectangle((1, 92), 98, 7, color='#1a1a1a', zorder=1))
-ax1.axhline(y=92, color='#FF1E00', linewidth=4, alpha=0.9, zorder=2)
+header_line = ax1.axhline(y=92, color='#FF1E00', linewidth=4, alpha=0.9, zorder=2)
 
 # Header text - SIMPLIFIED (no round info)
-lap_label = ax1.text(4, 94, "F1 2025", color="#ffffff", fontsize=32, weight='heavy', zorder=3)
+lap_label = ax1.text(4, 94, f"F1 {SEASON['season']}", color="#ffffff", fontsize=32, weight='heavy', zorder=3)
 time_label = ax1.text(96, 95, "00:00.000", color="#999", fontsize=20, family='monospace', ha='right', zorder=3)
 
 h_x = [5, 16, 31.5, 50.5, 71, 80, 90]
@@ -492,24 +329,17 @@ header_objs = [ax1.text(x, 89.2, txt, color="#555", fontsize=10.5, weight='bold'
 
 rows = []
 BASE_Y = 86.0
-ROW_SPACING = 4.25
-finish_times = {}
+ROW_SPACING = 85.0 / max(20, len(drivers))   # 4.25; more than 20 drivers squeeze together
 
-# Position animation tracking
-prev_positions = {}
-target_positions = {}
-current_y_positions = {}
+# Position animation smoothing
 POSITION_ANIMATION_SPEED = 0.7
 
 # Gap/Interval update throttling
-gap_update_counter = 0
 GAP_UPDATE_INTERVAL = 12
-cached_gaps = {}
 
-r4_update_counter = 0
 r4_update_interval = 15
 
-for i in range(20):
+for i in range(len(drivers)):
     y = BASE_Y - (i * ROW_SPACING)
     bg = ax1.add_patch(plt.Rectangle((2, y-1.5), 96, 4.0, color='#0d0d0d', alpha=0.6, zorder=1))
     bg_h = ax1.add_patch(plt.Rectangle((2, y-1.5), 96, 4.0, color='#ffffff', alpha=0, zorder=2))
@@ -609,7 +439,7 @@ margin = 50
 ax2.set_xlim(x_coords.min() - margin, x_coords.max() + margin)
 ax2.set_ylim(y_coords.min() - margin, y_coords.max() + margin)
 
-title_main = ax2.text(0.98, 0.82, "FORMULA1 - SEASON 2025", color="white", transform=ax2.transAxes, fontstyle='italic',
+title_main = ax2.text(0.98, 0.82, f"FORMULA1 - SEASON {SEASON['season']}", color="white", transform=ax2.transAxes, fontstyle='italic',
                       fontsize=33, weight='bold', ha='right')
 title_round = ax2.text(0.97, 0.765, "", color="white", transform=ax2.transAxes, fontsize=21, weight='bold', ha='right')
 title_gp = ax2.text(0.97, 0.71, "", color="#6fd2be", transform=ax2.transAxes, fontsize=20, weight='bold', ha='right')
@@ -677,25 +507,37 @@ fig_width_inches = 16
 axes_width_inches = fig_width_inches * (32/160)
 dpi = fig.dpi
 axes_width_pixels = axes_width_inches * dpi
-pixels_per_data_unit = axes_width_pixels / 10
+pixels_per_data_unit = axes_width_pixels / len(INITIAL_TEAM_ORDER)
 desired_logo_pixels = bar_width_team * pixels_per_data_unit
 LOGO_ZOOM_TEAM = desired_logo_pixels / LOGO_SIZE_TEAM
 
 for team in INITIAL_TEAM_ORDER:
-    circular_logo = create_circular_logo(LOGO_PATHS[team], size=LOGO_SIZE_TEAM)
+    circular_logo = create_circular_logo(LOGO_PATHS.get(team), size=LOGO_SIZE_TEAM)
     logo_img = OffsetImage(circular_logo, zoom=LOGO_ZOOM_TEAM)
     ab = AnnotationBbox(logo_img, (0, 0), frameon=False, zorder=5, xycoords='data', box_alignment=(0.5, 0.5))
     logo_boxes_team[team] = ax3.add_artist(ab)
 
-ax3.set_xlim(-0.5, 9.5)
+ax3.set_xlim(-0.5, len(INITIAL_TEAM_ORDER) - 0.5)
 
-stats_boxes_team = {}
-stats_texts_team = {}
-connection_lines_team = {}
-prev_team_positions = {}
-current_team_x_positions = {}
 TEAM_POSITION_ANIMATION_SPEED = 0.5
-pre_race_team_texts = {}
+
+# Artist pools: update() only moves, restyles and hides these. Stats slots are filled top-down
+# in standings order each frame, which keeps the draw order the per-frame artists used to have.
+stats_slots_team = []
+for _ in set(TEAM_MAP.values()):
+    box = ax3.add_patch(FancyBboxPatch((0, 0), 0, 0, boxstyle="round,pad=0.05", edgecolor='none',
+                                       facecolor='black', linewidth=1.4, alpha=0.8, zorder=4, visible=False))
+    name_text = ax3.text(0, 0, "", ha='left', va='center', fontsize=11, weight='bold',
+                         alpha=0.95, zorder=5, visible=False)
+    stats_text = ax3.text(0, 0, "", color='white', ha='left', va='center', fontsize=9,
+                          weight='normal', alpha=0.95, zorder=5, visible=False)
+    line = ax3.add_line(plt.Line2D([0, 0], [0, 0], linewidth=1, alpha=0.6, linestyle='--',
+                                   zorder=2, visible=False))
+    stats_slots_team.append((box, name_text, stats_text, line))
+
+pre_race_team_texts = {team: ax3.text(0, 0, "", color=TEAM_COLORS[team], ha='left', va='bottom',
+                                      fontsize=9, weight='normal', rotation=90, zorder=6, visible=False)
+                       for team in PRE_RACE_TEAM_ORDER}
 
 # =============================
 # REGION 4 SETUP: RACING TRACK
@@ -704,7 +546,7 @@ ax4.axis('off')
 
 # Track constants (in km)
 TRACK_LENGTH_KM = 1.75
-TOTAL_RACE_KM = 41.4696
+TOTAL_RACE_KM = (TRUE_LEN * LAPS) / 1000
 LEADER_POSITION_KM = 1.6  # Leader stays at this position on track during race
 
 # Layout constants (normalized 0-1 within Region 4)
@@ -770,8 +612,10 @@ P1_GRID_CENTER = (21/80 + 30/80) / 2  # Center of P1 grid position
 start_finish_line = ax4.add_patch(Rectangle((P1_GRID_CENTER - 0.002, LANE_START), 0.004, 
                                             LANE_HEIGHT * 3, color='white', zorder=15, alpha=0.5))
 
-# Progress bars storage
-progress_bars = {d: None for d in TOP_DRIVERS}
+# Progress bars (from left border to car position)
+progress_bars = {d: ax4.add_patch(Rectangle((LEFT_BORDER_W, 0), 0, 0, color=TEAM_COLORS[DRIVER_TEAMS[d]],
+                                            alpha=0.4, zorder=4, visible=False))
+                 for d in TOP_DRIVERS}
 
 # Driver card elements
 driver_cards = {}
@@ -817,11 +661,7 @@ for driver in TOP_DRIVERS:
                             xycoords='data', box_alignment=(0.5, 0.5))
     driver_car_images[driver] = ax4.add_artist(car_box)
 
-# Animation state
-track_scroll_offset = 0
-finish_line_x = None  # Will move from right when race is ending
-start_line_x = P1_GRID_CENTER  # Track start line position for smooth transition
-start_line_target_x = P1_GRID_CENTER  # Target position for start line
+# Start line eases between the grid and the left border
 START_LINE_TRANSITION_SPEED = 0.15  # Slower transition for smoother movement
 
 # Points display (at car tip instead of card)
@@ -853,143 +693,335 @@ for driver in TOP_DRIVERS:
 
 def calculate_podium_finishes(driver_surname, completed_rounds):
     """Calculate number of 1st, 2nd, 3rd finishes for a driver (only completed rounds)"""
-    first = second = third = 0
-    for round_num in range(1, completed_rounds + 1):
-        if round_num in HISTORICAL_PODIUMS:
-            podium = HISTORICAL_PODIUMS[round_num]
-            if len(podium) > 0 and podium[0] == driver_surname:
-                first += 1
-            if len(podium) > 1 and podium[1] == driver_surname:
-                second += 1
-            if len(podium) > 2 and podium[2] == driver_surname:
-                third += 1
-    return first, second, third
+    if driver_surname not in SURNAME_MAP:
+        return 0, 0, 0
+    first, second, third = DRIVER_CUM_PODIUMS[stats_row(completed_rounds), STAT_DRIVERS.index(driver_surname)]
+    return int(first), int(second), int(third)
 
 print("✔ Region 4 racing track setup complete")
 
 # =============================
-# ANIMATION UPDATE
+# FRAME STATE COMPILER
 # =============================
+# Everything update() needs that is not matplotlib (standings, throttled gaps, DRS, team points,
+# podium stats, smoothed row/bar positions, Region 4 scroll) is computed here in one pass over
+# the race table and stored per frame. update() then only looks values up and sets artists, so
+# any frame can be drawn on its own, in any process, without replaying the frames before it.
 START_DELAY_FRAMES = int(5 * 5)
+RENDER_SEED = 2025  # Gap flicker is seeded per frame so any frame renders the same in any process
+FRAME_STATE_PATH = f"frame_state_{SEASON['season']}.npz"
+
+# Constructor order used by the old groupby; ties in the constructor sort keep this order
+TEAM_ORDER = sorted(set(TEAM_MAP.values()))
+
+# Gap/interval cell kinds
+GAP_VALUE, GAP_LEADER, GAP_FINISHED, GAP_FINISH_CLOCK = 0, 1, 2, 3
+
+TITLE_COLORS = glow_colors + ['white']
+STRIPE_COLORS = [('#ce161b', 'white'), ('#169cc5', 'white'), ('#efd035', 'black')]
+CARD_POSITIONS = {
+    0: LEFT_BORDER_W,  # P1 at left
+    1: LEFT_BORDER_W + (TRACK_LENGTH_NORM / 2) - (CARD_WIDTH_NORM / 2),  # P2 at center
+    2: LEFT_BORDER_W + TRACK_LENGTH_NORM - CARD_WIDTH_NORM  # P3 at right
+}
+P1_CAR_OFFSET = -0.015  # Grid cars sit this far behind the line
+GRID_CAR_X = {
+    0: P1_GRID_CENTER + P1_CAR_OFFSET,  # 1st place behind line
+    1: ((12/80 + 21/80) / 2) + P1_CAR_OFFSET,  # 2nd place behind line
+    2: ((3/80 + 12/80) / 2) + P1_CAR_OFFSET    # 3rd place behind line
+}
+
+def load_distance_matrix():
+    """Distance of every driver at every race time, [len(race_times), drivers]."""
+    return np.asarray(race_distance_km[::SKIP_VAL], dtype=float)
+
+def forward_fill_index(is_set):
+    """For each row, the index of the last row <= it where is_set is True (-1 if none)."""
+    idx = np.where(is_set, np.arange(len(is_set)).reshape(-1, *([1] * (is_set.ndim - 1))), -1)
+    return np.maximum.accumulate(idx, axis=0)
+
+def compile_frame_state(n_frames):
+    """Compute every per-frame value update() needs for frames [0, n_frames)."""
+    frame = np.arange(n_frames)
+    driver_list = list(drivers)
+    n_drivers = len(driver_list)
+
+    # ----- Frame timing -----
+    race_frame = frame - START_DELAY_FRAMES
+    is_countdown = frame < START_DELAY_FRAMES
+    is_pre_race = race_frame < pre_race_frames
+    is_race = ~is_pre_race
+    t_idx = np.clip(race_frame - pre_race_frames, 0, len(race_times) - 1)
+    t = race_times[t_idx]
+
+    dist = load_distance_matrix()[t_idx]
+
+    # ----- Standings -----
+    order = running_order(dist)
+    order[is_pre_race] = [driver_list.index(d) for d in GRID_DATA]
+    row_dist = np.take_along_axis(dist, order, axis=1)
+    leader_dist = row_dist[:, 0]
+
+    leader_finished = leader_dist >= TOTAL_RACE_DIST
+    raw_progress = (leader_dist * 1000) / ROUND_DIST
+    completed_rounds = np.maximum(0, raw_progress.astype(int))
+    current_round = completed_rounds + 1
+    round_progress = raw_progress - completed_rounds
+    lap = np.minimum(LAPS, ((leader_dist * 1000) // TRUE_LEN).astype(int) + 1)
+    sector = np.minimum(2, ((leader_dist * 1000) % TRUE_LEN) // (TRUE_LEN / 3)).astype(np.int8)   # sector the leader is in
+
+    # Podium animation
+    popup = np.array([smooth_transition(p, 0.15, 0.70, 0.98) for p in round_progress])
+    p_reveal = np.column_stack([np.clip((round_progress - start) / 0.08, 0, 1) for start in (0.70, 0.78, 0.86)])
+
+    # ----- Per driver values -----
+    pts = get_all_pts(race_times[t_idx])
+
+    d_lap = ((dist * 1000) // TRUE_LEN).astype(int) + 1
+    drs = check_drs_active(dist)
+    drs_zone = check_any_drs_active_zone(dist)
+
+    finished = dist >= TOTAL_RACE_DIST
+
+    # ----- Region 1: smoothed row positions (moved on the gap throttle) -----
+    gap_update = frame % GAP_UPDATE_INTERVAL == 0
+    target_y = np.empty((n_frames, n_drivers))
+    np.put_along_axis(target_y, order, BASE_Y - (np.arange(n_drivers) * ROW_SPACING), axis=1)
+    driver_y = np.empty_like(target_y)
+    current_y = target_y[0].copy()
+    for f in np.flatnonzero(gap_update):
+        current_y = current_y + ((target_y[f] - current_y) * POSITION_ANIMATION_SPEED)
+        driver_y[f] = current_y
+    driver_y = driver_y[forward_fill_index(gap_update)]
+
+    # ----- Region 1: gap / interval cells -----
+    finished_in_race = finished & is_race[:, None]
+    finish_frame = np.argmax(finished_in_race, axis=0)
+    finish_time = np.where(finished_in_race.any(axis=0), t[finish_frame], np.nan)
+    row_finish = finish_time[order]
+
+    row_finished = np.take_along_axis(finished, order, axis=1)
+    row_gap = (leader_dist[:, None] - row_dist) * 16.646
+    row_int = np.zeros_like(row_gap)
+    row_int[:, 1:] = (row_dist[:, :-1] - row_dist[:, 1:]) * 16.646
+    row_kind = np.full(row_gap.shape, GAP_VALUE, dtype=np.int8)
+    row_kind[:, 0] = GAP_LEADER
+    row_kind[row_finished] = GAP_FINISHED
+    row_gap[row_finished] = (row_finish - row_finish[:, :1])[row_finished]
+    row_kind[:, 0][row_finished[:, 0]] = GAP_FINISH_CLOCK
+    row_gap[:, 0][row_finished[:, 0]] = row_finish[:, 0][row_finished[:, 0]]
+
+    # Gaps are only recomputed on the throttle; leader/finished cells always refresh.
+    # Track the cache per driver, like the old cached_gaps dict, then read it back by row.
+    def by_driver(values):
+        out = np.empty_like(values)
+        np.put_along_axis(out, order, values, axis=1)
+        return out
+    kind_d, gap_d, int_d = by_driver(row_kind), by_driver(row_gap), by_driver(row_int)
+    first_race_frame = frame == START_DELAY_FRAMES + pre_race_frames
+    refresh = is_race[:, None] & ((kind_d != GAP_VALUE) | gap_update[:, None] | first_race_frame[:, None])
+    src = np.maximum(forward_fill_index(refresh), 0)
+    cols = np.arange(n_drivers)
+    kind_d, gap_d, int_d = kind_d[src, cols], gap_d[src, cols], int_d[src, cols]
+
+    # ----- Region 1: points, stats, podium highlight -----
+    surnames = [d.split()[-1].upper() for d in driver_list]
+    driver_counts = DRIVER_CUM_PODIUMS[stats_row(completed_rounds)]
+    driver_counts = driver_counts[:, [STAT_DRIVERS.index(s) for s in surnames]]
+    wins, pods = driver_counts[..., 0], driver_counts.sum(axis=2)
+    podium_pos = np.full((current_round.max() + 1, n_drivers), -1, dtype=np.int8)
+    for rnd, podium in HISTORICAL_PODIUMS.items():
+        if rnd < len(podium_pos):
+            for pos, surname in enumerate(podium):
+                podium_pos[rnd, surnames.index(surname)] = pos
+
+    # ----- Region 2 -----
+    countdown_time = np.where(is_countdown, frame / 5.0,
+                              np.where(is_pre_race, 5.0 + (race_frame / TARGET_UI_FPS), 20.0))
+    round_num = ((leader_dist * 1000) // ROUND_DIST).astype(int) + 1
+    row_px = np.minimum(np.searchsorted(cum_dist, (row_dist % (TRUE_LEN/1000)) * 1000), len(points)-1)
+
+    # Title colour and track style are only set in some phases and hold otherwise
+    title_color = np.where(leader_finished, 3, np.where(is_race & (round_num <= ROUNDS), sector, -1))
+    title_color = np.concatenate([[3], title_color])[forward_fill_index(title_color >= 0) + 1]
+    track_style = np.where(leader_finished, 2, np.where(is_race & (round_num > ROUNDS), 1, -1))
+    track_style = np.concatenate([[0], track_style])[forward_fill_index(track_style >= 0) + 1]
+
+    # ----- Region 3: constructors -----
+    team_idx = np.array([TEAM_ORDER.index(TEAM_MAP[d]) for d in driver_list])
+    team_pts = np.zeros((n_frames, len(TEAM_ORDER)))
+    for i in range(n_drivers):
+        team_pts[:, team_idx[i]] += pts[:, i]
+    for rnd, adjustments in TEAM_ADJUSTMENTS.items():
+        for team, adjustment in adjustments.items():
+            team_pts[current_round == rnd, TEAM_ORDER.index(team)] += adjustment
+    team_order = np.argsort(-team_pts, axis=1, kind='stable')
+    team_rank = np.empty_like(team_order)
+    np.put_along_axis(team_rank, team_order, np.arange(len(TEAM_ORDER)), axis=1)
+
+    team_x = np.zeros_like(team_pts)
+    race_frames = np.flatnonzero(is_race)
+    if len(race_frames):
+        current_x = team_rank[race_frames[0]].astype(float)
+        for f in race_frames:
+            current_x = current_x + ((team_rank[f] - current_x) * TEAM_POSITION_ANIMATION_SPEED)
+            team_x[f] = current_x
+
+    team_counts = TEAM_CUM_PODIUMS[stats_row(current_round - 1)]
+    team_counts = team_counts[:, [STAT_TEAMS.index(team) for team in TEAM_ORDER]]
+    team_wins, team_pods = team_counts[..., 0], team_counts.sum(axis=2)
+
+    # ----- Region 4: racing strip -----
+    top_idx = [driver_list.index(d) for d in TOP_DRIVERS]
+    top_dist = dist[:, top_idx]
+    top3 = np.argsort(-top_dist, axis=1, kind='stable')[:, :3]
+    in_top3 = np.zeros(top_dist.shape, dtype=bool)
+    np.put_along_axis(in_top3, top3, True, axis=1)
+    top_rank = np.argsort(np.argsort(-top_dist, axis=1, kind='stable'), axis=1)
+
+    leader_km = np.take_along_axis(top_dist, top3[:, :1], axis=1)[:, 0]
+    scrolling = leader_km > LEADER_POSITION_KM
+    track_offset_km = np.where(scrolling, leader_km - LEADER_POSITION_KM, 0)
+    leader_x = np.where(scrolling, LEFT_BORDER_W + ((LEADER_POSITION_KM / TRACK_LENGTH_KM) * TRACK_LENGTH_NORM),
+                        LEFT_BORDER_W + ((leader_km / TRACK_LENGTH_KM) * TRACK_LENGTH_NORM))
+
+    # Border stripes: sector of the visible track under each stripe
+    stripe_km = track_offset_km[:, None] + ((np.arange(num_stripes) / num_stripes) * TRACK_LENGTH_NORM / TRACK_LENGTH_NORM) * TRACK_LENGTH_KM
+    position_in_round = stripe_km % 5.1837
+    sector_len = 5.1837 / 3
+    stripe_sector = np.where(position_in_round < sector_len, 0, np.where(position_in_round < 2 * sector_len, 1, 2)).astype(np.int8)
+
+    # Start/finish line: the lap line closest to the leader inside the visible window
+    start_line_x = np.empty(n_frames)
+    line_x = P1_GRID_CENTER
+    for f in range(n_frames):
+        target = P1_GRID_CENTER if is_pre_race[f] else LEFT_BORDER_W
+        line_x += (target - line_x) * START_LINE_TRANSITION_SPEED
+        start_line_x[f] = line_x
+
+    lap_lines = np.array([n * 5.1837 for n in range(20)])
+    in_window = ((track_offset_km[:, None] - 0.5 <= lap_lines) & (lap_lines <= track_offset_km[:, None] + TRACK_LENGTH_KM + 0.5))
+    closest = np.argmin(np.where(in_window, np.abs(lap_lines - leader_km[:, None]), np.inf), axis=1)
+    line_pos = LEFT_BORDER_W + (((lap_lines[closest] - track_offset_km) / TRACK_LENGTH_KM) * TRACK_LENGTH_NORM)
+    line_shown = in_window.any(axis=1) & (LEFT_BORDER_W <= line_pos) & (line_pos <= LEFT_BORDER_W + TRACK_LENGTH_NORM)
+    finishing = leader_km >= (TOTAL_RACE_KM - 0.3)
+    finish_x = 1.0 - (((0.3 - (TOTAL_RACE_KM - leader_km)) / 0.3) * (1.0 - leader_x))
+    sf_x = np.where(is_pre_race, start_line_x, np.where(finishing, finish_x, line_pos)) - 0.002
+    sf_alpha = np.where(is_pre_race | finishing | line_shown, 1.0, 0.0)
+
+    # Cars and cards only move on the Region 4 throttle (every frame before the start) and keep
+    # their last placement in between; a driver who drops out of the top 3 stays hidden until
+    # the next placement.
+    r4_update = is_pre_race | (frame % r4_update_interval == 0)
+    r4_src = np.maximum(forward_fill_index(r4_update), 0)
+    out_count = np.cumsum(~in_top3, axis=0)
+    out_before = np.where(r4_src[:, None] > 0, out_count[r4_src - 1], 0)
+    r4_visible = in_top3 & (out_count - out_before == 0)
+
+    car_x = LEFT_BORDER_W + (((top_dist - track_offset_km[:, None]) / TRACK_LENGTH_KM) * TRACK_LENGTH_NORM)
+    car_x = np.maximum(LEFT_BORDER_W, np.minimum(car_x, LEFT_BORDER_W + TRACK_LENGTH_NORM))
+    grid_x = np.array([GRID_CAR_X[r] if r < 3 else 0 for r in range(len(TOP_DRIVERS))])[top_rank]
+    car_x = np.where(is_pre_race[:, None], grid_x, car_x)
+    top_drs = drs[:, top_idx]
+    top_pts = pts[:, top_idx].astype(int)
+    top_podiums = DRIVER_CUM_PODIUMS[stats_row(completed_rounds)]
+    top_podiums = top_podiums[:, [STAT_DRIVERS.index(DRIVER_NAME_MAP[d]) for d in TOP_DRIVERS]]
+
+    return {
+        "t": t, "is_pre_race": is_pre_race, "is_countdown": is_countdown,
+        "leader_dist": leader_dist, "leader_finished": leader_finished, "lap": lap, "sector": sector,
+        "current_round": current_round, "popup": popup, "p_reveal": p_reveal,
+        "row_driver": order.astype(np.int8), "row_y": np.take_along_axis(driver_y, order, axis=1),
+        "row_dist": row_dist, "row_px": row_px.astype(np.int32),
+        "row_kind": np.take_along_axis(kind_d, order, axis=1),
+        "row_gap": np.take_along_axis(gap_d, order, axis=1),
+        "row_int": np.take_along_axis(int_d, order, axis=1),
+        "row_finished": row_finished,
+        "row_lap": np.take_along_axis(d_lap, order, axis=1).astype(np.int16),
+        "row_drs": np.take_along_axis(drs & is_race[:, None] & ~finished, order, axis=1),
+        "row_pts": np.take_along_axis(pts, order, axis=1).astype(int),
+        "row_wins": np.take_along_axis(wins, order, axis=1),
+        "row_pods": np.take_along_axis(pods, order, axis=1),
+        "row_podium": np.take_along_axis(podium_pos[current_round], order, axis=1),
+        "countdown_time": countdown_time, "round_num": round_num,
+        "title_color": title_color, "track_style": track_style, "drs_zone": drs_zone,
+        "team_pts": team_pts, "team_order": team_order, "team_x": team_x,
+        "team_wins": team_wins, "team_pods": team_pods,
+        "stripe_sector": stripe_sector, "sf_x": sf_x, "sf_alpha": sf_alpha,
+        "r4_visible": r4_visible, "r4_race": ~is_pre_race[r4_src],
+        "r4_rank": top_rank[r4_src], "r4_car_x": car_x[r4_src],
+        "r4_drs": top_drs[r4_src], "r4_points": top_pts[r4_src], "r4_podiums": top_podiums[r4_src],
+    }
+
+def load_frame_state(n_frames):
+    """Load the compiled frame state, recompiling when it is missing, too short or stale."""
+    inputs = [RACE_CSV, frames_path("distance_km"), DRS_LOG_PATH, season_path(SEASON["season"]), __file__]
+    if os.path.exists(FRAME_STATE_PATH):
+        newest_input = max(os.path.getmtime(p) for p in inputs if os.path.exists(p))
+        if os.path.getmtime(FRAME_STATE_PATH) >= newest_input:
+            with np.load(FRAME_STATE_PATH) as data:
+                state = dict(data)
+            if len(state["t"]) >= n_frames:
+                return state
+
+    state = compile_frame_state(n_frames)
+    np.savez_compressed(FRAME_STATE_PATH, **state)
+    print(f"✔ Frame state compiled: {n_frames} frames → {FRAME_STATE_PATH}")
+    return state
+
+# =============================
+# ANIMATION UPDATE
+# =============================
+track_style_applied = 0  # lc_sector colours are only pushed when the style changes
 
 def update(frame):
-    # Declare all global variables at the start
-    global gap_update_counter, cached_gaps, prev_positions, target_positions, current_y_positions
-    global prev_team_positions, current_team_x_positions, pre_race_team_texts
-    global track_scroll_offset, finish_line_x, start_line_x, start_line_target_x
-    global r4_update_counter  
-
-    # Determine time and race state
-    if frame < START_DELAY_FRAMES:
-        t = times[0]
-        is_countdown = True
-        is_pre_race = True
-    else:
-        race_frame = frame - START_DELAY_FRAMES
-        if race_frame < pre_race_frames:
-            t = times[race_frame]
-            is_pre_race = True
-            is_countdown = False
-        else:
-            idx = race_frame - pre_race_frames
-            if idx >= len(race_times):
-                idx = len(race_times) - 1
-            t = race_times[idx]
-            is_pre_race = False
-            is_countdown = False
-    
-    snap = race_dict[t].set_index("driver")
-    
+    global track_style_applied
+
+    fs = frame_state
+    rng = np.random.default_rng([RENDER_SEED, frame])
+
+    t = fs["t"][frame]
+    is_pre_race = fs["is_pre_race"][frame]
+    is_countdown = fs["is_countdown"][frame]
+    leader_dist = fs["leader_dist"][frame]
+    leader_finished = fs["leader_finished"][frame]
+    current_round = fs["current_round"][frame]
+
     # ==================
     # REGION 1: LEADERBOARD
     # ==================
-    
+
     if is_pre_race:
-        standings = snap.reindex(GRID_DATA.keys())
         lap_label.set_text("GRID PREVIEW")
         time_label.set_text("T=")
         header_objs[5].set_text("Q")
         header_objs[6].set_text("EVT")
     else:
-        standings = snap.sort_values("distance_km", ascending=False)
         header_objs[5].set_text("W")
         header_objs[6].set_text("POD")
-    
-    leader_dist = standings.iloc[0]["distance_km"]
-    leader_finished = leader_dist >= TOTAL_RACE_DIST
-    
-    raw_progress = (leader_dist * 1000) / ROUND_DIST
-    completed_rounds = max(0, int(raw_progress))
-    current_round = completed_rounds + 1
-    round_progress = raw_progress - completed_rounds
-    
-    if not is_pre_race:
-        lap = min(8, int((leader_dist * 1000) // TRUE_LEN) + 1)
-        lap_label.set_text(f"LAP {lap}/8")
+        lap_label.set_text(f"LAP {fs['lap'][frame]}/{LAPS}")
         mins, secs = divmod(t, 60)
         time_label.set_text(f"T={int(mins):02d}:{int(secs):02d}.{int((secs % 1) * 1000):03d}")
-    
-    # Gap update throttling
-    should_update_gaps = (gap_update_counter % GAP_UPDATE_INTERVAL == 0)
-    gap_update_counter += 1
-    
+
     # Podium animation
-    popup_intensity = smooth_transition(round_progress, 0.15, 0.70, 0.98)
-    p1_reveal = max(0, min(1, (round_progress - 0.70) / 0.08))
-    p2_reveal = max(0, min(1, (round_progress - 0.78) / 0.08))
-    p3_reveal = max(0, min(1, (round_progress - 0.86) / 0.08))
-    p_reveals = [p1_reveal, p2_reveal, p3_reveal]
+    popup_intensity = fs["popup"][frame]
+    p_reveals = fs["p_reveal"][frame]
     p_colors = ['#FFD700', '#C0C0C0', '#CD7F32']
-    
-    stats_data = get_historical_stats(completed_rounds)
-    current_podium = HISTORICAL_PODIUMS.get(current_round, [])
-    
-    # Position tracking for smooth animation
-    for idx, d in enumerate(standings.index):
-        new_pos = idx + 1
-        if d not in prev_positions:
-            prev_positions[d] = new_pos
-            current_y_positions[d] = BASE_Y - (idx * ROW_SPACING)
-        target_positions[d] = BASE_Y - (idx * ROW_SPACING)
-    
-    for idx, (d, row) in enumerate(standings.iterrows()):
+
+    for idx in range(len(drivers)):
         r = rows[idx]
-        surname = d.split()[-1].upper()
+        d = drivers[fs["row_driver"][frame, idx]]
         name_code = NAME_CODES.get(d, d[:3].upper())
-        dist_km = row["distance_km"]
-        time_s = row["time_sec"]
-        is_finished = dist_km >= TOTAL_RACE_DIST
+        is_finished = fs["row_finished"][frame, idx]
         driver_color = COLORS.get(d, "#fff")
-        
-        # DRS check
-        lap_m = (dist_km * 1000) % TRUE_LEN
-        d_lap = int((dist_km * 1000) // TRUE_LEN) + 1
-        has_drs = False
-        if not is_pre_race and not is_finished and d_lap > 1:
-            has_drs = check_drs_active(d, lap_m, d_lap)
-        
-        # SMOOTH POSITION ANIMATION (synchronized with gap updates)
-        if d in current_y_positions and d in target_positions:
-            current_y = current_y_positions[d]
-            target_y = target_positions[d]
-            
-            # Only update position every 6 frames (same as gaps)
-            if should_update_gaps:
-                diff = target_y - current_y
-                current_y_positions[d] = current_y + (diff * POSITION_ANIMATION_SPEED)
-            
-            current_y = current_y_positions[d]
-        else:
-            current_y = BASE_Y - (idx * ROW_SPACING)
-            current_y_positions[d] = current_y
-        
-        position_changed = (prev_positions.get(d, idx+1) != idx+1)
-        
+        has_drs = fs["row_drs"][frame, idx]
+        current_y = fs["row_y"][frame, idx]
+
         r['bg'].set_xy((2, current_y - 1.5))
         r['bg_highlight'].set_xy((2, current_y - 1.5))
         r['border'].set_xy((2, current_y - 1.5))
         r['cbar'].set_xy((12.2, current_y - 1.5))
-        
+
         r['pos'].set_y(current_y)
         r['name'].set_y(current_y)
         r['gap'].set_y(current_y)
@@ -997,7 +1029,7 @@ def update(frame):
         r['pts'].set_y(current_y)
         r['wins'].set_y(current_y)
         r['pod'].set_y(current_y)
-        
+
         # Reset
         r['bg_highlight'].set_alpha(0)
         r['border'].set_edgecolor('#222')
@@ -1007,174 +1039,132 @@ def update(frame):
         r['bg'].set_alpha(0.6)
         r['gap'].set_color('#aaa')
         r['int'].set_color('#aaa')
-        
+
         r['pos'].set_text(f"{idx+1}")
         r['name'].set_text(name_code)
         r['name'].set_color(driver_color)
         r['cbar'].set_color(driver_color)
-        
+
         if is_pre_race:
             r['gap'].set_text("—")
             r['int'].set_text("—")
             r['pts'].set_text("0")
             r['wins'].set_text(f"{GRID_DATA[d][0]}")
             r['pod'].set_text(f"{GRID_DATA[d][1]}")
+            continue
+
+        r['pts'].set_text(f"{fs['row_pts'][frame, idx]}")
+        r['wins'].set_text(f"{fs['row_wins'][frame, idx]}")
+        r['pod'].set_text(f"{fs['row_pods'][frame, idx]}")
+
+        # Gap / interval cells (throttled values are already held in the frame state)
+        kind = fs["row_kind"][frame, idx]
+        gap_val = fs["row_gap"][frame, idx]
+        if kind == GAP_FINISH_CLOCK:
+            m, s = divmod(gap_val, 60)
+            gap_text, int_text = f"{int(m):02d}:{s:06.3f}", "FINISHED"
+        elif kind == GAP_FINISHED:
+            gap_text, int_text = f"+{gap_val:.3f}", "FINISHED"
+        elif kind == GAP_LEADER:
+            gap_text, int_text = "LEADER", "—"
         else:
-            r['pts'].set_text(f"{int(get_pts(d, time_s))}")
-            r['wins'].set_text(f"{stats_data[surname]['wins']}")
-            r['pod'].set_text(f"{stats_data[surname]['pods']}")
-            
-            if is_finished:
-                if d not in finish_times:
-                    finish_times[d] = t
-                if idx == 0:
-                    m, s = divmod(finish_times[d], 60)
-                    gap_text = f"{int(m):02d}:{s:06.3f}"
-                else:
-                    time_delta = finish_times[d] - finish_times[standings.index[0]]
-                    gap_text = f"+{time_delta:.3f}"
-                int_text = "FINISHED"
-                r['gap'].set_text(gap_text)
-                r['int'].set_text(int_text)
-                cached_gaps[d] = {'gap': gap_text, 'int': int_text}
+            # +LAP logic
+            if gap_val > TIME:
+                laps_down = int(gap_val / TIME)
+                gap_text = f"+{laps_down} LAP" if laps_down == 1 else f"+{laps_down} LAPS"
             else:
-                if idx == 0:
-                    gap_text = "LEADER"
-                    int_text = "—"
-                    r['gap'].set_text(gap_text)
-                    r['int'].set_text(int_text)
-                    cached_gaps[d] = {'gap': gap_text, 'int': int_text}
-                else:
-                    # Calculate/update gaps on throttle
-                    if should_update_gaps or d not in cached_gaps:
-                        dist_gap = leader_dist - dist_km
-                        time_gap = dist_gap * 16.646
-                        
-                        # +LAP logic
-                        if time_gap > TIME:
-                            laps_down = int(time_gap / TIME)
-                            gap_text = f"+{laps_down} LAP" if laps_down == 1 else f"+{laps_down} LAPS"
-                        else:
-                            gap_text = f"+{time_gap:.3f}"
-                        
-                        prev_dist = standings.iloc[idx-1]["distance_km"]
-                        int_gap = prev_dist - dist_km
-                        int_time = int_gap * 16.646
-                        int_text = f"+{int_time:.3f}"
-                        
-                        cached_gaps[d] = {'gap': gap_text, 'int': int_text}
-                    
-                    r['gap'].set_text(cached_gaps[d]['gap'])
-                    r['int'].set_text(cached_gaps[d]['int'])
-                
-                # Add subtle flicker to gaps after leader finishes
-                if leader_finished and idx > 0 and not is_finished:
-                    if d in cached_gaps:
-                        if 'LAP' not in cached_gaps[d]['gap']:
-                            gap_str = cached_gaps[d]['gap']
-                            if gap_str.startswith('+'):
-                                try:
-                                    base_gap = float(gap_str[1:])
-                                    if base_gap < TIME:
-                                        jitter = (np.random.random() - 0.5) * 0.006
-                                        flickered_gap = base_gap + jitter
-                                        r['gap'].set_text(f"+{flickered_gap:.3f}")
-                                except:
-                                    pass
-                        
-                        int_str = cached_gaps[d]['int']
-                        if int_str.startswith('+'):
-                            try:
-                                base_int = float(int_str[1:])
-                                jitter = (np.random.random() - 0.5) * 0.006
-                                flickered_int = base_int + jitter
-                                r['int'].set_text(f"+{flickered_int:.3f}")
-                            except:
-                                pass
-                
-                # DRS HIGHLIGHTING
-                if has_drs:
-                    r['gap'].set_color('#00fb0c')
-                    r['int'].set_color('#00fb0c')
-                
-                # Last lap highlight
-                if d_lap >= 8:
-                    r['border'].set_edgecolor('#C5C6C7')
-                    r['border'].set_linewidth(1.5)
-                
-                # Podium animation
-                if surname in current_podium and not leader_finished:
-                    pod_pos = current_podium.index(surname)
-                    base_alpha = 0.08 * popup_intensity
-                    
-                    if p_reveals[pod_pos] > 0:
-                        r['bg_highlight'].set_color(p_colors[pod_pos])
-                        r['bg_highlight'].set_alpha(base_alpha + 0.18 * p_reveals[pod_pos])
-                    else:
-                        if not has_drs:
-                            r['bg_highlight'].set_color('#ffffff')
-                            r['bg_highlight'].set_alpha(base_alpha)
-                    
-                    size_boost = popup_intensity * 2.5
-                    r['name'].set_fontsize(15 + size_boost)
-                    r['name'].set_weight('heavy' if popup_intensity > 0.5 else 'bold')
-    
-    # Update previous positions
-    for idx, d in enumerate(standings.index):
-        prev_positions[d] = idx + 1
-    
-    # ==================
-    # REGION 2: TRACK MAP
-    # ==================
+                gap_text = f"+{gap_val:.3f}"
+            int_text = f"+{fs['row_int'][frame, idx]:.3f}"
+        r['gap'].set_text(gap_text)
+        r['int'].set_text(int_text)
+
+        if is_finished:
+            continue
+
+        # Add subtle flicker to gaps after leader finishes
+        if leader_finished and idx > 0:
+            if 'LAP' not in gap_text:
+                if gap_text.startswith('+'):
+                    try:
+                        base_gap = float(gap_text[1:])
+                        if base_gap < TIME:
+                            jitter = (rng.random() - 0.5) * 0.006
+                            flickered_gap = base_gap + jitter
+                            r['gap'].set_text(f"+{flickered_gap:.3f}")
+                    except:
+                        pass
+
+            if int_text.startswith('+'):
+                try:
+                    base_int = float(int_text[1:])
+                    jitter = (rng.random() - 0.5) * 0.006
+                    flickered_int = base_int + jitter
+                    r['int'].set_text(f"+{flickered_int:.3f}")
+                except:
+                    pass
+
+        # DRS HIGHLIGHTING
+        if has_drs:
+            r['gap'].set_color('#00fb0c')
+            r['int'].set_color('#00fb0c')
+
+        # Last lap highlight
+        if fs["row_lap"][frame, idx] >= 8:
+            r['border'].set_edgecolor('#C5C6C7')
+            r['border'].set_linewidth(1.5)
+
+        # Podium animation
+        pod_pos = fs["row_podium"][frame, idx]
+        if pod_pos >= 0 and not leader_finished:
+            base_alpha = 0.08 * popup_intensity
+
+            if p_reveals[pod_pos] > 0:
+                r['bg_highlight'].set_color(p_colors[pod_pos])
+                r['bg_highlight'].set_alpha(base_alpha + 0.18 * p_reveals[pod_pos])
+            else:
+                if not has_drs:
+                    r['bg_highlight'].set_color('#ffffff')
+                    r['bg_highlight'].set_alpha(base_alpha)
+
+            size_boost = popup_intensity * 2.5
+            r['name'].set_fontsize(15 + size_boost)
+            r['name'].set_weight('heavy' if popup_intensity > 0.5 else 'bold')
+    profile_phase("region1")
+
     # ==================
     # REGION 2: TRACK MAP
     # ==================
-    
-    # Calculate countdown time for starting lights
-    if frame < START_DELAY_FRAMES:
-        countdown_time = frame / 5.0  # 5 FPS during countdown
-    elif is_pre_race:
-        countdown_time = 7.0 + ((frame - START_DELAY_FRAMES) / TARGET_UI_FPS)
-    else:
-        countdown_time = 10.0  # Well past pre-race
-    
+
     # ===== STARTING LIGHTS ANIMATION =====
-    # Calculate proper countdown time (0 to 7 seconds during pre-race)
-    if frame < START_DELAY_FRAMES:
-        countdown_time = frame / 5.0  # 0 to 5s during START_DELAY
-    else:
-        race_frame = frame - START_DELAY_FRAMES
-        if race_frame < pre_race_frames:
-            countdown_time = 5.0 + (race_frame / TARGET_UI_FPS)  # 5s to 12s during pre-race
-        else:
-            countdown_time = 20.0  # Well past pre-race
-    
-    if countdown_time < 12.0:  # Changed from 7.0 to 12.0
+    # 0 to 5s during START_DELAY, 5s to 12s during pre-race
+    countdown_time = fs["countdown_time"][frame]
+
+    if countdown_time < 12.0:
         # Show starting lights during pre-race
         title_round.set_alpha(0)
         title_gp.set_alpha(0)
-        
+
         for light_panel in starting_lights:
             light_on_time = light_panel['light_time']
-            
+
             # Show the frame and top circle always during countdown
             light_panel['frame'].set_alpha(1)
             light_panel['top_circle'].set_alpha(0.3)
-            
+
             if countdown_time >= light_on_time and countdown_time < 6.75:
                 # Light is ON (red)
                 light_panel['bottom_circle'].set_facecolor('#ff0000')
                 light_panel['bottom_circle'].set_edgecolor('#ff4444')
                 light_panel['bottom_circle'].set_alpha(1)
                 light_panel['glow'].set_alpha(0.6)
-                
+
             elif countdown_time >= 6.75 and countdown_time < 12.0:
                 # All lights GO OFF (race start signal) - panels still visible
                 light_panel['bottom_circle'].set_facecolor('#1a1a1a')
                 light_panel['bottom_circle'].set_edgecolor('#333')
                 light_panel['bottom_circle'].set_alpha(1)
                 light_panel['glow'].set_alpha(0)
-                
+
             else:
                 # Light not yet activated (dimmed)
                 light_panel['bottom_circle'].set_facecolor('#2a2a2a')
@@ -1188,39 +1178,38 @@ def update(frame):
             light_panel['top_circle'].set_alpha(0)
             light_panel['bottom_circle'].set_alpha(0)
             light_panel['glow'].set_alpha(0)
-        
+
         title_round.set_alpha(1)
         title_gp.set_alpha(1)
-    
+
     # ===== SECTOR GLOW AND COLOR LOGIC =====
-    curr_round_num = int((leader_dist * 1000) // (TRUE_LEN / 3)) + 1
-    rnd_clamped = min(24, curr_round_num)
-    active_sec = (rnd_clamped - 1) % 3
-    
+    curr_round_num = fs["round_num"][frame]
+    rnd_clamped = min(ROUNDS, curr_round_num)
+    active_sec = fs["sector"][frame]
+
+    track_style = fs["track_style"][frame]
+    if track_style != track_style_applied:
+        # POST-RACE: Unified white/silver track
+        unified_color = '#E8E8E8'  # Bright silver
+        lc_sector.set_colors([unified_color] * len(segments) if track_style == 2 else sector_colors)
+        full_track_glow.set_color('white')
+        full_track_glow.set_alpha({0: 0.08, 1: 0.1, 2: 0.15}[track_style])
+        track_style_applied = track_style
+    title_round.set_color(TITLE_COLORS[fs["title_color"][frame]])
+
     if leader_finished:
-        # POST-RACE: Unified white/silver track, no sector glow
+        # POST-RACE: no sector glow
         for glow in sector_glows:
             glow.set_alpha(0)
-        
-        unified_color = '#E8E8E8'  # Bright silver
-        lc_sector.set_colors([unified_color] * len(segments))
-        full_track_glow.set_color('white')
-        full_track_glow.set_alpha(0.15)
-        
-        title_round.set_color('white')
-        title_round.set_text(f"ROUND {rnd_clamped}/24")
+
+        title_round.set_text(f"ROUND {rnd_clamped}/{ROUNDS}")
         title_gp.set_text(GP_NAMES.get(rnd_clamped, ""))
-        
+
     elif not is_countdown and not is_pre_race:
         # DURING RACE: Normal sector colors
-        if curr_round_num > 24:
-            full_track_glow.set_alpha(0.1)
-        else:
-            title_round.set_color(glow_colors[active_sec])
-        
-        title_round.set_text(f"ROUND {rnd_clamped}/24")
+        title_round.set_text(f"ROUND {rnd_clamped}/{ROUNDS}")
         title_gp.set_text(GP_NAMES.get(rnd_clamped, ""))
-        
+
         for idx, glow in enumerate(sector_glows):
             glow.set_alpha(0.8 if idx == active_sec else 0.05)
     else:
@@ -1229,12 +1218,11 @@ def update(frame):
         title_gp.set_text("QUALIFYING RESULTS")
         for glow in sector_glows:
             glow.set_alpha(0.0)
-    
-    # Update DRS boxes based on active zones
+
     # Update DRS boxes based on active zones
     for dp_num in [1, 2]:
-        is_zone_active = check_any_drs_active_zone(dp_num, snap, t)
-        
+        is_zone_active = fs["drs_zone"][frame, dp_num - 1]
+
         if is_zone_active:
             # Zone is active - show "DRS ON" with green background
             drs_boxes[dp_num].set_facecolor('#00fb0c')
@@ -1251,16 +1239,16 @@ def update(frame):
             drs_box_texts_top[dp_num].set_color('#00fb0c')
             drs_box_texts_bottom[dp_num].set_text(f"DP{dp_num}")
             drs_box_texts_bottom[dp_num].set_color('#00fb0c')
-    for idx, (d, row) in enumerate(standings.iterrows()):
-        total_dist_km = row["distance_km"]
-        curr_px_idx = np.searchsorted(cum_dist, (total_dist_km % (TRUE_LEN/1000)) * 1000)
-        curr_px_idx = min(curr_px_idx, len(points)-1)
-        x, y = points[curr_px_idx]
-        
+
+    for idx in range(len(drivers)):
+        d = drivers[fs["row_driver"][frame, idx]]
+        total_dist_km = fs["row_dist"][frame, idx]
+        x, y = points[fs["row_px"][frame, idx]]
+
         is_lap_8 = (total_dist_km * 1000 >= 36285.9) and (total_dist_km * 1000 < 41469.6)
         size = 30 if is_lap_8 else 27
         f_size = 11 if is_lap_8 else 10
-        
+
         alpha_val = 1.0 if total_dist_km < INSTANT_VANISH_KM else 0.0
         z_base = 100 + (len(drivers) - idx) * 2
         car_dots[d].set_data([x], [y])
@@ -1271,195 +1259,126 @@ def update(frame):
         car_labs[d].set_alpha(alpha_val)
         car_labs[d].set_fontsize(f_size)
         car_labs[d].set_zorder(z_base + 1)
-    
+    profile_phase("region2")
+
     # ==================
     # REGION 3: CONSTRUCTOR'S
     # ==================
-    
+
     if is_pre_race:
-        # Clear any previous pre-race texts
-        for team in pre_race_team_texts:
-            for text_obj in pre_race_team_texts[team]:
-                text_obj.remove()
-        pre_race_team_texts.clear()
-        
-        # Clear race-mode stats
-        for box in stats_boxes_team.values():
-            box.remove()
-        for text_obj in stats_texts_team.values():
-            if isinstance(text_obj, tuple):
-                for txt in text_obj:
-                    txt.remove()
-            else:
-                text_obj.remove()
-        for line in connection_lines_team.values():
-            line.remove()
-        stats_boxes_team.clear()
-        stats_texts_team.clear()
-        connection_lines_team.clear()
-        
-        # Set y-axis to accommodate 2024 points + space for vertical text
-        max_pre_race_pts = 700
+        # Hide race-mode stats
+        for slot in stats_slots_team:
+            for artist in slot:
+                artist.set_visible(False)
+
+        # Set y-axis to accommodate last season's points + space for vertical text (700 for 2024)
+        max_pre_race_pts = max(100, np.ceil(max(p[0] for p in PRE_RACE_TEAM_DATA.values()) * 1.05 / 100) * 100)
         ax3.set_ylim(0, max_pre_race_pts)
-        
+
         # Display each team
         for rank, team in enumerate(PRE_RACE_TEAM_ORDER):
-            pts_2024 = PRE_RACE_TEAM_DATA[team]["points"]
-            wins = PRE_RACE_TEAM_DATA[team]["wins"]
-            podiums = PRE_RACE_TEAM_DATA[team]["podiums"]
-            
+            prev_pts, wins, podiums = PRE_RACE_TEAM_DATA[team]
+
             bars_team[team].set_x(rank - bar_width_team/2)
-            bars_team[team].set_height(pts_2024)
-            
+            bars_team[team].set_height(prev_pts)
+
             if team in logo_boxes_team:
-                logo_boxes_team[team].xybox = (rank, pts_2024)
+                logo_boxes_team[team].xybox = (rank, prev_pts)
                 logo_boxes_team[team].set_visible(True)
-            
+
             point_labels_team[team].set_x(rank)
-            point_labels_team[team].set_y(pts_2024 + (max_pre_race_pts * 0.04))
+            point_labels_team[team].set_y(prev_pts + (max_pre_race_pts * 0.04))
             point_labels_team[team].set_text("0")
-            
-            text_parts = [f"{team}: {pts_2024}"]
+
+            text_parts = [f"{team}: {prev_pts}"]
             if wins > 0:
                 text_parts.append(f"WIN:{wins}")
             if podiums > 0:
                 text_parts.append(f"POD:{podiums}")
             text_string = " ".join(text_parts)
-            
-            text_y_start = pts_2024 + (max_pre_race_pts * 0.1)
-            
-            vertical_text = ax3.text(rank, text_y_start, text_string,
-                                    color=TEAM_COLORS[team], ha='left', va='bottom',
-                                    fontsize=9, weight='normal', rotation=90, zorder=6)
-            
-            pre_race_team_texts[team] = [vertical_text]
-    
+
+            text_y_start = prev_pts + (max_pre_race_pts * 0.1)
+
+            vertical_text = pre_race_team_texts[team]
+            vertical_text.set_position((rank, text_y_start))
+            vertical_text.set_text(text_string)
+            vertical_text.set_visible(True)
+
     else:
         # RACE MODE: Normal bars with stats boxes
-        
-        # Clear pre-race texts
-        for team in pre_race_team_texts:
-            for text_obj in pre_race_team_texts[team]:
-                text_obj.remove()
-        pre_race_team_texts.clear()
-        
-        snap_copy = snap.copy()
-        snap_copy['p_calc'] = snap_copy.apply(lambda r: get_pts(r.name, t), axis=1)
-        snap_copy['team'] = snap_copy.index.map(TEAM_MAP)
-        team_data = snap_copy.groupby('team')['p_calc'].sum().to_dict()
-        
-        adjustment_applied = False
-        current_round_team = completed_rounds + 1
-        if current_round_team == 2 and not adjustment_applied:
-            for team, adjustment in POINTS_ADJUSTMENT.items():
-                if team in team_data:
-                    team_data[team] += adjustment
-            adjustment_applied = True
-        
-        team_wins, team_podiums = calculate_team_stats(current_round_team)
-        sorted_teams = sorted(team_data.keys(), key=lambda x: team_data[x], reverse=True)
+
+        # Hide pre-race texts
+        for text_obj in pre_race_team_texts.values():
+            text_obj.set_visible(False)
+
+        team_pts = fs["team_pts"][frame]
+        team_x = fs["team_x"][frame]
+        sorted_teams = [TEAM_ORDER[i] for i in fs["team_order"][frame]]
+        team_data = dict(zip(TEAM_ORDER, team_pts))
+        team_wins = dict(zip(TEAM_ORDER, fs["team_wins"][frame]))
+        team_podiums = dict(zip(TEAM_ORDER, fs["team_pods"][frame]))
         max_pts_team = max(team_data.values()) if max(team_data.values()) > 0 else 100
         ax3.set_ylim(0, max_pts_team * 1.1)
-        
-        # Clear previous stats boxes
-        for box in stats_boxes_team.values():
-            box.remove()
-        for text_obj in stats_texts_team.values():
-            if isinstance(text_obj, tuple):
-                for txt in text_obj:
-                    txt.remove()
-            else:
-                text_obj.remove()
-        for line in connection_lines_team.values():
-            line.remove()
-        stats_boxes_team.clear()
-        stats_texts_team.clear()
-        connection_lines_team.clear()
-        
+
         bar_positions_team = {}
-        
-        # Initialize position tracking
-        for rank, team in enumerate(sorted_teams):
-            if team not in prev_team_positions:
-                prev_team_positions[team] = rank
-                current_team_x_positions[team] = rank
-        
-        # Update bar positions with smooth animation
-        for rank, team in enumerate(sorted_teams):
+
+        # Update bar positions (smoothed x comes from the frame state)
+        for team, animated_x in zip(TEAM_ORDER, team_x):
             pts = team_data[team]
-            
-            # Smooth position animation
-            if team in current_team_x_positions:
-                current_x = current_team_x_positions[team]
-                target_x = rank
-                diff = target_x - current_x
-                current_team_x_positions[team] = current_x + (diff * TEAM_POSITION_ANIMATION_SPEED)
-                animated_x = current_team_x_positions[team]
-            else:
-                animated_x = rank
-                current_team_x_positions[team] = rank
-            
             bar_positions_team[team] = (animated_x, pts)
-            
+
             # Main bar
             bars_team[team].set_x(animated_x - bar_width_team/2)
             bars_team[team].set_height(pts)
-            
+
             # Point label
             point_labels_team[team].set_x(animated_x)
             point_labels_team[team].set_y(pts + (max_pts_team * 0.04))
             point_labels_team[team].set_text(f"{int(pts)}")
-            
+
             # Update logo position
             if team in logo_boxes_team:
                 logo_boxes_team[team].xybox = (animated_x, pts)
                 logo_boxes_team[team].set_visible(True)
-        
-        # Update previous positions
-        for rank, team in enumerate(sorted_teams):
-            prev_team_positions[team] = rank
-        
+
         # STATS BOXES
         stats_x_left = 5.5
         stats_x_right = 8.75
         stats_y_bottom_ratio = 11/45
         stats_y_top_ratio = 44/45
-        
+
         stats_y_bottom = max_pts_team * stats_y_bottom_ratio
         stats_y_top = max_pts_team * stats_y_top_ratio
-        
+
         y_offset_team = 0
         box_width_team_stat = stats_x_right - stats_x_left
         available_height = stats_y_top - stats_y_bottom
-        
-        teams_with_stats = sum(1 for team in sorted_teams 
+
+        teams_with_stats = sum(1 for team in sorted_teams
                               if team_wins.get(team, 0) > 0 or team_podiums.get(team, 0) > 0)
-        
+
         if teams_with_stats > 0:
             box_height_team = min(available_height / (teams_with_stats * 1), available_height * 0.15)
         else:
             box_height_team = available_height * 0.1
-        
-        # Draw stats boxes
+
+        # Fill stats slots top-down, hide the unused ones
+        slots = iter(stats_slots_team)
         for team in sorted_teams:
             wins = team_wins.get(team, 0)
             podiums = team_podiums.get(team, 0)
-            
+
             if wins > 0 or podiums > 0:
+                box, team_name_text, stats_text_obj, line = next(slots)
                 box_y = stats_y_top - y_offset_team
-                
-                box = FancyBboxPatch((stats_x_left, box_y - box_height_team), 
-                                    box_width_team_stat, box_height_team,
-                                    boxstyle="round,pad=0.05", edgecolor=TEAM_COLORS[team], 
-                                    facecolor='black', linewidth=1.4, alpha=0.8, zorder=4)
-                ax3.add_patch(box)
-                stats_boxes_team[team] = box
-                
-                team_name_text = ax3.text(stats_x_left, 
-                                         box_y - box_height_team/2 + box_height_team*0.25, 
-                                         team, color=TEAM_COLORS[team], ha='left', va='center', 
-                                         fontsize=11, weight='bold', alpha=0.95, zorder=5)
-                
+
+                box.set_bounds(stats_x_left, box_y - box_height_team, box_width_team_stat, box_height_team)
+                box.set_edgecolor(TEAM_COLORS[team])
+
+                team_name_text.set_position((stats_x_left, box_y - box_height_team/2 + box_height_team*0.25))
+                team_name_text.set_text(team)
+                team_name_text.set_color(TEAM_COLORS[team])
+
                 stats_line = ""
                 if wins > 0:
                     stats_line += f"WIN:{wins}"
@@ -1467,313 +1386,47 @@ def update(frame):
                     if stats_line:
                         stats_line += " "
                     stats_line += f"POD:{podiums}"
-                
-                if stats_line:
-                    stats_text_obj = ax3.text(stats_x_left,
-                                             box_y - box_height_team/2 - box_height_team*0.15, 
-                                             stats_line, color='white', ha='left', va='center', 
-                                             fontsize=9, weight='normal', alpha=0.95, zorder=5)
-                    stats_texts_team[team] = (team_name_text, stats_text_obj)
-                else:
-                    stats_texts_team[team] = (team_name_text,)
-                
+
+                stats_text_obj.set_position((stats_x_left, box_y - box_height_team/2 - box_height_team*0.15))
+                stats_text_obj.set_text(stats_line)
+
                 # Connection line
-                if team in bar_positions_team:
-                    bar_x, bar_y = bar_positions_team[team]
-                    line = plt.Line2D([stats_x_left, bar_x], 
-                                     [box_y - box_height_team/2, bar_y],
-                                     color=TEAM_COLORS[team], linewidth=1, 
-                                     alpha=0.6, linestyle='--', zorder=2)
-                    ax3.add_line(line)
-                    connection_lines_team[team] = line
-                
+                bar_x, bar_y = bar_positions_team[team]
+                line.set_data([stats_x_left, bar_x], [box_y - box_height_team/2, bar_y])
+                line.set_color(TEAM_COLORS[team])
+
+                for artist in (box, team_name_text, stats_text_obj, line):
+                    artist.set_visible(True)
+
                 y_offset_team += box_height_team * 1
-    
+
+        for slot in slots:
+            for artist in slot:
+                artist.set_visible(False)
+    profile_phase("region3")
+
     # ==================
     # REGION 4: RACING TRACK
     # ==================
-    should_update_r4 = (r4_update_counter % r4_update_interval == 0)
-    r4_update_counter += 1
-
-    # Get top 3 drivers based on distance
-    driver_data = {}
-    for driver in TOP_DRIVERS:
-        if driver in standings.index:
-            driver_data[driver] = {
-                'dist_km': standings.loc[driver, 'distance_km'],
-                'rank': list(standings.index).index(driver) + 1,
-                'points': int(get_pts(driver, t))
-            }
-    
-    # Sort by distance to get actual top 3
-    sorted_drivers = sorted(driver_data.keys(), 
-                           key=lambda d: driver_data[d]['dist_km'], 
-                           reverse=True)[:3]
-    
-    # Get driver stats
-    driver_wins, driver_podiums = calculate_driver_stats(current_round)
-    
-    # Define stationary card positions for P1, P2, P3 (left to right)
-    CARD_POSITIONS = {
-        0: LEFT_BORDER_W,  # P1 at left
-        1: LEFT_BORDER_W + (TRACK_LENGTH_NORM / 2) - (CARD_WIDTH_NORM / 2),  # P2 at center
-        2: LEFT_BORDER_W + TRACK_LENGTH_NORM - CARD_WIDTH_NORM  # P3 at right
-    }
 
-    if is_pre_race:
-        # PRE-RACE: Grid positions
-        # Position cars BEHIND the starting line
-        P1_CAR_OFFSET = -0.015  # Distance behind the line
-        grid_positions = {
-            0: P1_GRID_CENTER + P1_CAR_OFFSET,  # 1st place behind line
-            1: ((12/80 + 21/80) / 2) + P1_CAR_OFFSET,  # 2nd place behind line
-            2: ((3/80 + 12/80) / 2) + P1_CAR_OFFSET    # 3rd place behind line
-        }
-        
-        # Smoothly transition start line to grid position during pre-race
-        start_line_target_x = P1_GRID_CENTER
-        diff = start_line_target_x - start_line_x
-        start_line_x += diff * START_LINE_TRANSITION_SPEED
-        
-        start_finish_line.set_x(start_line_x - 0.002)
-        start_finish_line.set_alpha(1.0)
-        
-        # Update all stripes to sector 1 colors (pre-race default)
-        for i in range(num_stripes):
+    # Start/finish line (grid line before the start, nearest lap line or the incoming finish line after)
+    start_finish_line.set_x(fs["sf_x"][frame])
+    start_finish_line.set_alpha(fs["sf_alpha"][frame])
+
+    # Track border stripes: sector 1 colours on the grid, sector under each stripe while scrolling
+    for i in range(num_stripes):
+        if is_pre_race:
             color = 'white' if i % 2 == 0 else '#ce161b'
-            track_border_stripes_top[i].set_color(color)
-            track_border_stripes_bottom[i].set_color(color)
-        
-        for rank, driver in enumerate(sorted_drivers):
-            lane_idx = rank  # 0 = bottom lane, 1 = middle, 2 = top
-            lane_y = lane_center_lines[lane_idx]
-            car_x = grid_positions[rank]
-            
-            # Position car at grid
-            driver_car_images[driver].xybox = (car_x, lane_y)
-            driver_car_images[driver].set_visible(True)
-            
-            # STATIONARY card at top
-            card_x = CARD_POSITIONS[rank]
-            driver_cards[driver].set_x(card_x)
-            driver_cards[driver].set_visible(True)
-            
-            # Update card contents
-            photo_x = card_x + (CARD_WIDTH_NORM * 0.15)
-            driver_photos[driver].xybox = (photo_x, CARD_START + CARD_HEIGHT/2)
-            driver_photos[driver].set_visible(True)
-            
-            # Driver name
-            name_x = card_x + (CARD_WIDTH_NORM * 0.35)
-            driver_name_texts[driver].set_x(name_x)
-            driver_name_texts[driver].set_visible(True)
-            
-            # Stats in card (grid position info only)
-            driver_stats_texts[driver].set_x(name_x)
-            grid_pts, grid_series = GRID_DATA.get(driver, (0, ""))
-            driver_stats_texts[driver].set_text(f"{grid_series}: {grid_pts}pts")
-            driver_stats_texts[driver].set_visible(True)
-            
-            # Position label (right side of card)
-            position_labels = {0: "P1", 1: "P2", 2: "P3"}
-            pos_x = card_x + CARD_WIDTH_NORM - 0.01  # Right edge minus small margin
-            card_position_labels[driver].set_x(pos_x)
-            card_position_labels[driver].set_text(position_labels[rank])
-            card_position_labels[driver].set_visible(True)
-            
-            # No progress bars or points display in pre-race
-            if progress_bars[driver]:
-                progress_bars[driver].set_visible(False)
-            car_points_texts[driver].set_visible(False)
-            drs_bars[driver].set_alpha(0)
-    
-    else:
-            # RACE MODE: Scrolling track animation
-            
-            # Smoothly transition start line to left border at race start
-            start_line_target_x = LEFT_BORDER_W
-            diff = start_line_target_x - start_line_x
-            start_line_x += diff * START_LINE_TRANSITION_SPEED
-
-            # Get leader distance
-            leader = sorted_drivers[0] if sorted_drivers else None
-            if leader:
-                leader_km = driver_data[leader]['dist_km']
-                
-                # Calculate track scroll offset
-                if leader_km <= LEADER_POSITION_KM:
-                    # Leader hasn't reached racing position yet
-                    leader_x = LEFT_BORDER_W + ((leader_km / TRACK_LENGTH_KM) * TRACK_LENGTH_NORM)
-                    track_offset_km = 0
-                else:
-                    # Leader at racing position, track scrolls
-                    leader_x = LEFT_BORDER_W + ((LEADER_POSITION_KM / TRACK_LENGTH_KM) * TRACK_LENGTH_NORM)
-                    track_offset_km = leader_km - LEADER_POSITION_KM
-                
-                # Update track border stripes based on scrolling position
-                # One round = 5.1837 km, divided into 3 sectors of 1.72790 km each
-                SECTOR_LENGTH_KM = 5.1837 / 3  # 1.72790 km per sector
-                
-                # Calculate which part of track is visible
-                visible_start_km = track_offset_km
-                visible_end_km = track_offset_km + TRACK_LENGTH_KM
-                
-                # Update each stripe based on its position in the visible track
-                for i, stripe_top in enumerate(track_border_stripes_top):
-                    # Calculate the actual track position for this stripe
-                    stripe_relative_pos = (i / num_stripes) * TRACK_LENGTH_NORM
-                    stripe_km = visible_start_km + (stripe_relative_pos / TRACK_LENGTH_NORM) * TRACK_LENGTH_KM
-                    
-                    # Determine which sector this stripe represents (modulo for repeating sectors)
-                    position_in_round = stripe_km % 5.1837
-                    
-                    if position_in_round < SECTOR_LENGTH_KM:
-                        # Sector 1: Red & White
-                        base_color, alt_color = '#ce161b', 'white'
-                    elif position_in_round < 2 * SECTOR_LENGTH_KM:
-                        # Sector 2: Blue & White
-                        base_color, alt_color = '#169cc5', 'white'
-                    else:
-                        # Sector 3: Yellow & Black
-                        base_color, alt_color = '#efd035', 'black'
-                    
-                    # Alternate colors for stripe pattern
-                    color = base_color if i % 2 == 0 else alt_color
-                    track_border_stripes_top[i].set_color(color)
-                    track_border_stripes_bottom[i].set_color(color)
-                
-                # Start/finish line logic
-                # Calculate where the start/finish line should be relative to leader
-                # Start line is at km=0, km=5.1837, km=10.3674, etc.
-                start_line_positions = [n * 5.1837 for n in range(20)]  # Multiple laps
-                
-                # Find the nearest start line ahead of or behind the visible track
-                closest_start_line = None
-                min_distance = float('inf')
-                
-                for sl_km in start_line_positions:
-                    if visible_start_km - 0.5 <= sl_km <= visible_end_km + 0.5:
-                        distance = abs(sl_km - leader_km)
-                        if distance < min_distance:
-                            min_distance = distance
-                            closest_start_line = sl_km
-                
-                # Position start/finish line if it's visible
-                if closest_start_line is not None:
-                    # Calculate line position relative to visible track
-                    line_offset_from_visible_start = closest_start_line - visible_start_km
-                    line_x = LEFT_BORDER_W + ((line_offset_from_visible_start / TRACK_LENGTH_KM) * TRACK_LENGTH_NORM)
-                    
-                    # Only show if within track bounds
-                    if LEFT_BORDER_W <= line_x <= LEFT_BORDER_W + TRACK_LENGTH_NORM:
-                        start_finish_line.set_x(line_x - 0.002)
-                        start_finish_line.set_alpha(1.0)
-                    else:
-                        start_finish_line.set_alpha(0.0)
-                else:
-                    start_finish_line.set_alpha(0.0)
-                
-                # Finish line animation (special case for final lap)
-                if leader_km >= (TOTAL_RACE_KM - 0.3):
-                    # Last 300m - finish line comes from right
-                    distance_to_finish = TOTAL_RACE_KM - leader_km
-                    finish_line_travel = 0.3 - distance_to_finish
-                    finish_x = 1.0 - ((finish_line_travel / 0.3) * (1.0 - leader_x))
-                    start_finish_line.set_x(finish_x - 0.002)
-                    start_finish_line.set_alpha(1.0)
-                if should_update_r4:
-                    # Position all 3 drivers
-                    for rank, driver in enumerate(sorted_drivers):
-                        dist_km = driver_data[driver]['dist_km']
-                        driver_points = driver_data[driver]['points']
-                        
-                        # Calculate car x position based on track scroll
-                        relative_dist = dist_km - track_offset_km
-                        car_x = LEFT_BORDER_W + ((relative_dist / TRACK_LENGTH_KM) * TRACK_LENGTH_NORM)
-                        
-                        # Clamp to track bounds
-                        car_x = max(LEFT_BORDER_W, min(car_x, LEFT_BORDER_W + TRACK_LENGTH_NORM))
-                        
-                        # Lane assignment (0=bottom, 1=middle, 2=top)
-                        lane_idx = rank
-                        lane_y = lane_center_lines[lane_idx]
-                        
-                        # Check DRS status for this driver
-                        lap_m = (dist_km * 1000) % TRUE_LEN
-                        d_lap = int((dist_km * 1000) // TRUE_LEN) + 1
-                        has_drs = False
-                        if d_lap > 1:
-                            has_drs = check_drs_active(driver, lap_m, d_lap)
-                        
-                        # DRS bar (green strip behind car)
-                        if has_drs:
-                            drs_bar_width = 0.03  # Width of DRS bar
-                            drs_bar_x = car_x - drs_bar_width
-                            drs_bar_height = LANE_HEIGHT * 0.5
-                            drs_bar_y = lane_y - (drs_bar_height / 2)
-                            
-                            drs_bars[driver].set_xy((drs_bar_x, drs_bar_y))
-                            drs_bars[driver].set_width(drs_bar_width)
-                            drs_bars[driver].set_height(drs_bar_height)
-                            drs_bars[driver].set_alpha(0.6)
-                        else:
-                            drs_bars[driver].set_alpha(0)
-                        
-                        # Position car
-                        driver_car_images[driver].xybox = (car_x, lane_y)
-                        driver_car_images[driver].set_visible(True)
-                        
-                        # Progress bar (from left border to car position)
-                        bar_width = car_x - LEFT_BORDER_W
-                        bar_y = lane_y - (LANE_HEIGHT * 0.15)
-                        bar_height = LANE_HEIGHT * 0.3
-                        
-                        if progress_bars[driver]:
-                            progress_bars[driver].remove()
-                        
-                        progress_bar = ax4.add_patch(Rectangle((LEFT_BORDER_W, bar_y), bar_width, bar_height,
-                                                            color=TEAM_COLORS[DRIVER_TEAMS[driver]],
-                                                            alpha=0.4, zorder=4))
-                        progress_bars[driver] = progress_bar
-                        
-                        # Points display at car tip (right side of car with spacing)
-                        points_x = car_x + 0.035  # Increased offset for spacing from car tip
-                        car_points_texts[driver].set_position((points_x, lane_y))
-                        car_points_texts[driver].set_text(f"{driver_points}")
-                        car_points_texts[driver].set_visible(True)
-                        
-                        # STATIONARY card at top (position based on rank)
-                        card_x = CARD_POSITIONS[rank]
-                        driver_cards[driver].set_x(card_x)
-                        driver_cards[driver].set_visible(True)
-                        
-                        # Update card contents
-                        photo_x = card_x + (CARD_WIDTH_NORM * 0.15)
-                        driver_photos[driver].xybox = (photo_x, CARD_START + CARD_HEIGHT/2)
-                        driver_photos[driver].set_visible(True)
-                        
-                        # Driver name
-                        name_x = card_x + (CARD_WIDTH_NORM * 0.35)
-                        driver_name_texts[driver].set_x(name_x)
-                        driver_name_texts[driver].set_visible(True)
-                        
-                        # Stats: 1st/2nd/3rd finish counts
-                        driver_stats_texts[driver].set_x(name_x)
-                        driver_key = DRIVER_NAME_MAP.get(driver, "")
-                        first, second, third = calculate_podium_finishes(driver_key, completed_rounds)
-                        driver_stats_texts[driver].set_text(f"P1:{first} P2:{second} P3:{third}")
-                        driver_stats_texts[driver].set_visible(True)
-                        
-                        # Position label (right side of card)
-                        position_labels = {0: "P1", 1: "P2", 2: "P3"}
-                        pos_x = card_x + CARD_WIDTH_NORM - 0.01  # Right edge minus small margin
-                        card_position_labels[driver].set_x(pos_x)
-                        card_position_labels[driver].set_text(position_labels[rank])
-                        card_position_labels[driver].set_visible(True)
-    
-    # Hide non-top-3 drivers
-    for driver in TOP_DRIVERS:
-        if driver not in sorted_drivers:
+        else:
+            base_color, alt_color = STRIPE_COLORS[fs["stripe_sector"][frame, i]]
+            color = base_color if i % 2 == 0 else alt_color
+        track_border_stripes_top[i].set_color(color)
+        track_border_stripes_bottom[i].set_color(color)
+
+    # Cars and cards hold the placement from the last Region 4 update
+    position_labels = {0: "P1", 1: "P2", 2: "P3"}
+    for j, driver in enumerate(TOP_DRIVERS):
+        if not fs["r4_visible"][frame, j]:
             driver_car_images[driver].set_visible(False)
             driver_cards[driver].set_visible(False)
             driver_photos[driver].set_visible(False)
@@ -1781,23 +1434,92 @@ def update(frame):
             driver_stats_texts[driver].set_visible(False)
             car_points_texts[driver].set_visible(False)
             card_position_labels[driver].set_visible(False)
-            if progress_bars[driver]:
-                progress_bars[driver].set_visible(False)
+            progress_bars[driver].set_visible(False)
             drs_bars[driver].set_alpha(0)
-    
+            continue
+
+        rank = fs["r4_rank"][frame, j]
+        is_race_card = fs["r4_race"][frame]
+        car_x = fs["r4_car_x"][frame, j]
+
+        # Lane assignment (0=bottom, 1=middle, 2=top)
+        lane_y = lane_center_lines[rank]
+
+        # Position car
+        driver_car_images[driver].xybox = (car_x, lane_y)
+        driver_car_images[driver].set_visible(True)
+
+        # STATIONARY card at top
+        card_x = CARD_POSITIONS[rank]
+        driver_cards[driver].set_x(card_x)
+        driver_cards[driver].set_visible(True)
+
+        # Update card contents
+        photo_x = card_x + (CARD_WIDTH_NORM * 0.15)
+        driver_photos[driver].xybox = (photo_x, CARD_START + CARD_HEIGHT/2)
+        driver_photos[driver].set_visible(True)
+
+        # Driver name
+        name_x = card_x + (CARD_WIDTH_NORM * 0.35)
+        driver_name_texts[driver].set_x(name_x)
+        driver_name_texts[driver].set_visible(True)
+
+        # Stats: grid info before the start, 1st/2nd/3rd finish counts during the race
+        driver_stats_texts[driver].set_x(name_x)
+        if is_race_card:
+            first, second, third = fs["r4_podiums"][frame, j]
+            driver_stats_texts[driver].set_text(f"P1:{first} P2:{second} P3:{third}")
+        else:
+            grid_pts, grid_series = GRID_DATA.get(driver, (0, ""))
+            driver_stats_texts[driver].set_text(f"{grid_series}: {grid_pts}pts")
+        driver_stats_texts[driver].set_visible(True)
+
+        # Position label (right side of card)
+        pos_x = card_x + CARD_WIDTH_NORM - 0.01  # Right edge minus small margin
+        card_position_labels[driver].set_x(pos_x)
+        card_position_labels[driver].set_text(position_labels[rank])
+        card_position_labels[driver].set_visible(True)
+
+        if not is_race_card:
+            # No progress bars or points display in pre-race
+            progress_bars[driver].set_visible(False)
+            car_points_texts[driver].set_visible(False)
+            drs_bars[driver].set_alpha(0)
+            continue
+
+        # DRS bar (green strip behind car)
+        if fs["r4_drs"][frame, j]:
+            drs_bar_width = 0.03  # Width of DRS bar
+            drs_bar_x = car_x - drs_bar_width
+            drs_bar_height = LANE_HEIGHT * 0.5
+            drs_bar_y = lane_y - (drs_bar_height / 2)
+
+            drs_bars[driver].set_xy((drs_bar_x, drs_bar_y))
+            drs_bars[driver].set_width(drs_bar_width)
+            drs_bars[driver].set_height(drs_bar_height)
+            drs_bars[driver].set_alpha(0.6)
+        else:
+            drs_bars[driver].set_alpha(0)
+
+        # Progress bar (from left border to car position)
+        progress_bars[driver].set_xy((LEFT_BORDER_W, lane_y - (LANE_HEIGHT * 0.15)))
+        progress_bars[driver].set_width(car_x - LEFT_BORDER_W)
+        progress_bars[driver].set_height(LANE_HEIGHT * 0.3)
+        progress_bars[driver].set_visible(True)
+
+        # Points display at car tip (right side of car with spacing)
+        points_x = car_x + 0.035  # Increased offset for spacing from car tip
+        car_points_texts[driver].set_position((points_x, lane_y))
+        car_points_texts[driver].set_text(f"{fs['r4_points'][frame, j]}")
+        car_points_texts[driver].set_visible(True)
+    profile_phase("region4")
+
     return []
 
 # =============================
 # RUN ANIMATION
 # =============================
 total_frames = len(times) + START_DELAY_FRAMES
-# =============================
-# REPLACING THE END OF YOUR SCRIPT
-# =============================
-# Create a folder for the frames
-frame_dir = "render_frames_all"
-if not os.path.exists(frame_dir):
-    os.makedirs(frame_dir)
 
 # 1. SET HIGH SHARPNESS
 RENDER_DPI = 240 # 4K quality level
@@ -1806,24 +1528,460 @@ fig.set_dpi(RENDER_DPI)
 TEST_MODE = True # Flip to False for the 24,030 frames
 frames_to_render = 24300 if TEST_MODE else (len(times) + START_DELAY_FRAMES)
 
-print(f"--- SAVING {frames_to_render} MASTER PNG FRAMES ---")
+frame_state = load_frame_state(max(frames_to_render, total_frames))
 
-try:
-    for i in range(frames_to_render):
+# =============================
+# OUTPUT MODE
+# =============================
+# "ffmpeg": pipe raw RGBA frames from the Agg canvas straight into the encoder (one pass, no PNGs on disk)
+# "png":    save every frame to frame_dir and run FFmpeg by hand afterwards
+RENDER_OUTPUT = "ffmpeg"
+frame_dir = "render_frames_all"
+OUTPUT_VIDEO = "F1_4K_MASTER_FINAL.mp4"
+
+# Encoder settings (defaults match the old hand-run FFmpeg command)
+FFMPEG_BIN = "ffmpeg"
+FFPROBE_BIN = "ffprobe"            # counts the frames of segments and of the joined video
+FFMPEG_CODEC = "h264_amf"          # e.g. "libx264", "h264_nvenc", "hevc_amf"
+FFMPEG_BITRATE = "50M"
+FFMPEG_PIX_FMT = "yuv420p"
+FFMPEG_EXTRA_ARGS = ["-usage", "lowlatency", "-rc", "cbr", "-maxrate", "50M", "-bufsize", "20M",
+                     "-quality", "quality", "-tag:v", "avc1"]
+
+# =============================
+# PREVIEW MODE
+# =============================
+# Small proxy of the master render through the same update/blit/encode path: low DPI, every
+# PREVIEW_STRIDE-th frame, optionally only a window of the video (in seconds). The proxy plays in
+# real time (TARGET_UI_FPS / PREVIEW_STRIDE fps) and uses a software encoder so it runs anywhere.
+PREVIEW_MODE = False
+PREVIEW_DPI = 40                   # 640x360; keep it even (yuv420p needs even dimensions)
+PREVIEW_STRIDE = 10
+PREVIEW_WINDOW = None              # (start_s, end_s) of the video, None = whole race
+PREVIEW_VIDEO = "F1_PREVIEW.mp4"
+
+RENDER_START, RENDER_STOP, RENDER_STEP = 0, frames_to_render, 1
+if PREVIEW_MODE:
+    RENDER_DPI = PREVIEW_DPI
+    fig.set_dpi(RENDER_DPI)
+    if PREVIEW_WINDOW is not None:
+        RENDER_START = max(0, int(PREVIEW_WINDOW[0] * TARGET_UI_FPS))
+        RENDER_STOP = min(frames_to_render, int(PREVIEW_WINDOW[1] * TARGET_UI_FPS))
+    RENDER_STEP = PREVIEW_STRIDE
+    OUTPUT_VIDEO = PREVIEW_VIDEO
+    frame_dir = "render_frames_preview"
+    FFMPEG_CODEC, FFMPEG_BITRATE = "libx264", "2M"
+    FFMPEG_EXTRA_ARGS = ["-preset", "veryfast"]
+
+def open_ffmpeg_pipe(output_path, width, height):
+    """Start an FFmpeg process that reads raw RGBA frames from stdin."""
+    cmd = [
+        FFMPEG_BIN, "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}",
+        "-framerate", str(TARGET_UI_FPS / RENDER_STEP), "-i", "-",
+        "-c:v", FFMPEG_CODEC, "-b:v", FFMPEG_BITRATE, "-pix_fmt", FFMPEG_PIX_FMT,
+        *FFMPEG_EXTRA_ARGS,
+        output_path
+    ]
+    return subprocess.Popen(cmd, stdin=subprocess.PIPE)
+
+# Parallel rendering: >1 spreads the render segments (see CHECKPOINTED RENDER) over that many worker processes
+RENDER_WORKERS = 1
+segment_dir = "render_segments"
+
+# savefig(facecolor='black') used to paint this; the raw canvas needs it set on the figure itself
+fig.set_facecolor('black')
+
+# =============================
+# STATIC LAYER CACHE (BLITTING)
+# =============================
+# Artists that update() never touches over the frames being rendered are rasterized once into a
+# background bitmap. Each frame restores it and draws only the remaining artists on top, in the
+# same order Axes.draw would, so the result matches a full canvas.draw().
+# Which artists update() touches is probed on PROBE_SAMPLES frames spread over the range, not on
+# every frame. If a frame the probe skipped does touch a static artist (or moves an axes' limits),
+# the layer is rebuilt on the spot with that artist animated, so a sparse probe never freezes one.
+RENDER_BLIT = True
+PROBE_SAMPLES = 48
+
+def axes_draw_list(ax):
+    """Children of ax in the order Axes.draw paints them."""
+    artists = ax.get_children()
+    artists.remove(ax.patch)
+    if not (ax.axison and ax.get_frame_on()):
+        artists = [a for a in artists if a not in ax.spines.values()]
+    if not ax.axison:
+        artists = [a for a in artists if a not in (ax.xaxis, ax.yaxis)]
+    return sorted(artists, key=lambda a: a.zorder)
+
+def probe_frames(start, stop, step=1):
+    """Up to PROBE_SAMPLES frames of range(start, stop, step), evenly spread, first and last included."""
+    frames = range(start, stop, step)
+    picks = np.unique(np.linspace(0, len(frames) - 1, min(PROBE_SAMPLES, len(frames))).astype(int))
+    return [frames[k] for k in picks]
+
+def find_touched_artists(frames):
+    """Axes children changed by update() on the given frames, and axes whose limits move."""
+    candidates = {a: a.findobj() for ax in fig.axes for a in axes_draw_list(ax)}
+    for parts in candidates.values():
+        for part in parts:
+            part.stale = False
+    limits = {ax: ax.viewLim.bounds for ax in fig.axes}
+    
+    touched, moving_axes = set(), set()
+    for i in frames:
         update(i)
-        
-        # Save each frame as a numbered PNG
-        # Transparent=False ensures the black background stays solid black
-        file_path = os.path.join(frame_dir, f"frame_{i:05d}.png")
-        fig.savefig(file_path, dpi=RENDER_DPI, facecolor='black', transparent=False)
-        
-        if i % 30 == 0:
-            done = (i / frames_to_render) * 100
-            print(f"Saved: {i}/{frames_to_render} ({done:.1f}%)")
+        for a in [a for a, parts in candidates.items() if any(part.stale for part in parts)]:
+            touched.add(a)
+            del candidates[a]
+        moving_axes.update(ax for ax in fig.axes if ax.viewLim.bounds != limits[ax])
+    return touched, moving_axes
+
+def build_static_layer(touched, moving_axes, frame):
+    """Rasterize the static part of every panel as frame leaves it; returns the layer used by draw_blit_frame."""
+    plan, dynamic_boxes = [], []
+    for ax in sorted(fig.axes, key=lambda a: a.zorder):
+        order = axes_draw_list(ax)
+        if ax in moving_axes or any(ax.bbox.overlaps(box) for box in dynamic_boxes):
+            # Limits move, or it sits on top of something animated: redraw the whole panel
+            first = 0
+        else:
+            first = next((k for k, a in enumerate(order) if a in touched), len(order))
+        if first < len(order):
+            dynamic_boxes.append(ax.bbox)
+            for a in order[first:]:
+                a.set_animated(True)
+        plan.append((ax, set(order[:first])))
+    
+    update(frame)   # not whatever frame the probe ended on
+    fig.canvas.draw()
+    background = fig.canvas.copy_from_bbox(fig.bbox)
+    static_parts = {a: a.findobj() for _, static in plan for a in static}
+    for parts in static_parts.values():
+        for part in parts:
+            part.stale = False   # drawing itself marks some stale (annotation boxes reposition)
+    static_count = sum(len(static) for _, static in plan)
+    print(f"✔ Static layer cached: {static_count} artists, {len(touched)} animated")
+    return {"background": background, "plan": plan, "tiles": {}, "last": None,
+            "touched": set(touched), "moving_axes": set(moving_axes), "static_parts": static_parts,
+            "limits": {ax: ax.viewLim.bounds for ax in fig.axes if ax not in moving_axes}}
+
+def layer_misses(layer):
+    """Static artists that update() changed since the layer was built, and axes whose limits moved."""
+    missed = {a for a, parts in layer["static_parts"].items() if any(part.stale for part in parts)}
+    moved = {ax for ax, bounds in layer["limits"].items() if ax.viewLim.bounds != bounds}
+    return missed, moved
 
-except Exception as e:
-    print(f"Error: {e}")
+# =============================
+# DIRTY REGION TILES
+# =============================
+# The panels change at very different rates. Each region lists the frame_state keys that drive
+# its artists; when none of them differ from the last rendered frame, the region's tile from that
+# frame is restored instead of redrawing it. Anything not covered by a region (track map,
+# constructors) is redrawn every frame. Tiles are in axes coordinates and must not overlap, and a
+# region's artists must stay inside its tile.
+RENDER_DIRTY_REGIONS = True
+
+LEADERBOARD_KEYS = ["is_pre_race", "leader_finished", "popup", "p_reveal",
+                    "row_driver", "row_y", "row_kind", "row_gap", "row_int", "row_finished",
+                    "row_lap", "row_drs", "row_pts", "row_wins", "row_pods", "row_podium"]
+RACING_KEYS = ["is_pre_race", "sf_x", "sf_alpha", "stripe_sector",
+               "r4_visible", "r4_race", "r4_rank", "r4_car_x", "r4_drs", "r4_points", "r4_podiums"]
+
+# (name, axes, artists or None for the rest of the axes, tile (x0, y0, x1, y1), keys)
+REGION_TILES = [
+    ("clock", ax1, [header_line, lap_label, time_label], (0, 0.91, 1, 1), ["is_pre_race", "t", "lap"]),
+    ("leaderboard", ax1, None, (0, 0, 1, 0.91), LEADERBOARD_KEYS),
+    ("racing", ax4, None, (0, 0, 1, 1), RACING_KEYS),
+]
+
+def region_of(ax, artist):
+    """Name of the region tile an artist is drawn into (None: redrawn every frame)."""
+    for name, region_ax, artists, _, _ in REGION_TILES:
+        if region_ax is ax and (artists is None or artist in artists):
+            return name
+    return None
+
+def region_is_dirty(name, keys, frame, last):
+    if last is None:
+        return True
+    if name == "leaderboard" and frame_state["leader_finished"][frame]:
+        return True  # gap flicker is drawn fresh every frame once the leader finishes
+    return any(not np.array_equal(frame_state[k][frame], frame_state[k][last]) for k in keys)
+
+def draw_blit_frame(layer, frame):
+    """Restore the cached background, reuse clean region tiles and draw everything else over it."""
+    canvas = fig.canvas
+    canvas.restore_region(layer["background"])
+    
+    clean = set()
+    if RENDER_DIRTY_REGIONS:
+        for name, ax, _, _, keys in REGION_TILES:
+            if name in layer["tiles"] and not region_is_dirty(name, keys, frame, layer["last"]):
+                canvas.restore_region(layer["tiles"][name])
+                clean.add(name)
+    
+    for ax, static in layer["plan"]:
+        for a in axes_draw_list(ax):
+            if a not in static and region_of(ax, a) not in clean:
+                ax.draw_artist(a)
+    
+    if RENDER_DIRTY_REGIONS:
+        for name, ax, _, tile, _ in REGION_TILES:
+            if name not in clean:
+                corners = ax.transAxes.transform([tile[:2], tile[2:]])
+                layer["tiles"][name] = canvas.copy_from_bbox(Bbox(corners))
+    layer["last"] = frame
+
+# =============================
+# FRAME PROFILER
+# =============================
+# With RENDER_PROFILE on, every rendered frame gets one row of phase timings: the four update()
+# regions, the canvas draw and the encode (or PNG save). Each segment writes its rows next to its
+# video; at the end they are joined into PROFILE_LOG and summarized (p50/p95/max per phase plus
+# the slowest frames). When off, each phase mark is a single None check.
+RENDER_PROFILE = False
+PROFILE_LOG = "render_profile.csv"
+PROFILE_PHASES = ["region1", "region2", "region3", "region4", "draw", "encode"]
+PROFILE_SLOWEST = 10
+
+profile = {"row": None, "clock": 0.0, "rows": []}
+
+def profile_frame(frame):
+    """Start timing a frame."""
+    if RENDER_PROFILE:
+        profile["row"] = {"frame": frame}
+        profile["clock"] = time.perf_counter()
+
+def profile_phase(name):
+    """Close phase `name` of the frame being timed (no-op when nothing is being timed)."""
+    row = profile["row"]
+    if row is not None:
+        now = time.perf_counter()
+        row[name] = now - profile["clock"]
+        profile["clock"] = now
+
+def profile_frame_done():
+    row = profile["row"]
+    if row is not None:
+        row["total"] = sum(row.get(phase, 0.0) for phase in PROFILE_PHASES)
+        profile["rows"].append(row)
+        profile["row"] = None
+
+def save_profile(profile_path):
+    """Write the timed frames of this process to profile_path and start a new table."""
+    pd.DataFrame(profile["rows"], columns=["frame", *PROFILE_PHASES, "total"]).to_csv(profile_path, index=False)
+    profile["rows"] = []
+
+def report_profile(timings):
+    """Print p50/p95/max per phase (ms) and the slowest frames."""
+    ms = timings[[*PROFILE_PHASES, "total"]] * 1000
+    summary = pd.DataFrame({"p50": ms.quantile(0.50), "p95": ms.quantile(0.95), "max": ms.max()})
+    print(f"\n--- FRAME PROFILE: {len(timings)} frames (ms) ---")
+    print(summary.round(1).to_string())
+    slowest = timings.nlargest(PROFILE_SLOWEST, "total").set_index("frame")
+    print(f"\n--- {len(slowest)} SLOWEST FRAMES (ms) ---")
+    print((slowest * 1000).round(1).to_string())
+
+def render_frames(start, stop, output_path=None, label="", profile_path=None):
+    """Render every RENDER_STEP-th frame of [start, stop) as PNGs into frame_dir, or into output_path through FFmpeg."""
+    encoder = None
+    if RENDER_OUTPUT == "ffmpeg":
+        width, height = fig.canvas.get_width_height(physical=True)
+        encoder = open_ffmpeg_pipe(output_path, width, height)
+    
+    frames = range(start, stop, RENDER_STEP)
+    layer = None
+    if RENDER_BLIT:
+        layer = build_static_layer(*find_touched_artists(probe_frames(start, stop, RENDER_STEP)), start)
+    
+    try:
+        for n, i in enumerate(frames):
+            profile_frame(i)
+            update(i)
+            
+            if layer is not None:
+                missed, moved = layer_misses(layer)
+                if missed or moved:
+                    # Touched on a frame the probe skipped: animate it from here on
+                    layer = build_static_layer(layer["touched"] | missed, layer["moving_axes"] | moved, i)
+                draw_blit_frame(layer, i)
+            elif encoder is not None:
+                fig.canvas.draw()
+            profile_phase("draw")
+            
+            if encoder is not None:
+                encoder.stdin.write(fig.canvas.buffer_rgba())
+            elif layer is not None:
+                file_path = os.path.join(frame_dir, f"frame_{i:05d}.png")
+                Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).save(file_path)
+            else:
+                # Save each frame as a numbered PNG
+                # Transparent=False ensures the black background stays solid black
+                file_path = os.path.join(frame_dir, f"frame_{i:05d}.png")
+                fig.savefig(file_path, dpi=RENDER_DPI, facecolor='black', transparent=False)
+            profile_phase("encode")
+            profile_frame_done()
+            
+            if n % 30 == 0:
+                done = (n / len(frames)) * 100
+                print(f"{label}Rendered: {n}/{len(frames)} ({done:.1f}%)")
+    finally:
+        if encoder is not None:
+            encoder.stdin.close()
+            encoder.wait()
+    
+    if encoder is not None and encoder.returncode != 0:
+        raise RuntimeError(f"FFmpeg exited with code {encoder.returncode} while writing {output_path}")
+    if RENDER_PROFILE and profile_path is not None:
+        save_profile(profile_path)
 
-print(f"\n✔️ DONE! All frames are in the '{frame_dir}' folder.")
+# =============================
+# CHECKPOINTED RENDER
+# =============================
+# The render is cut into segments of RENDER_SEGMENT_FRAMES rendered frames. Each one is encoded to
+# its own file in segment_dir (PNG mode: its frames go to frame_dir) and the files are joined at the
+# end. Finished segments are recorded in the checkpoint together with the render settings, so a
+# restarted render skips them and redoes at most the segment that was interrupted. Frames do not
+# depend on earlier frames (see FRAME STATE COMPILER), so no animation state has to be saved.
+RENDER_SEGMENT_FRAMES = 900   # 30 s of video
+CHECKPOINT_PATH = os.path.join(segment_dir, "checkpoint.json")
+
+def render_settings():
+    """Everything a finished segment depends on; any change invalidates the checkpoint."""
+    return {
+        "dpi": RENDER_DPI, "start": RENDER_START, "stop": RENDER_STOP, "step": RENDER_STEP,
+        "segment_frames": RENDER_SEGMENT_FRAMES, "output": RENDER_OUTPUT,
+        "encoder": [FFMPEG_CODEC, FFMPEG_BITRATE, FFMPEG_PIX_FMT, *FFMPEG_EXTRA_ARGS],
+        "frame_state": os.path.getmtime(FRAME_STATE_PATH),
+    }
+
+def split_segments(start, stop, step=1):
+    """(segment_idx, start, stop) ranges of RENDER_SEGMENT_FRAMES rendered frames covering [start, stop)."""
+    span = RENDER_SEGMENT_FRAMES * step
+    return [(k, a, min(a + span, stop)) for k, a in enumerate(range(start, stop, span))]
+
+def segment_path(segment_idx):
+    return os.path.join(segment_dir, f"segment_{segment_idx:04d}.mp4")
+
+def segment_profile_path(segment_idx):
+    return os.path.join(segment_dir, f"profile_{segment_idx:04d}.csv")
+
+def load_checkpoint():
+    """Indices of the segments finished by an earlier run with the same settings."""
+    if not os.path.exists(CHECKPOINT_PATH):
+        return set()
+    with open(CHECKPOINT_PATH) as f:
+        checkpoint = json.load(f)
+    if checkpoint["settings"] != render_settings():
+        print("⚠ Render settings changed since the checkpoint, starting over")
+        return set()
+    done = set(checkpoint["done"])
+    if RENDER_OUTPUT == "ffmpeg":
+        done = {k for k in done if os.path.exists(segment_path(k))}
+    return done
+
+def save_checkpoint(done):
+    tmp_path = CHECKPOINT_PATH + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"settings": render_settings(), "done": sorted(done)}, f, indent=2)
+    os.replace(tmp_path, CHECKPOINT_PATH)
+
+def render_segment(segment):
+    """Worker entry point: render one segment. Its video only gets its final name once complete."""
+    segment_idx, start, stop = segment
+    output_path = segment_path(segment_idx)
+    part_path = output_path.replace(".mp4", ".part.mp4")
+    render_frames(start, stop, part_path, label=f"[segment {segment_idx}] ",
+                  profile_path=segment_profile_path(segment_idx))
+    if RENDER_OUTPUT == "ffmpeg":
+        os.replace(part_path, output_path)
+    return segment_idx
+
+def video_frame_count(path):
+    """Frames in the first video stream of path (ffprobe packet count, nothing is decoded)."""
+    probe = subprocess.run([FFPROBE_BIN, "-v", "error", "-select_streams", "v:0", "-count_packets",
+                            "-show_entries", "stream=nb_read_packets", "-of", "csv=p=0", path],
+                           capture_output=True, text=True, check=True)
+    return int(probe.stdout.strip())
+
+def concat_segments(segments, output_path):
+    """Join independently encoded segments with the concat demuxer (stream copy, no re-encode).
+
+    The result is not identical to one serial encode: every segment starts its own GOP (a keyframe)
+    and its own rate control, so bits are spent differently around each boundary. What is checked
+    is that no frame is lost or duplicated: each segment and the joined file hold exactly the frames
+    they should, counted with ffprobe.
+    """
+    expected = {k: len(range(start, stop, RENDER_STEP)) for k, start, stop in segments}
+    for k, n in expected.items():
+        found = video_frame_count(segment_path(k))
+        if found != n:
+            raise RuntimeError(f"{segment_path(k)} holds {found} frames, expected {n}")
+    
+    list_path = os.path.join(segment_dir, "segments.txt")
+    with open(list_path, "w") as f:
+        for k, _, _ in segments:
+            f.write(f"file '{os.path.abspath(segment_path(k))}'\n")
+    subprocess.run([FFMPEG_BIN, "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                    "-i", list_path, "-c", "copy", output_path], check=True)
+    
+    found = video_frame_count(output_path)
+    if found != sum(expected.values()):
+        raise RuntimeError(f"{output_path} holds {found} frames, expected {sum(expected.values())}")
+
+if __name__ == "__main__":
+    n_render = len(range(RENDER_START, RENDER_STOP, RENDER_STEP))
+    if PREVIEW_MODE:
+        print(f"--- PREVIEW: {RENDER_DPI} DPI, every {RENDER_STEP} frames of [{RENDER_START}, {RENDER_STOP}) ---")
+    if RENDER_OUTPUT == "ffmpeg":
+        print(f"--- ENCODING {n_render} FRAMES → {OUTPUT_VIDEO} ---")
+    else:
+        # Create a folder for the frames
+        os.makedirs(frame_dir, exist_ok=True)
+        print(f"--- SAVING {n_render} MASTER PNG FRAMES ---")
+    
+    os.makedirs(segment_dir, exist_ok=True)
+    segments = split_segments(RENDER_START, RENDER_STOP, RENDER_STEP)
+    done = load_checkpoint()
+    pending = [segment for segment in segments if segment[0] not in done]
+    if done:
+        print(f"--- RESUMING: {len(done)}/{len(segments)} SEGMENTS ALREADY RENDERED ---")
+    
+    try:
+        if RENDER_WORKERS > 1:
+            print(f"--- {len(pending)} SEGMENTS ACROSS {RENDER_WORKERS} WORKERS ---")
+            with ProcessPoolExecutor(max_workers=RENDER_WORKERS) as pool:
+                for future in as_completed([pool.submit(render_segment, segment) for segment in pending]):
+                    done.add(future.result())
+                    save_checkpoint(done)
+        else:
+            for segment in pending:
+                done.add(render_segment(segment))
+                save_checkpoint(done)
+        
+        if RENDER_OUTPUT == "ffmpeg":
+            concat_segments(segments, OUTPUT_VIDEO)
+            print(f"\n✔️ DONE! Video written to '{OUTPUT_VIDEO}'.")
+        else:
+            print(f"\n✔️ DONE! All frames are in the '{frame_dir}' folder.")
+    
+    except Exception as e:
+        print(f"Error: {e}")
+        print(f"Progress is kept in {CHECKPOINT_PATH}; run again to resume.")
+        raise
+    
+    # The render is complete here; a profiler failure must not look like an interrupted render.
+    # Only segments rendered by this run are timed: resumed ones keep a profile from an older run.
+    if RENDER_PROFILE:
+        profile_paths = [segment_profile_path(k) for k, _, _ in pending]
+        tables = [pd.read_csv(p) for p in profile_paths if os.path.exists(p)]
+        if tables:
+            timings = pd.concat(tables, ignore_index=True)
+            timings.to_csv(PROFILE_LOG, index=False)
+            report_profile(timings)
+            print(f"✔ Frame timings saved to: {PROFILE_LOG}")
+        else:
+            print("⚠ No frames were rendered by this run, no frame profile")
 
-# ffmpeg -framerate 30 -i render_frames_all/frame_%05d.png -c:v h264_amf -pix_fmt yuv420p -usage lowlatency -rc cbr -b:v 50M -maxrate 50M -bufsize 20M -quality quality -tag:v avc1 F1_4K_MASTER_FINAL.mp4
\ No newline at end of file
+# PNG mode: ffmpeg -framerate 30 -i render_frames_all/frame_%05d.png -c:v h264_amf -pix_fmt yuv420p -usage lowlatency -rc cbr -b:v 50M -maxrate 50M -bufsize 20M -quality quality -tag:v avc1 F1_4K_MASTER_FINAL.mp4
@@ -0,0 +1,93 @@
+import hashlib
+import os
+import numpy as np
+from PIL import Image, ImageDraw
+
+# =============================
+# ASSET CACHE
+# Logos, driver photos and cars as ready-to-draw RGBA arrays, one .npy per
+# (kind, size, source file hash). PIL decoding and LANCZOS resizing only run
+# on a cache miss; hits are memory-mapped, so render workers share the pages.
+# =============================
+ASSET_CACHE_DIR = "asset_cache"
+
+
+def file_digest(path):
+    """Content hash of a source image ("missing" when there is no file)."""
+    if not path or not os.path.isfile(path):
+        return "missing"
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:16]
+
+
+def cached_asset(kind, path, size, build):
+    """RGBA array of build(path, size), read from the cache after the first run."""
+    cache_file = os.path.join(ASSET_CACHE_DIR, f"{kind}_{size}_{file_digest(path)}.npy")
+    if os.path.exists(cache_file):
+        return np.load(cache_file, mmap_mode="r")
+
+    rgba = np.asarray(build(path, size).convert("RGBA"))
+    os.makedirs(ASSET_CACHE_DIR, exist_ok=True)
+    tmp_file = f"{cache_file}.{os.getpid()}.tmp"
+    with open(tmp_file, "wb") as f:
+        np.save(f, rgba)
+    os.replace(tmp_file, cache_file)  # parallel workers may race on a miss
+    return rgba
+
+
+# =============================
+# BUILDERS (cache misses only)
+# =============================
+def build_circular_logo(path, size):
+    try:
+        img = Image.open(path).convert("RGBA")
+        img = img.resize((size, size), Image.Resampling.LANCZOS)
+        mask = Image.new('L', (size, size), 0)
+        draw = ImageDraw.Draw(mask)
+        draw.ellipse((0, 0, size, size), fill=255)
+        output = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+        output.paste(img, (0, 0))
+        output.putalpha(mask)
+        return output
+    except:
+        blank = Image.new('RGBA', (size, size), (255, 255, 255, 50))
+        mask = Image.new('L', (size, size), 0)
+        draw = ImageDraw.Draw(mask)
+        draw.ellipse((0, 0, size, size), fill=255)
+        blank.putalpha(mask)
+        return blank
+
+
+def build_car_image(path, size):
+    try:
+        img = Image.open(path).convert("RGBA")
+        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        return img
+    except:
+        return Image.new('RGBA', (size, int(size/2)), (255, 255, 255, 200))
+
+
+def build_driver_photo(path, size):
+    """Driver photo or a team color placeholder"""
+    try:
+        img = Image.open(path).convert("RGBA")
+        img.thumbnail((size, size), Image.Resampling.LANCZOS)
+        return img
+    except:
+        # Create simple placeholder
+        return Image.new('RGBA', (size, size), (100, 100, 100, 255))
+
+
+# =============================
+# LOADERS
+# =============================
+def create_circular_logo(path, size=200):
+    return cached_asset("logo_circle", path, size, build_circular_logo)
+
+
+def load_car_image(path, size=200):
+    return cached_asset("car", path, size, build_car_image)
+
+
+def load_driver_photo(path, size=200):
+    return cached_asset("photo", path, size, build_driver_photo)
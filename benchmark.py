@@ -0,0 +1,201 @@
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# =============================
+# BENCHMARK SUITE
+# Runs the pipeline stages on the repo's own inputs inside a scratch copy
+# (tracked outputs are never overwritten), records wall time and peak memory
+# per stage, appends the run to BENCH_HISTORY and flags every stage that got
+# more than REGRESSION_THRESHOLD slower than the last run that had it.
+# Inputs are pinned: the scratch copy leaves out every generated output, the
+# stages upstream of a selected stage run first (untimed) to rebuild them on
+# BENCH_SEASON, and a run is only compared with runs on the same BENCH_INPUTS.
+#   python benchmark.py            all stages
+#   python benchmark.py 07 10      only stages whose name starts with 07 / 10
+# Exits with code 1 when a regression is flagged.
+# =============================
+BENCH_HISTORY = "benchmark_history.json"   # machine specific, not tracked
+REGRESSION_THRESHOLD = 0.15        # 15% slower than the reference run
+REGRESSION_MIN_SECONDS = 0.1       # ...and by at least this much (timer noise on tiny stages)
+
+# 10_final_rendering.py: frames rendered through render_frames (PNG mode)
+RENDER_BENCH_START = 5000
+RENDER_BENCH_FRAMES = 30
+RENDER_BENCH_DPI = 240
+
+# (name, script) in pipeline order: 07 reads 04's output, 08 and 10 read 07's
+STAGES = [
+    ("04_simulation", "04_race_analysis.py"),
+    ("05_waypoints", "05_waypoints_analysis.py"),
+    ("07_interpolation", "07_race_time_analysis.py"),
+    ("08_drs_detection", "08_drs_analysis.py"),
+    ("10_render", "10_final_rendering.py"),
+]
+
+# Files every stage's output derives from (hashed into each run's "inputs")
+BENCH_SEASON = 2025
+BENCH_INPUTS = ["seasons", "final_centerline.png", "track_waypoints.csv", "drs_eligibility_logfixed.csv",
+                "logos", "cars", "driver"]
+
+# Generated outputs are left out of the scratch copy, so stages never start from a previous run's
+SCRATCH_IGNORE = shutil.ignore_patterns(
+    ".git", "__pycache__", "render_*", "*.mp4", BENCH_HISTORY, "season_runs", "asset_cache",
+    "f1_race.csv", "f1_race_state.npz", "race_time_interpolated*", "drs_eligibility_log.csv",
+    "frame_state*.npz", "monte_carlo.npz", "championship_probabilities.csv")
+
+# Run state the incremental stages (04, 07, 08) resume from. Removed before every stage so
+# each one times a full recompute, not a resume from the previous run.
+INCREMENTAL_STATE = ["output/f1_race_state.npz", "race_time_interpolated/round_km.npy",
+                     "race_time_interpolated/changed_from.json"]
+
+
+# =============================
+# STAGE RUNNER (child process)
+# =============================
+def peak_memory_mb():
+    """Peak resident memory of this process (None where the resource module is missing)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+def run_stage(script):
+    """Run one script as __main__; 10_final_rendering.py renders RENDER_BENCH_FRAMES frames instead."""
+    import runpy
+    for path in INCREMENTAL_STATE:
+        if os.path.exists(path):
+            os.remove(path)
+    start = time.perf_counter()
+    if script != "10_final_rendering.py":
+        runpy.run_path(script, run_name="__main__")
+        result = {"seconds": time.perf_counter() - start}
+    else:
+        ns = runpy.run_path(script, run_name="benchmark")
+        ns = ns["render_frames"].__globals__   # run_path returns a copy of the module globals
+        setup = time.perf_counter() - start
+        ns["RENDER_DPI"] = RENDER_BENCH_DPI
+        ns["fig"].set_dpi(RENDER_BENCH_DPI)
+        ns["RENDER_OUTPUT"] = "png"
+        ns["frame_dir"] = "bench_frames"
+        os.makedirs("bench_frames", exist_ok=True)
+        start = time.perf_counter()
+        ns["render_frames"](RENDER_BENCH_START, RENDER_BENCH_START + RENDER_BENCH_FRAMES)
+        seconds = time.perf_counter() - start
+        result = {"seconds": seconds, "setup_seconds": setup, "fps": RENDER_BENCH_FRAMES / seconds}
+    result["peak_mb"] = peak_memory_mb()
+    print("BENCH_RESULT " + json.dumps(result))
+
+
+# =============================
+# SUITE (parent process)
+# =============================
+def git_revision():
+    try:
+        rev = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True)
+        dirty = subprocess.run(["git", "status", "--porcelain", "--untracked-files=no"], capture_output=True, text=True)
+        return rev.stdout.strip() + ("+dirty" if dirty.stdout.strip() else "")
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def input_fingerprint():
+    """Short hash of the BENCH_INPUTS files (names and contents)."""
+    digest = hashlib.sha1(str(BENCH_SEASON).encode())
+    for root in BENCH_INPUTS:
+        paths = [root] if os.path.isfile(root) else sorted(
+            os.path.join(d, f) for d, _, files in os.walk(root) for f in files)
+        for path in paths:
+            digest.update(path.encode())
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+
+def bench_stage(script, scratch):
+    """Run a stage in a fresh interpreter inside scratch; returns its result dict."""
+    env = dict(os.environ, MPLBACKEND="Agg",   # plt.show() returns immediately
+               F1_SEASON=str(BENCH_SEASON))
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--stage", script],
+                          cwd=scratch, env=env, capture_output=True, text=True)
+    for line in proc.stdout.splitlines():
+        if line.startswith("BENCH_RESULT "):
+            return json.loads(line[len("BENCH_RESULT "):])
+    error = (proc.stderr.strip().splitlines() or ["no output"])[-1]
+    return {"error": error}
+
+
+def load_history():
+    if not os.path.exists(BENCH_HISTORY):
+        return []
+    with open(BENCH_HISTORY) as f:
+        return json.load(f)
+
+
+def reference_seconds(history, name, inputs):
+    """Seconds of the most recent earlier run on the same inputs in which the stage succeeded."""
+    for run in reversed(history):
+        if run.get("inputs") != inputs:
+            continue
+        stage = run["stages"].get(name, {})
+        if "seconds" in stage:
+            return stage["seconds"]
+    return None
+
+
+def run_suite(selected):
+    timed = [name for name, _ in STAGES if not selected or any(name.startswith(s) for s in selected)]
+    stages = STAGES[:max(i for i, (name, _) in enumerate(STAGES) if name in timed) + 1] if timed else []
+    history = load_history()
+    run = {"time": time.strftime("%Y-%m-%d %H:%M:%S"), "revision": git_revision(),
+           "inputs": input_fingerprint(), "threshold": REGRESSION_THRESHOLD, "stages": {}, "regressions": []}
+
+    with tempfile.TemporaryDirectory(prefix="f1_bench_") as tmp:
+        scratch = os.path.join(tmp, "repo")
+        shutil.copytree(os.getcwd(), scratch, ignore=SCRATCH_IGNORE)
+        for name, script in stages:
+            if name not in timed:
+                print(f"--- {name} ({script}, untimed: builds inputs) ---")
+                bench_stage(script, scratch)
+                continue
+            print(f"--- {name} ({script}) ---")
+            result = bench_stage(script, scratch)
+            run["stages"][name] = result
+            if "error" in result:
+                print(f"⚠ {name} failed: {result['error']}")
+                continue
+
+            ref = reference_seconds(history, name, run["inputs"])
+            if ref is not None:
+                result["vs_reference"] = result["seconds"] / ref
+                slower = result["seconds"] - ref
+                if slower > ref * REGRESSION_THRESHOLD and slower > REGRESSION_MIN_SECONDS:
+                    run["regressions"].append(name)
+            peak = f"{result['peak_mb']:.0f} MB" if result["peak_mb"] is not None else "n/a"
+            change = f" ({result['vs_reference'] - 1:+.1%} vs last)" if ref is not None else ""
+            print(f"✔ {result['seconds']:.2f}s, peak {peak}{change}")
+
+    history.append(run)
+    with open(BENCH_HISTORY, "w") as f:
+        json.dump(history, f, indent=2)
+
+    print(f"\n✔ Results appended to: {BENCH_HISTORY}")
+    if run["regressions"]:
+        print(f"⚠ REGRESSION (> {REGRESSION_THRESHOLD:.0%} slower): {', '.join(run['regressions'])}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--stage"]:
+        run_stage(sys.argv[2])
+    else:
+        sys.exit(run_suite(sys.argv[1:]))
@@ -0,0 +1,201 @@
+import os
+import runpy
+import time
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from race_engine import simulate_distances
+
+# =============================
+# MONTE CARLO SEASON SIMULATOR
+# Rounds up to MC_FROM_ROUND keep their real results. Every later round
+# is sampled: a finishing order is drawn from per-driver strengths
+# (Plackett-Luce, via Gumbel noise on log strength) and scored with the
+# points tables below. Each sampled season runs through the distance
+# engine from the real state after MC_FROM_ROUND.
+#
+# Samples run in chunks across a process pool, in sub-batches of
+# MC_BATCH. Each chunk only returns fixed-size counters: the final
+# running-order position per driver, and a gap-to-leader histogram per
+# round and driver. Memory stays bounded at any sample count, and the
+# quantiles are refreshed as chunks arrive.
+#
+# The base model (drivers, points, start distances, constants) comes from
+# 04_race_analysis.py. It is run once, in the parent; the pool hands the
+# result to every worker through its initializer, so workers never rerun 04.
+# =============================
+MC_SAMPLES = 1_000_000
+MC_FROM_ROUND = 18                  # real results up to and including this round
+MC_BATCH = 5000                     # seasons simulated per vectorized call
+MC_CHUNK = 100_000                  # seasons per worker task
+MC_WORKERS = os.cpu_count()
+MC_SEED = 2025
+MC_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+MC_GAP_MAX_KM = 10.0                # gap histogram range (larger gaps land in the last bin)
+MC_GAP_BINS = 2000                  # 5 m resolution
+
+MC_OUTPUT = "output/monte_carlo.npz"
+MC_PROBABILITIES_CSV = "output/championship_probabilities.csv"
+
+GP_POINTS = [25, 18, 15, 12, 10, 8, 6, 4, 2, 1]
+SPRINT_POINTS = [8, 7, 6, 5, 4, 3, 2, 1]
+
+# Per-driver strength (relative chance of finishing ahead). None: proportional to each driver's
+# points after MC_FROM_ROUND. Override with {driver: strength}.
+MC_STRENGTH = None
+MIN_STRENGTH = 0.5                  # floor so pointless drivers can still score
+
+MODEL_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "04_race_analysis.py")
+MODEL_CONSTANTS = ("ROUND_DISTANCE", "NORMALIZATION", "GAP_SCALE", "MIN_GAP_KM")
+
+# This process's copy of the base model: load_model() in the parent, init_worker() in workers
+model = {}
+
+
+# =============================
+# BASE MODEL
+# =============================
+def load_model():
+    """Run 04 once and keep what the simulator needs (plain arrays and numbers, cheap to pickle)."""
+    run = runpy.run_path(MODEL_SCRIPT, run_name="monte_carlo")
+    model.update({name: run[name] for name in MODEL_CONSTANTS})
+    model.update(drivers=run["names"], points=run["points"][:, :run["ROUNDS"]],
+                 distances=run["distances"], sprint_rounds=set(run["season"]["sprint_rounds"]))
+    return model
+
+
+def init_worker(state):
+    model.update(state)
+
+
+def driver_strengths(from_round=MC_FROM_ROUND, overrides=MC_STRENGTH):
+    strength = np.maximum(model["points"][:, from_round - 1].astype(float), MIN_STRENGTH)
+    for driver, value in (overrides or {}).items():
+        strength[model["drivers"].index(driver)] = value
+    return strength
+
+
+def round_scoring(from_round=MC_FROM_ROUND):
+    """Points by finishing position for every sampled round, [rounds, drivers]."""
+    n_drivers, n_rounds = model["points"].shape
+    table = np.zeros((n_rounds - from_round, n_drivers))
+    for k, rnd in enumerate(range(from_round + 1, n_rounds + 1)):
+        table[k, :len(GP_POINTS)] += GP_POINTS
+        if rnd in model["sprint_rounds"]:
+            table[k, :len(SPRINT_POINTS)] += SPRINT_POINTS
+    return table
+
+
+def sample_points(rng, n, strength, scoring, base):
+    """Cumulative points of n sampled seasons for the sampled rounds, [n, drivers, rounds]."""
+    n_rounds, n_drivers = scoring.shape
+    keys = np.log(strength) + rng.gumbel(size=(n, n_rounds, n_drivers))
+    finish = np.argsort(np.argsort(-keys, axis=-1), axis=-1)           # finishing position per driver
+    hauls = np.take_along_axis(np.broadcast_to(scoring, keys.shape), finish, axis=-1)
+    return base[:, None] + np.cumsum(hauls, axis=1).transpose(0, 2, 1)
+
+
+# =============================
+# WORKER
+# =============================
+def run_chunk(n_samples, seed, from_round=MC_FROM_ROUND):
+    """Counters of n_samples seasons: (position counts [driver, position], gap histogram)."""
+    rng = np.random.default_rng(seed)
+    strength, scoring = driver_strengths(from_round), round_scoring(from_round)
+    start, base = model["distances"][from_round], model["points"][:, from_round - 1]
+    n_drivers, n_rows = len(model["drivers"]), scoring.shape[0] + 1
+
+    positions = np.zeros((n_drivers, n_drivers), dtype=np.int64)
+    gap_hist = np.zeros((n_rows, n_drivers, MC_GAP_BINS), dtype=np.int64)
+    cell = np.arange(n_rows * n_drivers).reshape(n_rows, n_drivers) * MC_GAP_BINS
+
+    for done in range(0, n_samples, MC_BATCH):
+        n = min(MC_BATCH, n_samples - done)
+        points = sample_points(rng, n, strength, scoring, base)
+        dist = simulate_distances(points, start, model["ROUND_DISTANCE"], model["NORMALIZATION"],
+                                  model["GAP_SCALE"], model["MIN_GAP_KM"], first_round=from_round)
+
+        final_rank = np.argsort(np.argsort(-dist[:, -1], axis=-1, kind="stable"), axis=-1)
+        positions += np.bincount((np.arange(n_drivers) * n_drivers + final_rank).ravel(),
+                                 minlength=n_drivers * n_drivers).reshape(n_drivers, n_drivers)
+
+        gap = dist.max(axis=-1, keepdims=True) - dist
+        bins = np.minimum((gap / MC_GAP_MAX_KM * MC_GAP_BINS).astype(np.int64), MC_GAP_BINS - 1)
+        gap_hist += np.bincount((cell + bins).ravel(), minlength=gap_hist.size).reshape(gap_hist.shape)
+    return positions, gap_hist
+
+
+# =============================
+# AGGREGATION
+# =============================
+def histogram_quantiles(hist, quantiles=MC_QUANTILES):
+    """Quantiles (km) from gap histograms [..., bins], linear inside a bin -> [..., quantiles]."""
+    cdf = np.cumsum(hist, axis=-1)
+    total = cdf[..., -1:]
+    width = MC_GAP_MAX_KM / MC_GAP_BINS
+    out = np.empty(hist.shape[:-1] + (len(quantiles),))
+    for k, q in enumerate(quantiles):
+        target = q * total
+        idx = np.minimum((cdf < target).sum(axis=-1, keepdims=True), MC_GAP_BINS - 1)
+        below = np.take_along_axis(cdf, np.maximum(idx - 1, 0), axis=-1) * (idx > 0)
+        inside = np.maximum(np.take_along_axis(hist, idx, axis=-1), 1)
+        out[..., k] = ((idx + (target - below) / inside) * width)[..., 0]
+    return out
+
+
+def report(positions, gap_hist, samples):
+    probs = positions / samples
+    final_gap = histogram_quantiles(gap_hist[-1], (0.05, 0.5, 0.95))
+    order = np.argsort(-probs[:, 0], kind="stable")
+    print(f"\n--- {samples:,} seasons ---")
+    for i in order[:5]:
+        lo, mid, hi = final_gap[i]
+        print(f"  {model['drivers'][i]:<16} win {probs[i, 0]:6.1%}  podium {probs[i, :3].sum():6.1%}  "
+              f"final gap {mid:.3f} km [{lo:.3f}, {hi:.3f}]")
+
+
+def run_monte_carlo(n_samples=MC_SAMPLES, from_round=MC_FROM_ROUND, workers=MC_WORKERS, seed=MC_SEED):
+    if not model:
+        load_model()
+    chunks = [min(MC_CHUNK, n_samples - s) for s in range(0, n_samples, MC_CHUNK)]
+    seeds = np.random.SeedSequence(seed).spawn(len(chunks))
+
+    positions, gap_hist, samples = 0, 0, 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker, initargs=(model,)) as pool:
+        futures = {pool.submit(run_chunk, n, s, from_round): n for n, s in zip(chunks, seeds)}
+        for future in as_completed(futures):
+            chunk_positions, chunk_hist = future.result()
+            positions, gap_hist = positions + chunk_positions, gap_hist + chunk_hist
+            samples += futures[future]
+            report(positions, gap_hist, samples)
+    return positions, gap_hist, samples
+
+
+# =============================
+# MAIN
+# =============================
+if __name__ == "__main__":
+    t0 = time.perf_counter()
+    load_model()
+    positions, gap_hist, samples = run_monte_carlo()
+    drivers, n_rounds = model["drivers"], model["points"].shape[1]
+    print(f"\n✔ {samples:,} seasons in {time.perf_counter() - t0:.1f}s "
+          f"(rounds {MC_FROM_ROUND + 1}-{n_rounds} sampled)")
+
+    probs = positions / samples
+    rounds = np.arange(MC_FROM_ROUND, n_rounds + 1)
+    os.makedirs("output", exist_ok=True)
+    np.savez(MC_OUTPUT, drivers=np.array(drivers), rounds=rounds, position_probs=probs,
+             quantiles=np.array(MC_QUANTILES), gap_quantiles=histogram_quantiles(gap_hist))
+
+    table = pd.DataFrame({
+        "driver": drivers,
+        "p_win": probs[:, 0],
+        "p_podium": probs[:, :3].sum(axis=1),
+        "expected_position": probs @ np.arange(1, len(drivers) + 1),
+    }).sort_values("expected_position", ignore_index=True)
+    table.to_csv(MC_PROBABILITIES_CSV, index=False, float_format="%.5f")
+
+    print(f"✔ Distributions saved to: {MC_OUTPUT}")
+    print(f"✔ Probabilities saved to: {MC_PROBABILITIES_CSV}")
@@ -0,0 +1,64 @@
+import numpy as np
+
+# =============================
+# CHAMPIONSHIP -> DISTANCE ENGINE
+# Array form of the 04_race_analysis.py model. Points are a
+# [drivers, rounds] matrix of cumulative championship points; every round
+# is solved for all drivers at once:
+#   raw   = max(prev, unlocked - gap to the points leader)
+#   fixed = raw clamped to at least min_gap_km behind the car ahead
+# The clamp f[k] = min(raw[k], f[k-1] - g) over the running order is the
+# cumulative minimum of raw[k] + k*g, shifted back by k*g.
+# =============================
+
+
+def grid_distances(grid_index, n_drivers, grid_gap_km):
+    """Round-0 distances: grid slot i starts i * grid_gap_km behind pole."""
+    start = np.zeros(n_drivers)
+    start[np.asarray(grid_index)] = -np.arange(len(grid_index)) * grid_gap_km
+    return start
+
+
+def simulate_distances(points, start, round_distance, normalization, gap_scale, min_gap_km, first_round=0):
+    """Distance of every driver after each round, [..., rounds + 1, drivers] (row 0 is the grid).
+
+    points is [..., drivers, rounds]; leading axes are independent scenarios. start and the
+    model parameters are scalars or arrays that broadcast against those leading axes.
+    To resume mid-season, pass the distances after round first_round as start and only the
+    points columns of the rounds after it.
+    """
+    points = np.asarray(points)
+    *batch, n_drivers, n_rounds = points.shape
+    round_distance, normalization, gap_scale, min_gap_km = (
+        np.asarray(v, dtype=float)[..., None] for v in (round_distance, normalization, gap_scale, min_gap_km))
+    batch = np.broadcast_shapes(tuple(batch), round_distance.shape[:-1], normalization.shape[:-1],
+                                gap_scale.shape[:-1], min_gap_km.shape[:-1], np.shape(start)[:-1])
+    clamp = np.arange(n_drivers) * min_gap_km
+
+    distances = np.empty((*batch, n_rounds + 1, n_drivers))
+    distances[..., 0, :] = prev = np.broadcast_to(start, (*batch, n_drivers))
+    for r in range(n_rounds):
+        unlocked = (first_round + r + 1) * round_distance
+        pts = points[..., r]
+        gap = ((pts.max(axis=-1, keepdims=True) - pts) / normalization) * gap_scale
+        raw = np.maximum(prev, unlocked - gap)
+
+        # Running order (ties keep driver order), then the minimum-gap clamp
+        order = np.argsort(-raw, axis=-1, kind="stable")
+        ranked = np.take_along_axis(raw, order, axis=-1)
+        fixed = np.empty(raw.shape)
+        np.put_along_axis(fixed, order, np.minimum.accumulate(ranked + clamp, axis=-1) - clamp, axis=-1)
+        distances[..., r + 1, :] = prev = fixed
+    return distances
+
+
+def first_changed_round(points, prev_points):
+    """Earliest round (1-based) whose points differ from prev_points, or an added/removed round.
+
+    Returns rounds + 1 when nothing changed.
+    """
+    n = min(points.shape[-1], prev_points.shape[-1])
+    changed = np.nonzero((points[..., :n] != prev_points[..., :n]).reshape(-1, n).any(axis=0))[0]
+    if len(changed):
+        return int(changed[0]) + 1
+    return n + 1
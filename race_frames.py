@@ -0,0 +1,107 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+
+# =============================
+# RACE FRAMES (binary companion of race_time_interpolated.csv)
+# One .npy per array so everything can be memory-mapped:
+#   time_sec.npy     [n_frames]             float64
+#   driver.npy       [n_drivers]            str
+#   distance_km.npy  [n_frames, n_drivers]  float64
+#   round_km.npy     [n_rounds, n_drivers]  float64  (the output/f1_race.csv snapshots they came from)
+# A frame is a row slice of distance_km.
+# changed_from.json holds the first frame that differs from the previous
+# frames, for the stages downstream (08) that can resume from there.
+# =============================
+RACE_CSV = "race_time_interpolated.csv"
+RACE_FRAMES_DIR = "race_time_interpolated"
+DISTANCE_DTYPE = np.float64
+
+
+def frames_path(name, path=RACE_FRAMES_DIR):
+    return os.path.join(path, f"{name}.npy")
+
+
+def save_race_frames(time_sec, drivers, distance_km, round_km=None, path=RACE_FRAMES_DIR):
+    """Write the dense frame matrix next to the CSV."""
+    os.makedirs(path, exist_ok=True)
+    np.save(frames_path("time_sec", path), np.asarray(time_sec, dtype=np.float64))
+    np.save(frames_path("driver", path), np.asarray(drivers, dtype=str))
+    np.save(frames_path("distance_km", path), np.asarray(distance_km, dtype=DISTANCE_DTYPE))
+    if round_km is not None:
+        np.save(frames_path("round_km", path), np.asarray(round_km, dtype=np.float64))
+
+
+def load_round_snapshots(path=RACE_FRAMES_DIR):
+    """Round snapshots the current frames were built from (None if unknown)."""
+    round_file = frames_path("round_km", path)
+    return np.load(round_file) if os.path.exists(round_file) else None
+
+
+def mark_changed_from(frame, path=RACE_FRAMES_DIR):
+    """Record that frames from `frame` on changed (kept at the earliest until consumed)."""
+    pending = changed_from(path)
+    if pending is not None:
+        frame = min(frame, pending)
+    with open(os.path.join(path, "changed_from.json"), "w") as f:
+        json.dump({"frame": int(frame)}, f)
+
+
+def changed_from(path=RACE_FRAMES_DIR):
+    """First changed frame since the marker was last cleared (None: unknown, treat as 0)."""
+    marker = os.path.join(path, "changed_from.json")
+    if not os.path.exists(marker):
+        return None
+    with open(marker) as f:
+        return json.load(f)["frame"]
+
+
+def clear_changed_from(path=RACE_FRAMES_DIR):
+    marker = os.path.join(path, "changed_from.json")
+    if os.path.exists(marker):
+        os.remove(marker)
+
+
+def frames_from_table(table):
+    """Long (time_sec, driver, distance_km) rows -> (time_sec, drivers, distance_km)."""
+    wide = table.pivot(index="time_sec", columns="driver", values="distance_km")
+    return wide.index.to_numpy(), wide.columns.to_numpy(), wide.to_numpy()
+
+
+def frames_are_current(path=RACE_FRAMES_DIR, csv_path=RACE_CSV):
+    """True when the binary exists and is not older than the CSV."""
+    dist_file = frames_path("distance_km", path)
+    return os.path.exists(dist_file) and (
+        not os.path.exists(csv_path) or os.path.getmtime(dist_file) >= os.path.getmtime(csv_path)
+    )
+
+
+def load_race_frames(path=RACE_FRAMES_DIR, csv_path=RACE_CSV, mmap_mode="r"):
+    """(time_sec, drivers, distance_km), memory-mapped when the binary is up to date.
+
+    Falls back to parsing the CSV when the binary is missing or older.
+    """
+    if frames_are_current(path, csv_path):
+        return (
+            np.load(frames_path("time_sec", path), mmap_mode=mmap_mode),
+            np.load(frames_path("driver", path)).astype(object),
+            np.load(frames_path("distance_km", path), mmap_mode=mmap_mode),
+        )
+
+    print(f"⚠ {path} missing or stale, parsing {csv_path}")
+    return frames_from_table(pd.read_csv(csv_path))
+
+
+def splice_race_csv(table, keep_rows, csv_path=RACE_CSV):
+    """Keep the header and first keep_rows rows of the CSV, append table after them."""
+    with open(csv_path, "r+b") as f:
+        for _ in range(keep_rows + 1):
+            f.readline()
+        f.truncate(f.tell())
+    table.to_csv(csv_path, mode="a", header=False, index=False)
+
+
+def running_order(distance_km):
+    """Per-frame running order (driver columns, leader first), [n_frames, n_drivers]."""
+    return np.argsort(-np.asarray(distance_km), axis=1, kind="stable")
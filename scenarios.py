@@ -0,0 +1,87 @@
+import os
+import runpy
+import time
+import numpy as np
+from race_engine import simulate_distances
+
+# =============================
+# WHAT-IF SCENARIOS
+# Runs batches of variants of the 04_race_analysis.py model in one
+# vectorized call: alternative points tables ("what if round N had gone
+# differently") and/or overrides of the model constants. The base model
+# (drivers, grid, points, constants) is loaded from 04 itself, so
+# scenarios always start from the current season data.
+# =============================
+MODEL = runpy.run_path(os.path.join(os.path.dirname(os.path.abspath(__file__)), "04_race_analysis.py"),
+                       run_name="scenarios")
+
+DRIVERS = MODEL["names"]
+BASE_POINTS = MODEL["points"][:, :MODEL["ROUNDS"]]   # [drivers, rounds], cumulative
+OVERRIDES = ("GAP_SCALE", "NORMALIZATION", "MIN_GAP_KM", "LAPS")
+
+
+def round_points(points):
+    """Cumulative points -> points scored in each round, same shape."""
+    return np.diff(points, axis=-1, prepend=0)
+
+
+def replace_round(points, rnd, hauls):
+    """Copy of a cumulative points table with round rnd (1-based) rescored.
+
+    hauls maps driver name -> points scored in that round; drivers not listed keep theirs.
+    """
+    per_round = round_points(points).copy()
+    for driver, pts in hauls.items():
+        per_round[..., DRIVERS.index(driver), rnd - 1] = pts
+    return np.cumsum(per_round, axis=-1)
+
+
+def run_scenarios(points=None, **overrides):
+    """Distances for a batch of scenarios, [scenarios, rounds + 1, drivers] (row 0 is the grid).
+
+    points: [scenarios, drivers, rounds] cumulative points, default BASE_POINTS for all.
+    overrides: GAP_SCALE, NORMALIZATION, MIN_GAP_KM and/or LAPS, each a scalar or one value
+    per scenario. LAPS derives the round distance the way 04 does, and GAP_SCALE too unless
+    GAP_SCALE is given. The result is distances only; a scenario's round times follow from its
+    LAPS as 04's ROUND_TIME = FASTEST_LAP_SEC / (ROUNDS / LAPS).
+    """
+    unknown = set(overrides) - set(OVERRIDES)
+    if unknown:
+        raise ValueError(f"Unknown scenario overrides: {', '.join(sorted(unknown))}")
+
+    params = {name: overrides.get(name, MODEL[name]) for name in OVERRIDES}
+    round_distance = MODEL["ROUND_DISTANCE"]
+    if "LAPS" in overrides:
+        laps = np.asarray(params["LAPS"])
+        round_distance = MODEL["LAP_LENGTH_KM"] / (MODEL["ROUNDS"] / laps)
+        if "GAP_SCALE" not in overrides:
+            params["GAP_SCALE"] = MODEL["LAP_LENGTH_KM"] * (laps / 20)
+
+    points = BASE_POINTS if points is None else np.asarray(points)
+    if points.ndim == 2:
+        points = points[None]
+    return simulate_distances(points, MODEL["start"], round_distance,
+                              params["NORMALIZATION"], params["GAP_SCALE"], params["MIN_GAP_KM"])
+
+
+# =============================
+# EXAMPLE: GAP SCALE SWEEP + LAST ROUND REWRITES
+# =============================
+if __name__ == "__main__":
+    scales = np.linspace(0.5, 2.0, 5000) * MODEL["GAP_SCALE"]
+    t0 = time.perf_counter()
+    sweep = run_scenarios(GAP_SCALE=scales)
+    print(f"✔ {len(scales)} GAP_SCALE scenarios in {time.perf_counter() - t0:.2f}s → {sweep.shape}")
+
+    leader_gap = sweep[:, -1].max(axis=1, keepdims=True) - sweep[:, -1]
+    second = np.sort(leader_gap, axis=1)[:, 1]
+    print(f"  Final gap P1-P2: {second.min():.3f} km to {second.max():.3f} km")
+
+    # Each driver scores 25 more in the last round
+    last = round_points(BASE_POINTS)[:, -1]
+    variants = np.stack([replace_round(BASE_POINTS, BASE_POINTS.shape[1], {d: last[i] + 25})
+                         for i, d in enumerate(DRIVERS)])
+    final = run_scenarios(variants)[:, -1]
+    for driver, row in zip(DRIVERS, final):
+        position = int((row > row[DRIVERS.index(driver)]).sum()) + 1
+        print(f"  {driver:<16} +25 in round {BASE_POINTS.shape[1]} → finishes P{position}")
@@ -0,0 +1,100 @@
+import os
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from season_catalog import list_seasons, load_season
+
+# =============================
+# MULTI-SEASON BATCH RUNNER
+# Runs the pipeline once per season of the catalog (seasons/<year>.json),
+# each in its own working directory SEASON_RUNS_DIR/<year>/ so every
+# season gets its own output/f1_race.csv, race frames, DRS log and video.
+# The scripts pick the season up from the F1_SEASON environment variable.
+#   python season_batch.py                 simulate every season
+#   python season_batch.py 2024 2025       only these seasons
+#   python season_batch.py --render ...    also render each season's video
+# Simulations run in parallel, one season per worker. Renders run one season
+# at a time: 10_final_rendering.py already spreads a render over all cores.
+# =============================
+SEASON_RUNS_DIR = "season_runs"
+SEASON_WORKERS = os.cpu_count()
+
+SIMULATION_STAGES = ["04_race_analysis.py", "07_race_time_analysis.py", "08_drs_analysis.py"]
+RENDER_STAGES = ["10_final_rendering.py"]
+
+# Season independent inputs, linked into every season directory (plus the season's "drs_log")
+SHARED_INPUTS = ["track_waypoints.csv", "logos", "cars", "driver", "asset_cache"]
+
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+# =============================
+# ONE SEASON
+# =============================
+def season_dir(year):
+    work = os.path.join(REPO_DIR, SEASON_RUNS_DIR, str(year))
+    os.makedirs(os.path.join(work, "output"), exist_ok=True)
+    drs_log = load_season(year).get("drs_log")
+    for name in SHARED_INPUTS + ([drs_log] if drs_log else []):
+        src, dst = os.path.join(REPO_DIR, name), os.path.join(work, name)
+        if os.path.exists(src) and not os.path.lexists(dst):
+            os.symlink(src, dst)
+    return work
+
+
+def run_season(year, stages):
+    """Run stages in order for one season; returns (year, seconds, failed stage or None)."""
+    work = season_dir(year)
+    env = dict(os.environ, F1_SEASON=str(year), MPLBACKEND="Agg")   # plt.show() returns immediately
+    start = time.perf_counter()
+    with open(os.path.join(work, "season_batch.log"), "a") as log:
+        for script in stages:
+            log.write(f"\n===== {script} =====\n")
+            log.flush()
+            proc = subprocess.run([sys.executable, os.path.join(REPO_DIR, script)],
+                                  cwd=work, env=env, stdout=log, stderr=subprocess.STDOUT)
+            if proc.returncode != 0:
+                return year, time.perf_counter() - start, script
+    return year, time.perf_counter() - start, None
+
+
+# =============================
+# BATCH
+# =============================
+def report(year, seconds, failed):
+    if failed:
+        print(f"⚠ {year}: {failed} failed after {seconds:.1f}s, see {SEASON_RUNS_DIR}/{year}/season_batch.log")
+    else:
+        print(f"✔ {year}: {seconds:.1f}s → {SEASON_RUNS_DIR}/{year}/")
+
+
+def run_batch(seasons, render=False, workers=SEASON_WORKERS):
+    failed = set()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(run_season, year, SIMULATION_STAGES) for year in seasons]
+        for future in as_completed(futures):
+            year, seconds, stage = future.result()
+            report(year, seconds, stage)
+            if stage:
+                failed.add(year)
+
+    if render:
+        for year in seasons:
+            if year not in failed:
+                year, seconds, stage = run_season(year, RENDER_STAGES)
+                report(year, seconds, stage)
+                if stage:
+                    failed.add(year)
+    return failed
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    render = "--render" in args
+    seasons = [int(a) for a in args if a != "--render"] or list_seasons()
+
+    t0 = time.perf_counter()
+    failed = run_batch(seasons, render)
+    print(f"\n✔ {len(seasons) - len(failed)}/{len(seasons)} seasons in {time.perf_counter() - t0:.1f}s")
+    sys.exit(1 if failed else 0)
@@ -0,0 +1,93 @@
+import json
+import os
+import numpy as np
+
+# =============================
+# SEASON CATALOG
+# One JSON file per season, seasons/<year>.json:
+#   rounds, sprints               calendar size (points may stop mid-season)
+#   sprint_rounds                 rounds with a sprint weekend
+#   points_per_gp/_sprint         points handed out per GP / sprint
+#   grid      {driver: [previous season points, series]} in starting grid order
+#   points    {driver: [cumulative points after each round]}
+#   podiums   {round: [P1, P2, P3 surnames]}
+#   drs_log   hand-checked DRS log to render instead of 08's (optional)
+# Presentation, all optional (load_season fills in whatever is left out):
+#   teams             {driver: team}                        OTHER_TEAM
+#   team_colors       {team: colour}                        OTHER_COLOR
+#   driver_colors     {driver: colour}                      the team's colour
+#   name_codes        {driver: 3-letter code}               first 3 letters
+#   team_grid         {team: [points, wins, podiums]} of the previous season,
+#                     in standings order                    unlisted teams last, zeros
+#   featured          drivers on the racing strip cards     top FEATURED_DRIVERS on points
+#   gp_names          {round: title}                        no title
+#   team_adjustments  {round: {team: points}} while that round runs
+# Scripts load the season named by the F1_SEASON environment variable
+# (set by season_batch.py), DEFAULT_SEASON otherwise.
+# =============================
+SEASONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "seasons")
+DEFAULT_SEASON = 2025
+
+LAPS = 8                # every season is run as one race over this many laps
+
+OTHER_TEAM = "Other"
+OTHER_COLOR = "#888888"
+FEATURED_DRIVERS = 5
+
+
+def season_path(year):
+    return os.path.join(SEASONS_DIR, f"{year}.json")
+
+
+def list_seasons():
+    """Years available in the catalog, oldest first."""
+    return sorted(int(name[:-5]) for name in os.listdir(SEASONS_DIR)
+                  if name.endswith(".json") and name[:-5].isdigit())
+
+
+def current_season():
+    return int(os.environ.get("F1_SEASON", DEFAULT_SEASON))
+
+
+def load_season(year=None):
+    """Season record; points and grid entries are tuples, round keys are ints.
+
+    Every driver in points gets a team, colour and name code, every team a colour and
+    a team_grid entry, falling back as listed in the header above.
+    """
+    year = current_season() if year is None else year
+    with open(season_path(year)) as f:
+        season = json.load(f)
+    season["points"] = {d: tuple(p) for d, p in season["points"].items()}
+    season["grid"] = {d: tuple(g) for d, g in season["grid"].items()}
+    season["podiums"] = {int(r): podium for r, podium in season["podiums"].items()}
+    season["gp_names"] = {int(r): name for r, name in season.get("gp_names", {}).items()}
+    season["team_adjustments"] = {int(r): adj for r, adj in season.get("team_adjustments", {}).items()}
+
+    drivers = list(season["points"])
+    teams = {d: season.get("teams", {}).get(d, OTHER_TEAM) for d in drivers}
+    team_colors = {t: season.get("team_colors", {}).get(t, OTHER_COLOR) for t in teams.values()}
+    team_grid = {t: tuple(g) for t, g in season.get("team_grid", {}).items()}
+    season["teams"], season["team_colors"] = teams, team_colors
+    season["driver_colors"] = {d: season.get("driver_colors", {}).get(d, team_colors[teams[d]]) for d in drivers}
+    season["name_codes"] = {d: season.get("name_codes", {}).get(d, d[:3].upper()) for d in drivers}
+    season["team_grid"] = {**team_grid, **{t: (0, 0, 0) for t in team_colors if t not in team_grid}}
+    if "featured" not in season:
+        final = [p[-1] if p else 0 for p in season["points"].values()]
+        order = sorted(range(len(drivers)), key=lambda i: -final[i])
+        season["featured"] = [drivers[i] for i in order[:FEATURED_DRIVERS]]
+    return season
+
+
+def points_table(season, drivers):
+    """Cumulative points of drivers as [drivers, rounds + 1]; column r is the total after round r.
+
+    Drivers without data have 0 points. When a season's points stop before its last
+    round, each driver's last total carries forward to the end of the calendar.
+    """
+    table = np.zeros((len(drivers), season["rounds"] + 1))
+    for i, d in enumerate(drivers):
+        pts = season["points"].get(d, ())[:season["rounds"]]
+        table[i, 1:len(pts) + 1] = pts
+        table[i, len(pts) + 1:] = pts[-1] if len(pts) else 0
+    return table
@@ -0,0 +1,30 @@
+import numpy as np
+
+from scenarios import MODEL, run_scenarios
+
+LAP_LENGTH_KM, ROUNDS = MODEL["LAP_LENGTH_KM"], MODEL["ROUNDS"]
+
+
+def test_base_scenario_matches_04():
+    np.testing.assert_array_equal(run_scenarios()[0], MODEL["distances"])
+
+
+def test_laps_override_stretches_the_race_over_those_laps():
+    laps = np.array([6, MODEL["LAPS"], 10])
+    batch = run_scenarios(LAPS=laps)
+
+    # The points leader is always on the unlocked distance: LAPS laps spread over the rounds
+    leader_km = batch[:, 1:].max(axis=-1)
+    np.testing.assert_allclose(leader_km, LAP_LENGTH_KM * laps[:, None] / ROUNDS * np.arange(1, ROUNDS + 1))
+    assert np.isclose(leader_km[-1, -1], 10 * LAP_LENGTH_KM)
+
+    # The model's own lap count is the base scenario, and batching doesn't change a scenario
+    np.testing.assert_array_equal(batch[1], MODEL["distances"])
+    np.testing.assert_array_equal(batch[2], run_scenarios(LAPS=10)[0])
+
+
+def test_laps_override_keeps_an_explicit_gap_scale():
+    stretched = run_scenarios(LAPS=10)[0]
+    fixed_gaps = run_scenarios(LAPS=10, GAP_SCALE=MODEL["GAP_SCALE"])[0]
+    np.testing.assert_allclose(fixed_gaps.max(axis=-1), stretched.max(axis=-1))
+    assert not np.allclose(fixed_gaps, stretched)
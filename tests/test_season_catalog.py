@@ -0,0 +1,61 @@
+import json
+import numpy as np
+import pytest
+
+import season_catalog
+from season_catalog import list_seasons, load_season, points_table
+
+
+@pytest.fixture
+def mid_season(tmp_path, monkeypatch):
+    """A 6-round season whose points stop after round 3, as the catalog allows."""
+    season = {
+        "season": 1999, "rounds": 6, "sprints": 0, "sprint_rounds": [],
+        "points_per_gp": 101, "points_per_sprint": 0,
+        "grid": {"Alpha": [10, "F1-98"], "Bravo": [5, "F1-98"]},
+        "points": {"Alpha": [25, 43, 58], "Bravo": [18, 43, 53]},
+        "podiums": {"1": ["ALPHA", "BRAVO"], "2": ["BRAVO", "ALPHA"], "3": ["ALPHA", "BRAVO"]},
+    }
+    (tmp_path / "1999.json").write_text(json.dumps(season))
+    monkeypatch.setattr(season_catalog, "SEASONS_DIR", str(tmp_path))
+    return load_season(1999)
+
+
+def test_load_season_converts_tables(mid_season):
+    assert list_seasons() == [1999]
+    assert mid_season["points"]["Alpha"] == (25, 43, 58)
+    assert mid_season["grid"]["Bravo"] == (5, "F1-98")
+    assert sorted(mid_season["podiums"]) == [1, 2, 3]
+
+
+def test_points_table_carries_short_seasons_to_the_last_round(mid_season):
+    table = points_table(mid_season, ["Bravo", "Alpha", "Charlie"])
+    assert table.shape == (3, mid_season["rounds"] + 1)
+    np.testing.assert_array_equal(table[0], [0, 18, 43, 53, 53, 53, 53])
+    np.testing.assert_array_equal(table[1], [0, 25, 43, 58, 58, 58, 58])
+    np.testing.assert_array_equal(table[2], 0)   # no data
+
+
+def test_points_table_matches_the_2025_catalog():
+    season = load_season(2025)
+    drivers = list(season["points"])
+    table = points_table(season, drivers)
+    np.testing.assert_array_equal(table[:, 1:], [season["points"][d] for d in drivers])
+
+
+def test_load_season_fills_in_missing_presentation(mid_season):
+    assert mid_season["teams"] == {"Alpha": season_catalog.OTHER_TEAM, "Bravo": season_catalog.OTHER_TEAM}
+    assert mid_season["team_colors"] == {season_catalog.OTHER_TEAM: season_catalog.OTHER_COLOR}
+    assert mid_season["driver_colors"]["Bravo"] == season_catalog.OTHER_COLOR
+    assert mid_season["name_codes"] == {"Alpha": "ALP", "Bravo": "BRA"}
+    assert mid_season["team_grid"] == {season_catalog.OTHER_TEAM: (0, 0, 0)}
+    assert mid_season["featured"] == ["Alpha", "Bravo"]
+    assert mid_season["gp_names"] == {} and mid_season["team_adjustments"] == {}
+
+
+def test_every_catalog_season_names_a_team_and_colour_per_driver():
+    for year in list_seasons():
+        season = load_season(year)
+        assert season_catalog.OTHER_TEAM not in season["team_colors"], year
+        assert set(season["grid"]) == set(season["points"]), year
+        assert sorted(season["gp_names"]) == list(range(1, season["rounds"] + 1)), year
@@ -0,0 +1,30 @@
+import os
+import subprocess
+import sys
+import numpy as np
+import pytest
+
+import season_batch
+from season_catalog import list_seasons, load_season
+
+# 10_final_rendering.py up to (not including) the render: figure, artists and frame state
+RENDER_SETUP = "import runpy, sys; sys.path.insert(0, sys.argv[1]); runpy.run_path(sys.argv[2], run_name='setup')"
+
+
+@pytest.mark.parametrize("year", [year for year in list_seasons() if year != 2025])
+def test_simulation_and_render_setup_run_on_other_seasons(year, tmp_path, monkeypatch):
+    monkeypatch.setattr(season_batch, "SEASON_RUNS_DIR", str(tmp_path))
+    _, _, failed = season_batch.run_season(year, season_batch.SIMULATION_STAGES)
+    work = tmp_path / str(year)
+    assert failed is None, (work / "season_batch.log").read_text()
+
+    env = dict(os.environ, F1_SEASON=str(year), MPLBACKEND="Agg")
+    script = os.path.join(season_batch.REPO_DIR, "10_final_rendering.py")
+    proc = subprocess.run([sys.executable, "-c", RENDER_SETUP, season_batch.REPO_DIR, script],
+                          cwd=work, env=env, capture_output=True, text=True)
+    assert proc.returncode == 0, proc.stderr
+
+    season = load_season(year)
+    state = np.load(work / f"frame_state_{year}.npz")
+    assert state["row_driver"].shape[1] == len(season["points"])
+    assert state["current_round"].max() > season["rounds"]
@@ -0,0 +1,34 @@
+import numpy as np
+
+import track_profile
+from track_profile import (LAP_LENGTH_M, lap1_interp, lapN_interp, lookup, race_time,
+                           speed_integral, time_between)
+
+
+def test_lookup_reads_table_points_and_unwraps_laps():
+    table = track_profile.LAPN_SPEED_TABLE
+    np.testing.assert_array_equal(lookup(table, [0.0, 1.0, 2.0]), table[:3])
+    np.testing.assert_allclose(lookup(table, LAP_LENGTH_M + 10.5),
+                               table[-1] + lookup(table, 10.5), rtol=1e-12)
+
+
+def test_speed_integral_matches_the_profile_antiderivative():
+    dist_m = np.array([0.0, 100.0, 2500.0, LAP_LENGTH_M])
+    np.testing.assert_allclose(speed_integral(dist_m, 1),
+                               [lap1_interp.integrate(0, d) for d in dist_m], rtol=1e-9)
+    np.testing.assert_allclose(speed_integral(dist_m, 3),
+                               [lapN_interp.integrate(0, d) for d in dist_m], rtol=1e-9)
+
+
+def test_race_time_is_finite_from_a_standing_start():
+    first_m = race_time(np.array([0.0, 1.0, 2.0]))
+    assert first_m[0] == 0
+    assert 0 < first_m[1] <= 3.6 / track_profile.MIN_SPEED_KMH
+    assert np.all(np.diff(race_time(np.linspace(0, 3 * LAP_LENGTH_M, 50))) > 0)
+
+
+def test_time_between_uses_lap1_then_flying_laps():
+    lap1, flying = time_between(0.0, LAP_LENGTH_M), time_between(LAP_LENGTH_M, 2 * LAP_LENGTH_M)
+    np.testing.assert_allclose([lap1, flying], [track_profile.LAP1_TIME_TABLE[-1],
+                                                track_profile.LAPN_TIME_TABLE[-1]])
+    assert lap1 > flying
@@ -0,0 +1,164 @@
+import numpy as np
+from scipy.interpolate import PchipInterpolator
+
+# =============================
+# CONFIG
+# =============================
+LAP_LENGTH_M = 5183.7
+TABLE_STEP_M = 1.0   # lookup table resolution
+MIN_SPEED_KMH = 60.0  # floor for the time table (the lap 1 profile starts from 0 km/h)
+
+# =============================
+# SPEED PROFILES (Derived from Telemetry, Fastf1 & Tracinginsights)
+# Distance vs speed data
+
+# Zandvoort — 1st lap
+# 0m to 198m (0 to 222 km/h)
+# 198m to 342m (222 to 99 km/h)
+# 342m to 573m (99 to 237 km/h)
+# 573m to 679m (237 to 162 km/h)
+# 679m to 732m (162 to 177 km/h)
+# 732m to 819m (177 to 127 km/h)
+# 819m to 1145m (127 to 263 km/h)
+# 1145m to 1503m (263 to 280 km/h)
+
+# Zandvoort — Fastest lap
+# 0m to 122m (295 to 299 km/h)
+# 122m to 217m (299 to 295 km/h)
+# 217m to 373m (295 to 115 km/h)
+# 373m to 605m (115 to 240 km/h)
+# 605m to 704m (240 to 195 km/h)
+# 704m to 738m (195 to 203 km/h)
+# 738m to 834m (203 to 138 km/h)
+# 834m to 1195m (138 to 274 km/h)
+# 1195m to 1503m (274 to 280 km/h)
+
+# Yas Marina
+# 3090m to 3370m (280 to 301 km/h)
+# 3370m to 3520m (301 to 297 km/h)
+# 3520m to 3669m (297 to 167 km/h)
+# 3669m to 4053m (167 to 271 km/h)
+# 4053m to 4194m (271 to 270 km/h)
+# 4194m to 4324m (270 to 104 km/h)
+# 4324m to 4510m (104 to 164 km/h)
+# 4510m to 4558m (164 to 155 km/h)
+# 4558m to 4783m (155 to 270 km/h)
+# 4783m to 4896m (270 to 140 km/h)
+# 4896m to 5000m (140 to 167 km/h)
+
+# Miami
+# 3770m to 4688m (167 to 303 km/h)
+# 4688m to 4831m (303 to 70 km/h)
+# 4831m to 5412m (70 to 295 km/h)
+
+# Final F1 2025 circuit physics
+
+# Sector 1 (Zandvoort-style)
+# 0m to 122m (295 to 299 km/h)
+# 122m to 217m (299 to 295 km/h)
+# 217m to 373m (295 to 115 km/h)
+# 373m to 605m (115 to 240 km/h)
+# 605m to 704m (240 to 195 km/h)
+# 704m to 738m (195 to 203 km/h)
+# 738m to 834m (203 to 138 km/h)
+# 834m to 1195m (138 to 274 km/h)
+# 1195m to 1503m (274 to 280 km/h)
+
+# Transition
+# 1503m to 1580m (280 to 250 km/h)
+# 1580m to 1658m (250 to 280 km/h)
+
+# Sector 2 (Yas Marina-style)
+# 1658m to 1938m (280 to 301 km/h)
+# 1938m to 2088m (301 to 297 km/h)
+# 2088m to 2237m (297 to 167 km/h)
+# 2237m to 2621m (167 to 271 km/h)
+# 2621m to 2762m (271 to 270 km/h)
+# 2762m to 2892m (270 to 104 km/h)
+# 2892m to 3078m (104 to 164 km/h)
+# 3078m to 3126m (164 to 155 km/h)
+# 3126m to 3351m (155 to 270 km/h)
+# 3351m to 3438m (270 to 140 km/h)
+# 3438m to 3542m (140 to 167 km/h)
+
+# Sector 3 (Miami-style)
+# 3542m to 4460m (167 to 303 km/h)
+# 4460m to 4603m (303 to 70 km/h)
+# 4603m to 5183.7m (70 to 295 km/h)
+# =============================
+lap1_profile = np.array([
+    (0,0),(256,222),(403,99),(708,237),(808,162),(861,177),
+    (952,127),(1295,263),(1700,280),(2088,297),(2235,167),
+    (2568,268),(2740,267),(2848,104),(3000,164),(3100,154),
+    (3235,245),(3360,170),(4350,315),(4500,70),(5183.7,190)
+])
+
+lapN_profile = np.array([
+    (0,295),(297,288),(431,115),(740,240),(833,195),(877,303),
+    (964,138),(1322,270),(1700,280),(2088,297),(2235,167),
+    (2568,268),(2740,267),(2848,104),(3000,164),(3100,154),
+    (3235,245),(3360,170),(4350,315),(4500,70),(5183.7,190)
+])
+lap1_interp = PchipInterpolator(
+    lap1_profile[:, 0],
+    lap1_profile[:, 1]
+)
+
+lapN_interp = PchipInterpolator(
+    lapN_profile[:, 0],
+    lapN_profile[:, 1]
+)
+
+# =============================
+# LOOKUP TABLES
+# Cumulative integrals over one lap, sampled every TABLE_STEP_M:
+#   speed table -> integral of speed over distance (progress weighting)
+#   time table  -> seconds to cover the distance from the line
+# Any interval is then two reads and a subtraction.
+# =============================
+TABLE_M = np.append(np.arange(0, LAP_LENGTH_M, TABLE_STEP_M), LAP_LENGTH_M)
+
+
+def build_tables(interp):
+    speed_table = interp.antiderivative()(TABLE_M)
+
+    # Time per step from the speed at its midpoint (km/h -> m/s). The standing start is
+    # 0 km/h on the line, where 1/v blows up: below MIN_SPEED_KMH (the first ~34 m of lap 1)
+    # steps run at MIN_SPEED_KMH, which puts the car 70 m down the road after ~3.6 s.
+    mid_m = (TABLE_M[:-1] + TABLE_M[1:]) / 2
+    step_s = np.diff(TABLE_M) / (np.maximum(interp(mid_m), MIN_SPEED_KMH) / 3.6)
+    time_table = np.concatenate([[0.0], np.cumsum(step_s)])
+    return speed_table, time_table
+
+
+LAP1_SPEED_TABLE, LAP1_TIME_TABLE = build_tables(lap1_interp)
+LAPN_SPEED_TABLE, LAPN_TIME_TABLE = build_tables(lapN_interp)
+
+
+def lookup(table, dist_m):
+    """Read a cumulative table at dist_m; distances past the line add whole laps."""
+    laps, lap_m = np.divmod(np.asarray(dist_m, dtype=float), LAP_LENGTH_M)
+    i = np.minimum((lap_m // TABLE_STEP_M).astype(int), len(TABLE_M) - 2)
+    frac = (lap_m - TABLE_M[i]) / (TABLE_M[i + 1] - TABLE_M[i])
+    return laps * table[-1] + table[i] + frac * (table[i + 1] - table[i])
+
+
+def speed_integral(dist_m, lap):
+    """Integral of the lap profile's speed from 0 to dist_m (km/h * m)."""
+    return np.where(
+        np.asarray(lap) == 1,
+        lookup(LAP1_SPEED_TABLE, dist_m),
+        lookup(LAPN_SPEED_TABLE, dist_m)
+    )
+
+
+def race_time(dist_m):
+    """Seconds from the start to dist_m: lap 1 on the standing-start profile, then flying laps."""
+    dist_m = np.asarray(dist_m, dtype=float)
+    flying = lookup(LAPN_TIME_TABLE, dist_m - LAP_LENGTH_M) + LAP1_TIME_TABLE[-1]
+    return np.where(dist_m < LAP_LENGTH_M, lookup(LAP1_TIME_TABLE, dist_m), flying)
+
+
+def time_between(a_m, b_m):
+    """Seconds for a car to go from a_m to b_m (race distance in metres)."""
+    return race_time(b_m) - race_time(a_m)